@@ -2,7 +2,9 @@
 AI 뉴스 컨시어지 (브리핑) API 라우터
 """
 from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import Dict, Any
+import orjson
 
 from backend.api.dependencies import get_bigkinds_client
 from backend.services.news.briefing_service import BriefingService
@@ -10,7 +12,8 @@ from backend.api.clients.bigkinds.client import BigKindsClient
 
 router = APIRouter(
     prefix="/api/briefing",
-    tags=["AI Briefing"]
+    tags=["AI Briefing"],
+    default_response_class=ORJSONResponse  # 기사/네트워크 데이터가 큰 응답을 orjson으로 직렬화
 )
 
 # 서비스 인스턴스 생성 (의존성 주입)
@@ -35,6 +38,37 @@ async def get_briefing_for_question(
     except Exception as e:
         raise HTTPException(status_code=500, detail="브리핑 생성 중 오류 발생: {}".format(str(e)))
 
+@router.post("/question/stream")
+async def stream_briefing_for_question(
+    payload: Dict[str, Any] = Body(..., example={"question": "HBM 시장에서 삼성전자와 SK하이닉스의 경쟁력은?"}),
+    service: BriefingService = Depends(get_briefing_service)
+):
+    """
+    뉴스 브리핑을 SSE로 스트리밍합니다.
+    요약이 생성되는 즉시 status="streaming" 이벤트를, 완료 시 status="complete" 이벤트를 보냅니다.
+    """
+    question = payload.get("question")
+    if not question:
+        raise HTTPException(status_code=400, detail="'question' 필드는 필수입니다.")
+
+    async def stream_generator():
+        try:
+            async for data in service.stream_briefing_for_question(question):
+                yield b"data: " + orjson.dumps(data) + b"\n\n"
+        except Exception as e:
+            error_data = {"status": "error", "error": "브리핑 생성 중 오류 발생: {}".format(str(e))}
+            yield b"data: " + orjson.dumps(error_data) + b"\n\n"
+
+    return StreamingResponse(
+        stream_generator(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"  # Nginx 버퍼링 비활성화
+        }
+    )
+
 @router.post("/articles", response_model=Dict[str, Any])
 async def search_articles(
     payload: Dict[str, Any] = Body(..., example={
@@ -5,11 +5,14 @@
 """
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 import sys
+import asyncio
 import json
+import orjson
 
 # 프로젝트 루트 디렉토리 찾기
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
@@ -21,7 +24,8 @@ from backend.services.exchange_rate_service import exchange_rate_service
 from backend.services.dart_api_client import dart_api_client
 from backend.services.kis_api_client import kis_api_client
 from backend.services.upbit_api_client import upbit_api_client
-from backend.services.us_stock_api_client import us_stock_api_client
+from backend.services.us_stock_api_client import get_us_stock_client
+from backend.utils.memory_cache import MemoryCacheBackend
 
 # 로거 설정
 logger = setup_logger("api.stock_calendar")
@@ -29,6 +33,13 @@ logger = setup_logger("api.stock_calendar")
 # API 라우터 생성
 router = APIRouter(prefix="/api/stock-calendar", tags=["주식캘린더"])
 
+# 정적 경제 지표 캘린더 응답 캐시 (기간 → 직렬화된 JSON 바이트)
+ECONOMIC_CALENDAR_CACHE_TTL = 3600
+_economic_calendar_cache = MemoryCacheBackend(256)
+
+# 한 번의 용어 일괄 설명 요청에서 받을 수 있는 최대 용어 수
+MAX_TERMS_PER_REQUEST = 20
+
 # 이벤트 타입 정의
 EVENT_TYPES = ["earnings", "dividend", "holiday", "ipo", "economic", "split", "disclosure", "crypto"]
 
@@ -201,7 +212,7 @@ async def get_calendar_events(
         # 4. 미국 주식 이벤트 추가
         if include_earnings and (not market_type or market_type == "us"):
             try:
-                async with us_stock_api_client as us_client:
+                async with get_us_stock_client() as us_client:
                     # 미국 실적 발표 일정
                     us_earnings_events = await us_client.get_earnings_calendar(start, end)
                     
@@ -527,6 +538,57 @@ async def get_term_explanation(
         logger.error(f"AI 용어 설명 오류: {str(e)}")
         raise HTTPException(status_code=500, detail="AI 설명 중 오류가 발생했습니다.")
 
+@router.post("/ai-analysis/terms")
+async def get_term_explanations(
+    terms: List[str] = Query(..., description="설명할 금융 용어 목록"),
+    context: str = "",
+):
+    """여러 금융 용어에 대한 AI 설명을 한 번에 제공
+    
+    용어별 Perplexity 요청을 동시에 보내고, 입력 순서대로 설명 목록을 반환합니다.
+    """
+    terms = list(dict.fromkeys(term.strip() for term in terms if term.strip()))
+    if not terms:
+        raise HTTPException(status_code=400, detail="설명할 용어를 입력해주세요.")
+    if len(terms) > MAX_TERMS_PER_REQUEST:
+        raise HTTPException(
+            status_code=400, detail=f"용어는 한 번에 최대 {MAX_TERMS_PER_REQUEST}개까지 요청할 수 있습니다."
+        )
+    logger.info(f"AI 용어 일괄 설명 요청: {len(terms)}개")
+    
+    try:
+        explanations = await perplexity_client.explain_terms(terms, context)
+        return {"explanations": explanations}
+    except Exception as e:
+        logger.error(f"AI 용어 일괄 설명 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail="AI 설명 중 오류가 발생했습니다.")
+
+@router.post("/ai-analysis/term/stream")
+async def stream_term_explanation(
+    term: str,
+    context: str = "",
+):
+    """금융 용어에 대한 AI 설명을 SSE로 스트리밍
+    
+    설명 텍스트 조각을 생성되는 즉시 {"delta": ...} 이벤트로 보내고, 완료 시 {"done": true}를 보냅니다.
+    """
+    logger.info(f"AI 용어 설명 스트리밍 요청: {term}")
+    
+    async def generate():
+        try:
+            async for delta in perplexity_client.explain_financial_term_stream(term, context):
+                yield f"data: {json.dumps({'delta': delta}, ensure_ascii=False)}\n\n"
+            yield f"data: {json.dumps({'done': True})}\n\n"
+        except Exception as e:
+            logger.error(f"AI 용어 설명 스트리밍 오류: {str(e)}")
+            yield f"data: {json.dumps({'error': 'AI 설명 중 오류가 발생했습니다.'}, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/market-summary")
 async def get_market_summary():
     """오늘의 시장 요약 정보 제공
@@ -827,14 +889,15 @@ async def get_crypto_detail(symbol: str):
     
     try:
         async with upbit_api_client as upbit:
-            crypto_quote = await upbit.get_single_ticker(symbol.upper())
+            # 현재가와 일봉 데이터를 동시에 조회
+            crypto_quote, candle_data = await asyncio.gather(
+                upbit.get_single_ticker(symbol.upper()),
+                upbit.get_candles_daily(symbol.upper(), 7)
+            )
             
             if not crypto_quote:
                 raise HTTPException(status_code=404, detail="해당 가상화폐를 찾을 수 없습니다.")
             
-            # 일봉 데이터도 함께 조회
-            candle_data = await upbit.get_candles_daily(symbol.upper(), 7)
-            
             return {
                 "crypto": {
                     "symbol": crypto_quote.symbol,
@@ -983,7 +1046,7 @@ async def get_us_stock_quote(symbol: str):
     logger.info(f"미국 주식 현재가 조회: {symbol}")
     
     try:
-        async with us_stock_api_client as us_client:
+        async with get_us_stock_client() as us_client:
             quote = await us_client.get_stock_quote(symbol.upper())
             
             if not quote:
@@ -1024,7 +1087,7 @@ async def get_multiple_us_stock_quotes(
     logger.info(f"다중 미국 주식 현재가 조회: {symbol_list}")
     
     try:
-        async with us_stock_api_client as us_client:
+        async with get_us_stock_client() as us_client:
             quotes = await us_client.get_multiple_quotes(symbol_list)
             
             return {
@@ -1060,7 +1123,7 @@ async def get_us_earnings_calendar(
         if start > end:
             raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다.")
         
-        async with us_stock_api_client as us_client:
+        async with get_us_stock_client() as us_client:
             earnings_events = await us_client.get_earnings_calendar(start, end)
             
             return {
@@ -1101,7 +1164,7 @@ async def get_us_dividend_calendar(
         if start > end:
             raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다.")
         
-        async with us_stock_api_client as us_client:
+        async with get_us_stock_client() as us_client:
             dividend_events = await us_client.get_dividend_calendar(start, end)
             
             return {
@@ -1142,10 +1205,14 @@ async def get_us_economic_calendar(
         if start > end:
             raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다.")
         
-        async with us_stock_api_client as us_client:
-            economic_events = await us_client.get_economic_calendar(start, end)
+        # 같은 기간은 직렬화된 응답을 그대로 반환 (재직렬화 생략)
+        cache_key = f"{start.isoformat()}:{end.isoformat()}"
+        content = _economic_calendar_cache.get(cache_key)
+        if content is None:
+            async with get_us_stock_client() as us_client:
+                economic_events = await us_client.get_economic_calendar(start, end)
             
-            return {
+            content = orjson.dumps({
                 "economic_indicators": economic_events,
                 "meta": {
                     "total_count": len(economic_events),
@@ -1155,7 +1222,10 @@ async def get_us_economic_calendar(
                     },
                     "market": "US"
                 }
-            }
+            })
+            _economic_calendar_cache.set(cache_key, content, ECONOMIC_CALENDAR_CACHE_TTL)
+        
+        return Response(content=content, media_type="application/json")
             
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"날짜 형식 오류: {str(e)}")
@@ -1169,7 +1239,7 @@ async def get_us_market_status():
     logger.info("미국 시장 상태 조회")
     
     try:
-        async with us_stock_api_client as us_client:
+        async with get_us_stock_client() as us_client:
             market_status = await us_client.get_market_status()
             
             return {
@@ -1196,7 +1266,7 @@ async def get_major_us_stocks():
     ]
     
     try:
-        async with us_stock_api_client as us_client:
+        async with get_us_stock_client() as us_client:
             quotes = await us_client.get_multiple_quotes(major_symbols)
             
             # 섹터별로 그룹화
@@ -1296,7 +1366,7 @@ async def get_dashboard_summary():
         
         # 2. 미국 주식 주요 지수 현황
         try:
-            async with us_stock_api_client as us_client:
+            async with get_us_stock_client() as us_client:
                 major_indices = ["SPY", "QQQ", "DIA", "IWM"]  # S&P500, 나스닥, 다우, 러셀
                 us_quotes = await us_client.get_multiple_quotes(major_indices)
                 
@@ -1424,7 +1494,7 @@ async def get_realtime_market_status():
         
         # 1. 미국 시장 상태
         try:
-            async with us_stock_api_client as us_client:
+            async with get_us_stock_client() as us_client:
                 us_status = await us_client.get_market_status()
                 market_status["markets"]["us"] = us_status
         except Exception as e:
@@ -40,6 +40,10 @@ from backend.api.routes.proxy_routes import router as proxy_routes
 from backend.api.routes.entity_routes import router as entity_router
 from backend.api.routes.report_routes import router as report_router
 from backend.api.routes.period_report_routes import router as period_report_router
+from backend.services.perplexity_client import perplexity_client
+from backend.services.kis_api_client import kis_api_client
+from backend.services.upbit_api_client import UpbitAPIClient
+from backend.services.us_stock_api_client import USStockAPIClient
 # from backend.api.routes.ai_summary_routes import router as ai_summary_router
 # from backend.api.routes.watchlist_routes import router as watchlist_router
 
@@ -84,6 +88,14 @@ app.include_router(period_report_router)
 # app.include_router(ai_summary_router)
 # app.include_router(watchlist_router)
 
+@app.on_event("shutdown")
+async def close_http_sessions():
+    """공유 HTTP 세션 정리"""
+    await perplexity_client.close()
+    await kis_api_client.close()
+    await UpbitAPIClient.close()
+    await USStockAPIClient.close()
+
 # 예외 처리기
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
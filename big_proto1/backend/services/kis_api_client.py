@@ -7,10 +7,15 @@ import os
 import sys
 import asyncio
 import aiohttp
-import json
+import orjson
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
 
 # 프로젝트 루트 디렉토리 찾기
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -20,6 +25,114 @@ from backend.utils.logger import setup_logger
 
 logger = setup_logger("services.kis_api")
 
+# 토큰 만료 직전 요청 실패를 막기 위해 미리 갱신하는 여유 시간
+TOKEN_REFRESH_MARGIN = timedelta(seconds=60)
+
+# 모의투자 환경에서 'V'로 치환되는 TR_ID 접두사
+_VTS_TR_ID_PREFIXES = frozenset("TJC")
+
+
+def _to_vts_tr_id(tr_id: str) -> str:
+    """모의투자용 TR_ID 변환"""
+    return 'V' + tr_id[1:] if tr_id[0] in _VTS_TR_ID_PREFIXES else tr_id
+
+
+def _identity_tr_id(tr_id: str) -> str:
+    """실전투자용 TR_ID (변환 없음)"""
+    return tr_id
+
+# 대시보드 폴링 요청을 합치기 위한 응답 캐시 유효 시간(초)
+QUOTE_CACHE_TTL = 5
+INDEX_CACHE_TTL = 30
+
+# 느린 응답이 커넥션을 무한정 점유하지 않도록 하는 타임아웃/커넥션 한도
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5, connect=2, sock_read=3)
+CONNECTOR_LIMIT = 100
+CONNECTOR_LIMIT_PER_HOST = 32
+
+# 환경별 동시 요청 상한 (KIS 초당 요청 한도: 모의투자 서버는 초당 수 건, 실전은 초당 20건)
+MAX_CONCURRENT_REQUESTS = {"vts": 2, "prod": 20}
+
+# 실적발표 일정 대상 주요 기업 (종목코드, 종목명)
+MAJOR_COMPANIES = (
+    ("005930", "삼성전자"),
+    ("000660", "SK하이닉스"),
+    ("035420", "NAVER"),
+    ("005380", "현대자동차"),
+    ("006400", "삼성SDI"),
+    ("051910", "LG화학"),
+    ("068270", "셀트리온"),
+    ("035720", "카카오"),
+)
+
+# 분기별 실적발표 예상 시기 (분기, 월, 일, 연도 오프셋)
+EARNINGS_QUARTERS = (
+    ("Q1", 4, 15, 0),
+    ("Q2", 7, 15, 0),
+    ("Q3", 10, 15, 0),
+    ("Q4", 1, 30, 1),
+)
+
+# 현재가 API 응답 필드 → StockQuote 필드 매핑 (응답 키, 필드명, 변환 함수)
+_STOCK_FIELDS = (
+    ("stck_prpr", "current_price", int),
+    ("prdy_vrss", "change_price", int),
+    ("prdy_ctrt", "change_rate", float),
+    ("acml_vol", "volume", int),
+    ("hts_avls", "market_cap", int),
+)
+
+@dataclass(slots=True, frozen=True)
+class StockQuote:
+    """국내 주식 현재가 정보 (캐시된 값을 여러 호출자가 공유하므로 불변)"""
+    stock_code: str
+    current_price: int
+    change_price: float
+    change_rate: float
+    volume: int
+    market_cap: int
+    success: bool
+    message: str = ""
+
+@dataclass(slots=True, frozen=True)
+class IndexQuote:
+    """시장 지수 정보"""
+    current: float
+    change: float
+    change_rate: float
+
+# 목업 데이터 테이블 (호출마다 새로 만들지 않도록 모듈 로드 시 한 번만 생성)
+_MOCK_STOCK_PRICES = MappingProxyType({
+    "005930": 71000,   # 삼성전자
+    "000660": 89000,   # SK하이닉스
+    "035420": 180000,  # NAVER
+    "005380": 185000,  # 현대자동차
+})
+_MOCK_DEFAULT_PRICE = 50000
+
+_MOCK_INDICES = MappingProxyType({
+    "KOSPI": IndexQuote(current=2500.0, change=20.0, change_rate=0.8),
+    "KOSDAQ": IndexQuote(current=850.0, change=15.0, change_rate=1.8),
+})
+
+# 목업 휴장일 (월-일)
+_MOCK_HOLIDAY_DAYS = (
+    "01-01",  # 신정
+    "03-01",  # 3.1절
+    "05-05",  # 어린이날
+    "06-06",  # 현충일
+    "08-15",  # 광복절
+    "10-03",  # 개천절
+    "10-09",  # 한글날
+    "12-25",  # 크리스마스
+)
+
+
+@lru_cache(maxsize=4)
+def _build_mock_holidays(year: int) -> Tuple[str, ...]:
+    """연도별 목업 휴장일 생성 (연도 단위로 캐시)"""
+    return tuple(f"{year}-{day}" for day in _MOCK_HOLIDAY_DAYS)
+
 class KISAPIClient:
     """한국투자증권 Open API 클라이언트"""
     
@@ -33,6 +146,26 @@ class KISAPIClient:
         self.access_token = None
         self.token_expires_at = None
         self.token_file = PROJECT_ROOT / "kis_token.json"
+        self._token_lock = asyncio.Lock()
+        self.session: Optional[aiohttp.ClientSession] = None
+
+        # 요청마다 동일한 공통 헤더를 미리 만들어 재사용
+        self._header_template = {
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+            "custtype": "P",
+            "content-type": "application/json; charset=utf-8"
+        }
+        # env는 생성 후 바뀌지 않으므로 TR_ID 변환 함수를 한 번만 선택
+        self._map_tr_id = _to_vts_tr_id if self.env == "vts" else _identity_tr_id
+        # 여러 요청을 동시에 보낼 때 초당 요청 한도를 넘지 않도록 제한
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS.get(self.env, 2))
+
+        # 시세/지수 응답 TTL 캐시 (저장 시각, 응답)와 진행 중인 종목별 조회 (완료 시 제거)
+        self._quote_cache: Dict[str, Tuple[float, StockQuote]] = {}
+        self._quote_inflight: Dict[str, "asyncio.Future[StockQuote]"] = {}
+        self._index_cache: Optional[Tuple[float, Dict[str, IndexQuote]]] = None
+        self._index_lock = asyncio.Lock()
         
         if not self.app_key or not self.app_secret:
             logger.warning("KIS API 키가 설정되지 않았습니다.")
@@ -46,29 +179,65 @@ class KISAPIClient:
         """비동기 컨텍스트 매니저 종료"""
         pass
 
+    async def _init_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 초기화 (모든 요청이 하나의 커넥션 풀을 재사용)"""
+        if not self.session or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTOR_LIMIT,
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(timeout=REQUEST_TIMEOUT, connector=connector)
+        return self.session
+
+    async def close(self):
+        """HTTP 세션 종료"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+
     async def _load_token(self):
-        """저장된 토큰 로드"""
-        if self.token_file.exists():
-            try:
-                with open(self.token_file, 'r') as f:
-                    token_data = json.load(f)
-                    expires_at = datetime.fromisoformat(token_data['expires_at'])
-                    if expires_at > datetime.now():
-                        self.access_token = token_data['access_token']
-                        self.token_expires_at = expires_at
-                        logger.info("기존 토큰 로드 성공")
-            except Exception as e:
-                logger.error(f"토큰 로드 실패: {e}")
+        """저장된 토큰 로드 (파일 I/O는 스레드에서 실행)"""
+        try:
+            token_data = await asyncio.to_thread(self._read_token_sync)
+            if token_data:
+                expires_at = datetime.fromisoformat(token_data['expires_at'])
+                if expires_at > datetime.now():
+                    self.access_token = token_data['access_token']
+                    self.token_expires_at = expires_at
+                    logger.info("기존 토큰 로드 성공")
+        except Exception as e:
+            logger.error(f"토큰 로드 실패: {e}")
+
+    def _read_token_sync(self) -> Optional[Dict[str, str]]:
+        """토큰 파일 동기 읽기"""
+        if not self.token_file.exists():
+            return None
+        with open(self.token_file, 'rb') as f:
+            return orjson.loads(f.read())
 
     async def _save_token(self):
-        """토큰을 파일에 저장"""
+        """토큰을 파일에 저장 (이벤트 루프를 막지 않도록 스레드에서 실행)"""
         if self.access_token and self.token_expires_at:
             token_data = {
                 "access_token": self.access_token,
                 "expires_at": self.token_expires_at.isoformat()
             }
-            with open(self.token_file, 'w') as f:
-                json.dump(token_data, f)
+            await asyncio.to_thread(self._write_token_sync, token_data)
+
+    def _write_token_sync(self, token_data: Dict[str, str]):
+        """토큰 파일 동기 쓰기"""
+        with open(self.token_file, 'wb') as f:
+            f.write(orjson.dumps(token_data))
+
+    def _is_token_valid(self) -> bool:
+        """갱신 여유 시간을 고려한 토큰 유효성 검사"""
+        return bool(
+            self.access_token
+            and self.token_expires_at
+            and datetime.now() < self.token_expires_at - TOKEN_REFRESH_MARGIN
+        )
 
     async def get_access_token(self) -> Optional[str]:
         """액세스 토큰 발급 및 갱신"""
@@ -76,9 +245,18 @@ class KISAPIClient:
             logger.warning("KIS API 키가 없어 토큰 발급을 건너뜁니다.")
             return None
             
-        if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
+        # 빠른 경로: 유효한 토큰이 있으면 락 없이 반환
+        if self._is_token_valid():
             return self.access_token
-            
+
+        # 동시에 만료를 감지한 요청들이 한 번의 갱신으로 합쳐지도록 락으로 보호
+        async with self._token_lock:
+            if self._is_token_valid():
+                return self.access_token
+            return await self._request_access_token()
+
+    async def _request_access_token(self) -> Optional[str]:
+        """토큰 발급 API 호출"""
         url = f"{self.base_url}/oauth2/tokenP"
         data = {
             "grant_type": "client_credentials",
@@ -93,18 +271,21 @@ class KISAPIClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=data, headers=headers) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        self.access_token = result["access_token"]
-                        self.token_expires_at = datetime.now() + timedelta(seconds=result["expires_in"])
-                        await self._save_token()
-                        logger.info("토큰 발급 성공")
-                        return self.access_token
-                    else:
-                        logger.error(f"토큰 발급 실패: {response.status}")
-                        return None
+            session = await self._init_session()
+            async with session.post(url, json=data, headers=headers) as response:
+                if response.status == 200:
+                    result = await response.json(loads=orjson.loads)
+                    self.access_token = result["access_token"]
+                    self.token_expires_at = datetime.now() + timedelta(seconds=result["expires_in"])
+                    await self._save_token()
+                    logger.info("토큰 발급 성공")
+                    return self.access_token
+                else:
+                    logger.error(f"토큰 발급 실패: {response.status}")
+                    return None
+        except asyncio.TimeoutError:
+            logger.warning("토큰 발급 요청 시간 초과")
+            return None
         except Exception as e:
             logger.error(f"토큰 발급 중 오류: {e}")
             return None
@@ -115,24 +296,38 @@ class KISAPIClient:
         if not token:
             return {}
             
-        # 모의투자인 경우 TR_ID 변경
-        if self.env == "vts" and tr_id[0] in ('T', 'J', 'C'):
-            tr_id = 'V' + tr_id[1:]
-            
-        return {
-            "authorization": f"Bearer {token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P",
-            "content-type": "application/json; charset=utf-8"
-        }
+        headers = self._header_template.copy()
+        headers["authorization"] = f"Bearer {token}"
+        headers["tr_id"] = self._map_tr_id(tr_id)
+        return headers
 
-    async def get_stock_price(self, stock_code: str) -> Dict[str, Any]:
+    async def get_stock_price(self, stock_code: str) -> StockQuote:
         """주식 현재가 조회"""
         if not self.app_key:
             return self._get_mock_stock_price(stock_code)
-            
+
+        entry = self._quote_cache.get(stock_code)
+        if entry and time.monotonic() - entry[0] < QUOTE_CACHE_TTL:
+            return entry[1]
+
+        # 같은 종목에 대한 동시 요청은 하나의 API 호출로 합침
+        pending = self._quote_inflight.get(stock_code)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_and_cache_stock_price(stock_code))
+            self._quote_inflight[stock_code] = pending
+            pending.add_done_callback(lambda _: self._quote_inflight.pop(stock_code, None))
+        # 한 호출자가 취소되어도 공유 조회는 계속 진행
+        return await asyncio.shield(pending)
+
+    async def _fetch_and_cache_stock_price(self, stock_code: str) -> StockQuote:
+        """주식 현재가 조회 후 성공한 응답을 캐시에 저장"""
+        result = await self._fetch_stock_price(stock_code)
+        if result.success:
+            self._quote_cache[stock_code] = (time.monotonic(), result)
+        return result
+
+    async def _fetch_stock_price(self, stock_code: str) -> StockQuote:
+        """주식 현재가 API 호출"""
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
         headers = await self._get_headers("FHKST01010100")
         
@@ -142,30 +337,46 @@ class KISAPIClient:
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        output = data.get("output", {})
-                        return {
-                            "stock_code": stock_code,
-                            "current_price": int(output.get("stck_prpr", 0)),
-                            "change_price": int(output.get("prdy_vrss", 0)),
-                            "change_rate": float(output.get("prdy_ctrt", 0)),
-                            "volume": int(output.get("acml_vol", 0)),
-                            "market_cap": int(output.get("hts_avls", 0)),
-                            "success": True
-                        }
+            session = await self._init_session()
+            async with session.get(url, headers=headers, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(loads=orjson.loads)
+                    output = data.get("output", {})
+                    parsed = {
+                        field: caster(output.get(key, 0))
+                        for key, field, caster in _STOCK_FIELDS
+                    }
+                    return StockQuote(stock_code=stock_code, success=True, **parsed)
+        except asyncio.TimeoutError:
+            logger.warning(f"주식 현재가 조회 시간 초과: {stock_code}")
         except Exception as e:
             logger.error(f"주식 현재가 조회 실패: {e}")
             
         return self._get_mock_stock_price(stock_code)
 
-    async def get_major_indices(self) -> Dict[str, Any]:
+    async def get_major_indices(self) -> Dict[str, IndexQuote]:
         """주요 지수 조회 (KOSPI, KOSDAQ)"""
         if not self.app_key:
             return self._get_mock_indices()
-            
+
+        # 캐시된 딕셔너리는 공유되므로 호출자에게는 복사본 반환 (IndexQuote 자체는 불변)
+        entry = self._index_cache
+        if entry and time.monotonic() - entry[0] < INDEX_CACHE_TTL:
+            return dict(entry[1])
+
+        async with self._index_lock:
+            entry = self._index_cache
+            if entry and time.monotonic() - entry[0] < INDEX_CACHE_TTL:
+                return dict(entry[1])
+
+            indices = await self._fetch_major_indices()
+            if indices:
+                self._index_cache = (time.monotonic(), indices)
+                return dict(indices)
+            return self._get_mock_indices()
+
+    async def _fetch_major_indices(self) -> Dict[str, IndexQuote]:
+        """주요 지수 API 호출 (조회 성공한 지수만 반환)"""
         indices = {}
         index_codes = {
             "KOSPI": "0001",
@@ -182,20 +393,22 @@ class KISAPIClient:
                     "fid_input_iscd": index_code
                 }
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            output = data.get("output", {})
-                            indices[index_name] = {
-                                "current": float(output.get("bstp_nmix_prpr", 0)),
-                                "change": float(output.get("bstp_nmix_prdy_vrss", 0)),
-                                "change_rate": float(output.get("prdy_vrss_sign", 0))
-                            }
+                session = await self._init_session()
+                async with session.get(url, headers=headers, params=params) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=orjson.loads)
+                        output = data.get("output", {})
+                        indices[index_name] = IndexQuote(
+                            current=float(output.get("bstp_nmix_prpr", 0)),
+                            change=float(output.get("bstp_nmix_prdy_vrss", 0)),
+                            change_rate=float(output.get("prdy_vrss_sign", 0))
+                        )
+            except asyncio.TimeoutError:
+                logger.warning(f"{index_name} 지수 조회 시간 초과")
             except Exception as e:
                 logger.error(f"{index_name} 지수 조회 실패: {e}")
                 
-        return indices if indices else self._get_mock_indices()
+        return indices
 
     async def get_market_holidays(self, year: str) -> List[str]:
         """시장 휴장일 조회"""
@@ -205,118 +418,112 @@ class KISAPIClient:
         url = f"{self.base_url}/uapi/domestic-stock/v1/quotations/chk-holiday"
         headers = await self._get_headers("CTCA0903R")
         
-        holidays = []
-        try:
-            # 월별로 조회
-            for month in range(1, 13):
-                params = {
-                    "BASS_DT": f"{year}{month:02d}01",
-                    "CTX_AREA_NK": "",
-                    "CTX_AREA_FK": ""
-                }
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url, headers=headers, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            output = data.get("output", [])
-                            for item in output:
-                                holiday_date = item.get("bass_dt")
-                                if holiday_date:
-                                    holidays.append(f"{holiday_date[:4]}-{holiday_date[4:6]}-{holiday_date[6:8]}")
-        except Exception as e:
-            logger.error(f"휴장일 조회 실패: {e}")
-            
-        return holidays if holidays else self._get_mock_holidays()
+        # 12개월을 공유 세션에서 동시에 조회 (동시 요청 수는 초당 한도 이내로 제한)
+        session = await self._init_session()
+        results = await asyncio.gather(*(
+            self._fetch_holiday_month(session, url, headers, f"{year}{month:02d}01")
+            for month in range(1, 13)
+        ), return_exceptions=True)
+        
+        # 한 달이라도 실패하면 휴장일 목록이 불완전하므로 전체를 실패로 처리
+        failed_months = [
+            f"{month}월({type(result).__name__})"
+            for month, result in enumerate(results, start=1)
+            if isinstance(result, BaseException)
+        ]
+        if failed_months:
+            logger.error(f"휴장일 조회 실패: {', '.join(failed_months)}")
+            return self._get_mock_holidays()
+        
+        # 월 경계에서 중복될 수 있으므로 집합으로 수집
+        holidays = {
+            f"{d[:4]}-{d[4:6]}-{d[6:8]}"
+            for month_output in results
+            for item in month_output
+            if (d := item.get("bass_dt"))
+        }
+        return sorted(holidays) if holidays else self._get_mock_holidays()
+
+    async def _fetch_holiday_month(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Dict[str, str],
+        bass_dt: str
+    ) -> List[Dict[str, Any]]:
+        """특정 월의 휴장일 조회 결과(output) 반환 (200이 아닌 응답은 예외로 처리)"""
+        params = {
+            "BASS_DT": bass_dt,
+            "CTX_AREA_NK": "",
+            "CTX_AREA_FK": ""
+        }
+        
+        async with self._request_semaphore:
+            async with session.get(url, headers=headers, params=params) as response:
+                # 호출 한도 초과 등 오류 응답을 '휴장일 없음'으로 오인하지 않도록 예외 발생
+                response.raise_for_status()
+                # content-type/인코딩 감지를 거치지 않고 원본 바이트를 한 번에 파싱
+                data = orjson.loads(await response.read())
+                return data.get("output", [])
 
     async def get_earnings_calendar(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """실적발표 일정 조회 (기업 정보 기반)"""
         # KIS API는 직접적인 실적발표 일정 API가 없으므로 주요 기업들의 예상 일정을 반환
-        major_companies = [
-            {"code": "005930", "name": "삼성전자"},
-            {"code": "000660", "name": "SK하이닉스"},
-            {"code": "035420", "name": "NAVER"},
-            {"code": "005380", "name": "현대자동차"},
-            {"code": "006400", "name": "삼성SDI"},
-            {"code": "051910", "name": "LG화학"},
-            {"code": "068270", "name": "셀트리온"},
-            {"code": "035720", "name": "카카오"},
-        ]
-        
-        earnings_events = []
-        
-        # 분기별 실적발표 예상 시기
         current_year = datetime.now().year
-        quarters = [
-            {"quarter": "Q1", "month": 4, "day": 15},
-            {"quarter": "Q2", "month": 7, "day": 15},
-            {"quarter": "Q3", "month": 10, "day": 15},
-            {"quarter": "Q4", "month": 1, "day": 30, "year_offset": 1},
+        years = (current_year, current_year + 1)
+
+        return [
+            event
+            for event in chain.from_iterable(self._build_year_calendar(y) for y in years)
+            if start_date <= event["date"] <= end_date
         ]
-        
-        for quarter in quarters:
-            year = current_year + quarter.get("year_offset", 0)
-            earnings_date = datetime(year, quarter["month"], quarter["day"])
-            earnings_date_str = earnings_date.strftime("%Y-%m-%d")
-            
-            # 날짜 범위 확인
-            if start_date <= earnings_date_str <= end_date:
-                for company in major_companies:
-                    earnings_events.append({
-                        "id": f"earnings_{company['code']}_{quarter['quarter']}_{year}",
-                        "title": f"{company['name']} 실적발표",
-                        "date": earnings_date_str,
-                        "eventType": "earnings",
-                        "stockCode": company["code"],
-                        "stockName": company["name"],
-                        "description": f"{year-1 if quarter['quarter'] == 'Q4' else year}년 {quarter['quarter']} 실적발표",
-                        "marketType": "domestic"
-                    })
-                    
-        return earnings_events
-
-    def _get_mock_stock_price(self, stock_code: str) -> Dict[str, Any]:
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _build_year_calendar(year: int) -> Tuple[Dict[str, Any], ...]:
+        """연도별 실적발표 예상 일정 생성 (연도 단위로 캐시)"""
+        events = []
+        for quarter, month, day, year_offset in EARNINGS_QUARTERS:
+            event_year = year + year_offset
+            earnings_date_str = datetime(event_year, month, day).strftime("%Y-%m-%d")
+            description = f"{event_year-1 if quarter == 'Q4' else event_year}년 {quarter} 실적발표"
+
+            for code, name in MAJOR_COMPANIES:
+                events.append({
+                    "id": f"earnings_{code}_{quarter}_{event_year}",
+                    "title": f"{name} 실적발표",
+                    "date": earnings_date_str,
+                    "eventType": "earnings",
+                    "stockCode": code,
+                    "stockName": name,
+                    "description": description,
+                    "marketType": "domestic"
+                })
+
+        return tuple(events)
+
+    def _get_mock_stock_price(self, stock_code: str) -> StockQuote:
         """목업 주식 데이터"""
-        mock_prices = {
-            "005930": {"price": 71000, "name": "삼성전자"},
-            "000660": {"price": 89000, "name": "SK하이닉스"},
-            "035420": {"price": 180000, "name": "NAVER"},
-            "005380": {"price": 185000, "name": "현대자동차"},
-        }
+        price = _MOCK_STOCK_PRICES.get(stock_code, _MOCK_DEFAULT_PRICE)
         
-        data = mock_prices.get(stock_code, {"price": 50000, "name": f"종목{stock_code}"})
-        
-        return {
-            "stock_code": stock_code,
-            "current_price": data["price"],
-            "change_price": data["price"] * 0.01,  # 1% 변동
-            "change_rate": 1.0,
-            "volume": 1000000,
-            "market_cap": data["price"] * 1000000,
-            "success": False,  # 목업 데이터임을 표시
-            "message": "KIS API 키가 없어 목업 데이터를 사용합니다."
-        }
+        return StockQuote(
+            stock_code=stock_code,
+            current_price=price,
+            change_price=price * 0.01,  # 1% 변동
+            change_rate=1.0,
+            volume=1000000,
+            market_cap=price * 1000000,
+            success=False,  # 목업 데이터임을 표시
+            message="KIS API 키가 없어 목업 데이터를 사용합니다."
+        )
 
-    def _get_mock_indices(self) -> Dict[str, Any]:
+    def _get_mock_indices(self) -> Dict[str, IndexQuote]:
         """목업 지수 데이터"""
-        return {
-            "KOSPI": {"current": 2500.0, "change": 20.0, "change_rate": 0.8},
-            "KOSDAQ": {"current": 850.0, "change": 15.0, "change_rate": 1.8}
-        }
+        return dict(_MOCK_INDICES)
 
     def _get_mock_holidays(self) -> List[str]:
         """목업 휴장일 데이터"""
-        current_year = datetime.now().year
-        return [
-            f"{current_year}-01-01",  # 신정
-            f"{current_year}-03-01",  # 3.1절
-            f"{current_year}-05-05",  # 어린이날
-            f"{current_year}-06-06",  # 현충일
-            f"{current_year}-08-15",  # 광복절
-            f"{current_year}-10-03",  # 개천절
-            f"{current_year}-10-09",  # 한글날
-            f"{current_year}-12-25",  # 크리스마스
-        ]
+        return list(_build_mock_holidays(datetime.now().year))
 
 # 전역 클라이언트 인스턴스
 kis_api_client = KISAPIClient()
\ No newline at end of file
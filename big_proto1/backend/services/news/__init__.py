@@ -2,18 +2,35 @@
 뉴스 관련 서비스 모듈
 
 뉴스 검색, 분석, 질문 생성 등의 기능을 제공하는 모듈입니다.
+하위 모듈은 처음 접근할 때 로드됩니다 (PEP 562).
 """
 
-from .question_builder import sanitize_list
+import importlib
 
-from .keyword_analyzer import KeywordAnalyzer
-from .question_generator import QuestionGenerator
-from .query_generator import QueryGenerator
-from .related_news_system import RelatedNewsSystem
+# 공개 이름 → 정의된 하위 모듈
+_LAZY_IMPORTS = {
+    "sanitize_list": ".question_builder",
+    "KeywordAnalyzer": ".keyword_analyzer",
+    "QuestionGenerator": ".question_generator",
+    "QueryGenerator": ".query_generator",
+    "RelatedNewsSystem": ".related_news_system",
+}
 
 # 나중에 추가될 뉴스 모듈
-# from backend.services.news.news_engine import NewsEngine
+# "NewsEngine": ".news_engine",
 
-__all__ = [
-    # "NewsEngine"
-] 
\ No newline at end of file
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """하위 모듈을 지연 로드하여 속성 반환"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
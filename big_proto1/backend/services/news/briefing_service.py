@@ -3,15 +3,237 @@ AI 뉴스 컨시어지 서비스
 
 사용자의 질문에 대한 답변으로 뉴스 요약, 분석, 관련 기사 목록을 생성합니다.
 """
-from typing import Dict, List, Any, Optional
-import json
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+import asyncio
 import re
 import os
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+import difflib
+import httpx
+import numpy as np
 import openai
+import orjson
+from openai import AsyncOpenAI
+from pydantic import BaseModel, ConfigDict, Field
 
 from backend.api.clients.bigkinds.client import BigKindsClient
 from backend.api.clients.bigkinds.formatters import format_news_response
 from backend.utils.logger import setup_logger 
+from backend.utils.memory_cache import MemoryCacheBackend
+from backend.utils.semantic_cache import SemanticCache
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 질문별 브리핑 응답 캐시 (요청마다 서비스가 생성되므로 모듈 수준에서 공유)
+BRIEFING_CACHE_TTL = 3600
+EMBEDDING_MODEL = "text-embedding-3-small"
+_briefing_cache = SemanticCache(prefix="briefing", ttl=BRIEFING_CACHE_TTL, similarity_threshold=0.95)
+
+# BigKinds 검색/연관어 결과 캐시 (인기 질문의 반복 HTTP 왕복 제거)
+BIGKINDS_CACHE_TTL = 600
+_bigkinds_cache = MemoryCacheBackend(max_entries=2048)
+
+
+async def _cached_bigkinds_call(method, **kwargs) -> Any:
+    """BigKinds 클라이언트 메서드를 스레드에서 호출하고 (메서드명, 인자) 기준으로 결과를 캐싱"""
+    key = method.__name__ + ":" + orjson.dumps(kwargs, option=orjson.OPT_SORT_KEYS).decode()
+    result = _bigkinds_cache.get(key)
+    if result is None:
+        result = await asyncio.to_thread(method, **kwargs)
+        # 빈 결과는 일시적 실패일 수 있으므로 캐싱하지 않음
+        if result:
+            _bigkinds_cache.set(key, result, BIGKINDS_CACHE_TTL)
+    return result
+
+BRIEFING_MODEL = "gpt-4o-mini"  # 비용 효율적인 모델 사용
+BRIEFING_SYSTEM_PROMPT = "당신은 서울경제신문의 AI 뉴스 분석가입니다. 주어진 기사를 바탕으로 MZ세대를 위한 간결하고 정확한 FAQ를 생성합니다. 반드시 JSON 형식으로 응답해야 합니다."
+
+
+# LLM 출력 스키마 (OpenAI structured outputs의 strict 모드: 모든 필드 필수, 추가 필드 금지)
+class BriefingPoint(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    question: str = Field(description="FAQ 질문 (예: Q1. 핵심 내용이 무엇인가요?)")
+    answer: str = Field(description="구체적이고 간결한 답변 (70-80자)")
+    citations: List[int] = Field(description="참조한 기사 번호")
+
+
+class BriefingLLMOutput(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    summary: str = Field(description="질문에 대한 핵심 요약 (100자 내외)")
+    points: List[BriefingPoint]
+
+
+def _json_schema_format(name: str, model: type) -> Dict[str, Any]:
+    """pydantic 모델로 strict json_schema response_format 생성"""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": model.model_json_schema()},
+    }
+
+
+BRIEFING_RESPONSE_FORMAT = _json_schema_format("briefing", BriefingLLMOutput)
+
+# OpenAI 클라이언트는 요청마다 만들지 않고 프로세스 단위로 재사용 (TLS 핸드셰이크/커넥션 풀 공유)
+OPENAI_TIMEOUT = 30
+OPENAI_MAX_RETRIES = 2
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_openai_clients: Dict[str, AsyncOpenAI] = {}
+
+
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """API 키별 공유 AsyncOpenAI 클라이언트 반환"""
+    client = _openai_clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=OPENAI_TIMEOUT,
+            max_retries=OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_TIMEOUT)
+        )
+        _openai_clients[api_key] = client
+    return client
+
+# 비대화형(배치) 브리핑 설정
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# 스트리밍 중인 JSON 응답에서 닫힌 "summary" 문자열 값을 찾는 패턴
+STREAMED_SUMMARY_RE = re.compile(r'"summary"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# LLM 맥락 기사 중복 제거 기준 (문자 5-gram 자카드 유사도)
+CONTEXT_SHINGLE_SIZE = 5
+CONTEXT_DEDUP_THRESHOLD = 0.85
+
+
+def _char_shingles(text: str, size: int = CONTEXT_SHINGLE_SIZE) -> frozenset:
+    """공백을 정규화한 문자 n-gram 집합"""
+    normalized = " ".join(text.split())
+    if len(normalized) <= size:
+        return frozenset((normalized,))
+    return frozenset(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+# 한국어 키워드 패턴: 한글 연속 구간 중 3글자 이상 8글자 이하인 것만 (특수문자 제외)
+KEYWORD_RE = re.compile(r'(?<![가-힣])[가-힣]{3,8}(?![가-힣])')
+
+# 개선된 불용어 리스트 (사용자 피드백 반영)
+KEYWORD_STOPWORDS = frozenset({
+    # 기본 불용어
+    '기자', '기업', '회사', '사업', '시장', '정부', '국가', '지난', '올해', '내년',
+    '이번', '당시', '현재', '관련', '통해', '위해', '대한', '국내', '해외', '전년',
+    '이날', '오늘', '어제', '내일', '이후', '이전', '동안', '과정', '결과', '상황',
+    '문제', '방법', '계획', '예정', '필요', '가능', '중요', '주요', '최근', '향후',
+    # 추가 불용어 (사용자 피드백)
+    '발표', '진행', '참여', '제공', '운영', '실시', '마련', '확대', '강화', '개선',
+    '추진', '검토', '논의', '협력', '지원', '활용', '도입', '구축', '발전', '성장',
+    '증가', '감소', '변화', '영향', '효과', '이용', '사용', '적용', '경우', '때문',
+    '따라', '따르', '위해서', '대해서', '에서는', '에게는', '라고', '다고', '한다',
+    '있다', '없다', '된다', '안다', '모른다', '같다', '다르다', '크다', '작다'
+})
+
+
+# 인물 패턴 (한국 이름, 외국 이름)
+PERSON_PATTERNS = (
+    r'[가-힣]{2,3}(?:회장|대표|사장|부사장|상무|이사|부장|차장|과장|팀장|실장|본부장)',
+    r'[가-힣]{2,3}(?:대통령|총리|장관|차관|국장|과장|청장|원장)',
+    r'[가-힣]{2,3}(?:교수|박사|연구원|전문가|애널리스트)',
+    r'[가-힣]{2,3}(?:의원|국회의원|시장|도지사|구청장)',
+    r'[A-Z][a-z]+\s+[A-Z][a-z]+',  # 영문 이름
+    r'[가-힣]{2,4}(?:\s+[가-힣]{1,2})?(?:씨|님)?$'  # 일반 한국 이름
+)
+
+# 장소 패턴
+LOCATION_PATTERNS = (
+    r'[가-힣]+(?:시|도|군|구|읍|면|동|리)$',
+    r'[가-힣]+(?:역|공항|항만|항구|터미널|센터|빌딩|타워)$',
+    r'(?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)',
+    r'(?:미국|중국|일본|독일|프랑스|영국|이탈리아|스페인|러시아|인도|브라질)',
+    r'[가-힣]+(?:대학교|대학|학교|병원|연구소)$'
+)
+
+# 기관/조직 패턴
+ORGANIZATION_PATTERNS = (
+    r'[가-힣]+(?:부|청|처|원|공사|공단|공기업)$',
+    r'[가-힣]+(?:회사|기업|그룹|계열|법인|협회|조합|단체)$',
+    r'[가-힣]+(?:은행|증권|보험|카드|금융|투자|자산운용)$',
+    r'[가-힣]+(?:전자|화학|제약|건설|통신|IT|바이오|에너지)$',
+    r'(?:삼성|LG|현대|SK|롯데|한화|포스코|KT|네이버|카카오)',
+    r'[A-Z]{2,}(?:[a-z]*)?',  # 대문자 약어 (예: IBM, CEO, AI)
+    r'[가-힣]+(?:정부|국회|법원|검찰|경찰|군|해군|공군|육군)$'
+)
+
+
+def _compile_union(patterns) -> "re.Pattern":
+    """여러 패턴을 하나의 alternation 정규식으로 컴파일"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+# 엔티티 분류 순서대로 (정규식, (엔티티 타입, 카테고리))
+_ENTITY_CLASSIFIERS = (
+    (_compile_union(PERSON_PATTERNS), ("person", "person")),
+    (_compile_union(LOCATION_PATTERNS), ("location", "location")),
+    (_compile_union(ORGANIZATION_PATTERNS), ("organization", "organization")),
+)
+
+
+@dataclass(slots=True, frozen=True)
+class ArticleBundle:
+    """기사 목록의 열 단위 텍스트 (딕셔너리 조회와 소문자 변환을 한 번만 수행)"""
+    titles: List[str]
+    contents: List[str]
+    titles_lower: List[str]
+    full_lower: List[str]
+
+    @classmethod
+    def from_articles(cls, articles: List[Dict]) -> "ArticleBundle":
+        titles = [article.get("title") or "" for article in articles]
+        contents = [article.get("content") or "" for article in articles]
+        return cls(
+            titles=titles,
+            contents=contents,
+            titles_lower=[title.lower() for title in titles],
+            full_lower=[f"{title} {content}".lower() for title, content in zip(titles, contents)],
+        )
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    """키워드 목록으로 Aho-Corasick 오토마톤 생성 (값: (키워드 인덱스 목록, 키워드 길이))"""
+    indices: Dict[str, List[int]] = {}
+    for keyword_idx, keyword in enumerate(keywords):
+        indices.setdefault(keyword, []).append(keyword_idx)
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_indices in indices.items():
+        automaton.add_word(keyword, (keyword_indices, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_keywords(automaton, text: str, size: int) -> List[int]:
+    """텍스트를 한 번 스캔해 키워드별 출현 횟수 집계 (str.count처럼 겹치는 출현은 제외)"""
+    counts = [0] * size
+    last_end = [-1] * size
+    for end, (keyword_indices, length) in automaton.iter(text):
+        start = end - length + 1
+        for keyword_idx in keyword_indices:
+            if start > last_end[keyword_idx]:
+                counts[keyword_idx] += 1
+                last_end[keyword_idx] = end
+    return counts
+
 
 class BriefingService:
     def __init__(self, bigkinds_client: BigKindsClient):
@@ -19,22 +241,246 @@ class BriefingService:
         self.logger = setup_logger("briefing_service")
         # self.llm_client = LlmClient() # 실제 LLM 클라이언트 초기화
 
-    async def generate_briefing_for_question(self, question: str) -> Dict[str, Any]:
+    async def generate_briefing_for_question(self, question: str, bypass_cache: bool = False) -> Dict[str, Any]:
         """
         사용자의 질문을 받아 검색, 요약, 분석을 수행하고 최종 브리핑을 생성합니다.
 
         Args:
             question: 사용자의 자연어 질문
+            bypass_cache: True이면 캐시를 조회하지 않고 새로 생성 (결과는 캐시에 저장)
 
         Returns:
             AI가 생성한 요약, 분석, 관련 기사 목록을 포함하는 딕셔너리
         """
         # 질문 저장 (응답에서 사용하기 위해)
         self._current_question = question
+
+        embed = self._embed_question if os.environ.get("OPENAI_API_KEY") else None
+        question_vector = None
+        if not bypass_cache:
+            cached, question_vector = await _briefing_cache.get(question, embed=embed)
+            if cached is not None:
+                self.logger.info("브리핑 캐시 적중")
+                return {**cached, "query": question}
+        
+        prepared = await self._prepare_briefing(question)
+        if prepared is None:
+            return {
+                "query": self._current_question,
+                "summary": "관련된 기사를 찾지 못했습니다. 다른 키워드로 질문해보세요.",
+                "documents": [],
+                "points": [],
+                "related_articles": []
+            }
+        articles, seoul_articles, context_for_llm = prepared
+        bundle = ArticleBundle.from_articles(articles)
+
+        # OpenAI 호출과 BigKinds 키워드 추출은 서로 독립적이므로 동시에 실행
+        llm_task = asyncio.create_task(self._call_openai_api(self._create_llm_prompt(question, context_for_llm)))
+        keywords_task = asyncio.create_task(self._extract_keywords_from_articles(bundle))
+        llm_result, keywords = await asyncio.gather(llm_task, keywords_task, return_exceptions=True)
+
+        llm_succeeded = True
+        if isinstance(llm_result, Exception):
+            self.logger.error(f"OpenAI API 호출 실패: {str(llm_result)}")
+            # Fallback으로 Mock 데이터 사용
+            llm_response = self._mock_llm_call(question, seoul_articles)
+            llm_succeeded = False
+        else:
+            llm_response = llm_result
+
+        if isinstance(keywords, Exception):
+            self.logger.error(f"키워드 추출 실패: {str(keywords)}")
+            keywords = self._extract_keywords_fallback(bundle)
+
+        # 4. LLM 응답과 원본 기사 데이터를 조합하여 최종 결과 생성
+        response = self._format_final_response(llm_response, articles, keywords, bundle)
+
+        # Mock 응답은 캐싱하지 않음 (저장은 응답 경로 밖에서 진행)
+        if llm_succeeded:
+            _briefing_cache.set_in_background(question, response, embed=embed, vector=question_vector)
         
+        return response
+
+    async def stream_briefing_for_question(self, question: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        브리핑을 스트리밍으로 생성합니다.
+        LLM 응답에서 요약(summary)이 완성되는 즉시 부분 결과를 먼저 내보내고,
+        전체 응답이 끝나면 최종 브리핑을 내보냅니다.
+
+        Yields:
+            {"status": "streaming", "query", "summary"} 부분 결과 (최대 1회)
+            {"status": "complete", ...} generate_briefing_for_question과 같은 형식의 최종 결과
+        """
+        self._current_question = question
+
+        embed = self._embed_question if os.environ.get("OPENAI_API_KEY") else None
+        cached, question_vector = await _briefing_cache.get(question, embed=embed)
+        if cached is not None:
+            self.logger.info("브리핑 캐시 적중")
+            yield {**cached, "query": question, "status": "complete"}
+            return
+
+        prepared = await self._prepare_briefing(question)
+        if prepared is None:
+            yield {
+                "query": question,
+                "summary": "관련된 기사를 찾지 못했습니다. 다른 키워드로 질문해보세요.",
+                "documents": [],
+                "points": [],
+                "related_articles": [],
+                "status": "complete"
+            }
+            return
+        articles, seoul_articles, context_for_llm = prepared
+        bundle = ArticleBundle.from_articles(articles)
+
+        # 키워드 추출은 LLM 스트리밍과 동시에 진행
+        keywords_task = asyncio.create_task(self._extract_keywords_from_articles(bundle))
+
+        llm_succeeded = True
+        try:
+            content = ""
+            summary_sent = False
+            async for delta in self._stream_openai_api(self._create_llm_prompt(question, context_for_llm)):
+                content += delta
+                if not summary_sent:
+                    match = STREAMED_SUMMARY_RE.search(content)
+                    if match:
+                        summary_sent = True
+                        yield {
+                            "query": question,
+                            "summary": orjson.loads(f'"{match.group(1)}"'),
+                            "status": "streaming"
+                        }
+            llm_response = self._parse_llm_content(content)
+        except Exception as e:
+            self.logger.error(f"OpenAI 스트리밍 호출 실패: {str(e)}")
+            llm_response = self._mock_llm_call(question, seoul_articles)
+            llm_succeeded = False
+
+        try:
+            keywords = await keywords_task
+        except Exception as e:
+            self.logger.error(f"키워드 추출 실패: {str(e)}")
+            keywords = self._extract_keywords_fallback(bundle)
+
+        self._current_question = question
+        response = self._format_final_response(llm_response, articles, keywords, bundle)
+        if llm_succeeded:
+            _briefing_cache.set_in_background(question, response, embed=embed, vector=question_vector)
+
+        yield {**response, "status": "complete"}
+
+    async def submit_batch_briefings(
+        self,
+        questions: List[str],
+        poll_interval: float = 60.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        비대화형 브리핑(야간 재요약, 인기 주제 사전 생성 등)을 OpenAI Batch API로 생성합니다.
+        결과는 브리핑 캐시에 저장되어 이후 같은 질문이 들어오면 즉시 응답합니다.
+
+        Args:
+            questions: 브리핑을 생성할 질문 목록
+            poll_interval: 배치 상태 확인 간격(초)
+            timeout: 최대 대기 시간(초), None이면 배치 종료까지 대기
+
+        Returns:
+            배치 ID, 최종 상태, 캐시에 저장된 브리핑 수
+        """
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            raise Exception("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+
+        client = _get_openai_client(api_key)
+
+        # 1. 질문별 기사 검색 및 프롬프트 준비 → JSONL 요청 생성
+        pending: Dict[str, Tuple[str, List[Dict]]] = {}
+        lines = []
+        for i, question in enumerate(dict.fromkeys(questions)):
+            prepared = await self._prepare_briefing(question)
+            if prepared is None:
+                self.logger.warning(f"배치 브리핑 건너뜀 (관련 기사 없음): {question}")
+                continue
+            articles, _, context_for_llm = prepared
+            llm_prompt = self._create_llm_prompt(question, context_for_llm)
+            custom_id = f"briefing-{i}"
+            pending[custom_id] = (question, articles)
+            lines.append(orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": self._build_chat_body(llm_prompt)
+            }))
+
+        if not lines:
+            return {"batch_id": None, "status": "skipped", "cached": 0}
+
+        # 2. 입력 파일 업로드 후 배치 생성
+        input_file = await client.files.create(
+            file=("briefings.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW
+        )
+        self.logger.info(f"OpenAI 배치 생성: {batch.id} ({len(lines)}건)")
+
+        # 3. 배치 종료까지 상태 폴링
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            if deadline is not None and loop.time() >= deadline:
+                self.logger.warning(f"배치 대기 시간 초과: {batch.id} ({batch.status})")
+                return {"batch_id": batch.id, "status": batch.status, "cached": 0}
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            self.logger.error(f"배치 실패: {batch.id} ({batch.status})")
+            return {"batch_id": batch.id, "status": batch.status, "cached": 0}
+
+        # 4. 결과 파일을 읽어 최종 응답을 만들고 캐시에 저장
+        output = await client.files.content(batch.output_file_id)
+        # 유사 일치 색인용 임베딩은 질문 전체를 한 번의 요청으로 생성
+        question_vectors = await self._embed_questions([question for question, _ in pending.values()])
+        cached_count = 0
+        for raw_line in output.text.splitlines():
+            if not raw_line.strip():
+                continue
+            result = orjson.loads(raw_line)
+            entry = pending.get(result.get("custom_id"))
+            response_body = (result.get("response") or {}).get("body") or {}
+            if entry is None or result.get("error") or not response_body.get("choices"):
+                self.logger.warning(f"배치 결과 건너뜀: {result.get('custom_id')}")
+                continue
+
+            question, articles = entry
+            self._current_question = question
+            llm_response = self._parse_llm_content(response_body["choices"][0]["message"]["content"])
+            bundle = ArticleBundle.from_articles(articles)
+            keywords = await self._extract_keywords_from_articles(bundle)
+            response = self._format_final_response(llm_response, articles, keywords, bundle)
+            await _briefing_cache.set(question, response, vector=question_vectors.get(question))
+            cached_count += 1
+
+        self.logger.info(f"배치 브리핑 {cached_count}건 캐시 저장 완료: {batch.id}")
+        return {"batch_id": batch.id, "status": batch.status, "cached": cached_count}
+
+    async def _prepare_briefing(self, question: str) -> Optional[Tuple[List[Dict], List[Dict], str]]:
+        """기사 검색 후 LLM에 전달할 맥락을 준비합니다. 기사가 없으면 None을 반환합니다.
+
+        Returns:
+            (전체 기사 목록, LLM 맥락용 기사 목록, LLM 맥락 텍스트)
+        """
         # 1. 지능형 검색으로 관련 뉴스 기사 확보 (상위 30개)
-        search_result = self.bigkinds_client.search_news_with_fallback(
-            keyword=question,
+        search_result = await _cached_bigkinds_call(
+            self.bigkinds_client.search_news_with_fallback,
+            keyword=" ".join(question.split()),
             return_size=30,
             sort=[{"date": "desc"}, {"_score": "desc"}] # 최신순 우선 + 정확도
         )
@@ -43,13 +489,7 @@ class BriefingService:
         articles = formatted_response.get("documents", [])
 
         if not articles:
-            return {
-                "query": self._current_question,
-                "summary": "관련된 기사를 찾지 못했습니다. 다른 키워드로 질문해보세요.",
-                "documents": [],
-                "points": [],
-                "related_articles": []
-            }
+            return None
 
         # 2. 서울경제 기사만 필터링 (저작권 고려)
         seoul_articles = [
@@ -65,13 +505,24 @@ class BriefingService:
             self.logger.info(f"서울경제 기사 {len(seoul_articles)}개 사용")
 
         # 3. LLM에 전달할 기사 내용 준비 (서울경제 기사 우선)
+        # 여러 매체에 재송고된 거의 같은 기사는 한 번만 포함 (프롬프트 토큰 절감)
         context_for_llm = ""
         reference_articles = []
+        accepted_shingles: List[frozenset] = []
         
-        for i, article in enumerate(seoul_articles[:5]):  # 최대 5개 기사
+        for article in seoul_articles:
+            if len(reference_articles) >= 5:  # 최대 5개 기사
+                break
             title = article.get("title", "")
             content_preview = article.get("content", "")[:500] # 본문 앞 500자로 증가
             provider = article.get("provider_name", "")
+
+            shingles = _char_shingles(f"{title} {content_preview}")
+            if any(_jaccard(shingles, seen) > CONTEXT_DEDUP_THRESHOLD for seen in accepted_shingles):
+                self.logger.debug(f"중복 기사 제외: {title}")
+                continue
+            accepted_shingles.append(shingles)
+            i = len(reference_articles)
             
             context_for_llm += f"--- 기사 {i+1} ({provider}) ---\n"
             context_for_llm += f"제목: {title}\n"
@@ -85,24 +536,34 @@ class BriefingService:
                 "published_at": article.get("published_at", "")
             })
 
-        # 4. LLM을 통해 요약 및 분석 생성
-        llm_prompt = self._create_llm_prompt(question, context_for_llm)
-        
-        # 실제 OpenAI API 호출
+        return articles, seoul_articles, context_for_llm
+
+    async def _embed_question(self, text: str) -> Optional[List[float]]:
+        """유사 질문 캐시 조회용 임베딩 생성"""
+        client = _get_openai_client(os.environ.get("OPENAI_API_KEY"))
+        result = await client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+        return result.data[0].embedding
+
+    async def _embed_questions(self, questions: List[str]) -> Dict[str, Any]:
+        """여러 질문의 임베딩을 한 번의 요청으로 생성 (질문 → 정규화 벡터, 실패 시 빈 딕셔너리)"""
+        if not questions:
+            return {}
+        client = _get_openai_client(os.environ.get("OPENAI_API_KEY"))
         try:
-            llm_response = await self._call_openai_api(llm_prompt)
+            result = await client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=[SemanticCache.normalize(question) for question in questions]
+            )
         except Exception as e:
-            self.logger.error(f"OpenAI API 호출 실패: {str(e)}")
-            # Fallback으로 Mock 데이터 사용
-            llm_response = self._mock_llm_call(question, seoul_articles)
-
-        # 4. LLM 응답과 원본 기사 데이터를 조합하여 최종 결과 생성
-        response = self._format_final_response(llm_response, articles)
-        
-        return response
+            self.logger.warning(f"배치 질문 임베딩 실패, 유사 일치 색인 건너뜀: {e}")
+            return {}
+        return {
+            question: SemanticCache.to_vector(item.embedding)
+            for question, item in zip(questions, sorted(result.data, key=lambda item: item.index))
+        }
 
     async def _call_openai_api(self, prompt: str) -> Dict[str, Any]:
-        """OpenAI API를 호출하여 실제 요약을 생성합니다."""
+        """OpenAI API를 호출하여 실제 요약을 생성합니다. (응답은 BriefingLLMOutput 스키마로 강제)"""
         
         # OpenAI API 키 설정
         api_key = os.environ.get("OPENAI_API_KEY")
@@ -111,78 +572,67 @@ class BriefingService:
             raise Exception("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
         
         try:
-            # OpenAI 클라이언트 초기화 (최신 버전 방식)
-            from openai import AsyncOpenAI
-            client = AsyncOpenAI(api_key=api_key)
+            # 공유 OpenAI 클라이언트 (커넥션 풀 재사용)
+            client = _get_openai_client(api_key)
             
             self.logger.info("OpenAI API 호출 시작")
             
-            # GPT-4o-mini 모델 사용
             response = await client.chat.completions.create(
-                model="gpt-4o-mini",  # 비용 효율적인 모델 사용
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "당신은 서울경제신문의 AI 뉴스 분석가입니다. 주어진 기사를 바탕으로 MZ세대를 위한 간결하고 정확한 FAQ를 생성합니다. 반드시 JSON 형식으로 응답해야 합니다."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,  # 일관성 있는 응답을 위해 낮은 온도
-                max_tokens=2000,  # 적절한 길이 제한
+                **self._build_chat_body(prompt),
                 timeout=30,  # 30초 타임아웃
             )
             
             content = response.choices[0].message.content
             self.logger.info(f"OpenAI API 응답 수신: {len(content)} 글자")
-            
-            # JSON 응답 파싱 시도
-            try:
-                # JSON 블록 추출
-                json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    parsed_result = json.loads(json_str)
-                    self.logger.info("JSON 블록에서 파싱 성공")
-                    return parsed_result
-                else:
-                    # JSON 블록이 없으면 전체 내용을 JSON으로 파싱 시도
-                    parsed_result = json.loads(content)
-                    self.logger.info("전체 내용에서 JSON 파싱 성공")
-                    return parsed_result
-            except json.JSONDecodeError as e:
-                self.logger.warning(f"OpenAI 응답을 JSON으로 파싱할 수 없음: {str(e)}, 텍스트 파싱 시도")
-                return self._parse_text_response(content)
+            return self._parse_llm_content(content)
                 
         except Exception as e:
             self.logger.error(f"OpenAI API 호출 오류: {str(e)}")
             raise
 
-    def _parse_text_response(self, text: str) -> Dict[str, Any]:
-        """텍스트 응답을 파싱하여 구조화된 데이터로 변환합니다."""
-        
-        # 요약 추출
-        summary_match = re.search(r'기사 핵심요약[^\n]*\n\n(.*?)(?=\n\n.*FAQ|$)', text, re.DOTALL)
-        summary = summary_match.group(1).strip() if summary_match else "요약을 생성할 수 없습니다."
-        
-        # FAQ 추출
-        questions = re.findall(r'Q(\d+)\.\s*(.*?)\s*\n\s*A\.\s*(.*?)(?=\n\s*Q\d+\.|\Z)', text, re.DOTALL)
-        
-        points = []
-        for q_num, question, answer in questions:
-            points.append({
-                "question": f"Q{q_num}. {question.strip()}",
-                "answer": answer.strip(),
-                "citations": [int(q_num)]  # 간단한 인용 번호
-            })
-        
+    async def _stream_openai_api(self, prompt: str) -> AsyncIterator[str]:
+        """OpenAI API를 스트리밍 모드로 호출하여 응답 텍스트 조각을 순서대로 반환합니다."""
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            self.logger.warning("OPENAI_API_KEY 환경변수가 설정되지 않음, Mock 데이터 사용")
+            raise Exception("OPENAI_API_KEY 환경변수가 설정되지 않았습니다.")
+
+        client = _get_openai_client(api_key)
+        self.logger.info("OpenAI API 스트리밍 호출 시작")
+        stream = await client.chat.completions.create(
+            **self._build_chat_body(prompt),
+            stream=True,
+            timeout=30,  # 30초 타임아웃
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    @staticmethod
+    def _build_chat_body(prompt: str) -> Dict[str, Any]:
+        """브리핑 생성용 chat completions 요청 본문 (실시간/배치 공용)"""
         return {
-            "summary": summary,
-            "points": points
+            "model": BRIEFING_MODEL,
+            "messages": [
+                {
+                    "role": "system", 
+                    "content": BRIEFING_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.3,  # 일관성 있는 응답을 위해 낮은 온도
+            "max_tokens": 2000,  # 적절한 길이 제한
+            "response_format": BRIEFING_RESPONSE_FORMAT,
         }
 
+    @staticmethod
+    def _parse_llm_content(content: str) -> Dict[str, Any]:
+        """스키마가 강제된 LLM 응답 JSON을 검증하여 딕셔너리로 변환합니다."""
+        return BriefingLLMOutput.model_validate_json(content).model_dump()
+
     def _create_llm_prompt(self, question: str, context: str) -> str:
         """LLM에 전달할 프롬프트를 생성합니다."""
         
@@ -279,8 +729,16 @@ class BriefingService:
         
         return result
 
-    def _format_final_response(self, llm_response: Dict[str, Any], articles: List[Dict]) -> Dict[str, Any]:
+    def _format_final_response(
+        self,
+        llm_response: Dict[str, Any],
+        articles: List[Dict],
+        keywords: List[Dict[str, Any]],
+        bundle: Optional[ArticleBundle] = None
+    ) -> Dict[str, Any]:
         """LLM 응답과 원본 기사 목록을 조합하여 최종 API 응답 포맷을 생성합니다."""
+        if bundle is None:
+            bundle = ArticleBundle.from_articles(articles)
         
         # 기사 목록에서 필요한 정보만 추출하여 'documents' 생성 (프론트엔드 형식에 맞춤)
         documents = []
@@ -300,70 +758,36 @@ class BriefingService:
                 "hilight": article.get("hilight", "")
             })
 
-        # 키워드 추출 및 관련성 분석 추가
-        keywords = self._extract_keywords_from_articles(articles)
-        network_data = self._generate_network_data(articles, keywords)
+        # 키워드 관련성 분석 추가
+        network_data = self._generate_network_data(bundle, keywords)
         
-        # LLM 응답에서 points 필드 처리 (문자열 형식 응답 처리)
-        points = []
-        if isinstance(llm_response, dict):
-            # 딕셔너리 형태로 정상 반환된 경우
-            points = llm_response.get("points", [])
-        elif isinstance(llm_response, str):
-            # 문자열로 반환된 경우 JSON 파싱 시도
-            try:
-                # 문자열에서 JSON 부분 추출 시도
-                json_match = re.search(r'```json\s*(.*?)\s*```', llm_response, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    parsed_data = json.loads(json_str)
-                    points = parsed_data.get("points", [])
-                else:
-                    # JSON 블록이 없는 경우 전체 문자열을 JSON으로 파싱 시도
-                    parsed_data = json.loads(llm_response)
-                    points = parsed_data.get("points", [])
-            except (json.JSONDecodeError, ValueError):
-                # JSON 파싱 실패 시 FAQ 형식 파싱 시도
-                try:
-                    # FAQ 형식 파싱 (Q1. ... A. ... 패턴)
-                    questions = re.findall(r'Q\d+\.\s*(.*?)\s*\n\s*A\.\s*(.*?)(?=\n\s*Q\d+\.|\Z)', llm_response, re.DOTALL)
-                    points = [
-                        {
-                            "question": "Q{}. {}".format(i+1, q.strip()),
-                            "answer": a.strip(),
-                            "citations": []
-                        }
-                        for i, (q, a) in enumerate(questions)
-                    ]
-                except Exception:
-                    # FAQ 파싱도 실패한 경우 기본 응답 생성
-                    points = []
-
         return {
             "query": self._current_question,
-            "summary": llm_response.get("summary", "요약 정보를 생성하지 못했습니다.") if isinstance(llm_response, dict) else "요약 정보를 생성하지 못했습니다.",
+            # LLM 응답은 스키마 검증을 거친 딕셔너리 (목업 응답도 같은 형식)
+            "summary": llm_response.get("summary", "요약 정보를 생성하지 못했습니다."),
             "documents": documents,
-            "points": points,
+            "points": llm_response.get("points", []),
             "keywords": keywords,
             "network_data": network_data,
             "related_articles": documents  # 기존 호환성 유지
         }
 
-    def _extract_keywords_from_articles(self, articles: List[Dict]) -> List[Dict[str, Any]]:
+    async def _extract_keywords_from_articles(self, bundle: ArticleBundle) -> List[Dict[str, Any]]:
         """BigKinds 연관어 분석 API (TOPIC RANK)를 사용하여 고품질 키워드를 추출합니다."""
         
         # 1. 기사 제목들에서 주요 키워드 추출
-        titles = [article.get("title", "") for article in articles if article.get("title")]
-        if not titles:
+        first_title = next((title for title in bundle.titles if title), None)
+        if first_title is None:
             return []
         
         # 2. 가장 대표적인 제목이나 질문을 기반으로 연관어 분석
-        representative_text = self._current_question or titles[0]
+        representative_text = self._current_question or first_title
         
         try:
             # BigKinds word_cloud API를 사용한 고품질 키워드 추출
-            word_cloud_keywords = self.bigkinds_client.get_word_cloud_keywords(
-                keyword=representative_text,
+            word_cloud_keywords = await _cached_bigkinds_call(
+                self.bigkinds_client.get_word_cloud_keywords,
+                keyword=" ".join(representative_text.split()),
                 limit=25
             )
             
@@ -376,45 +800,21 @@ class BriefingService:
         
         # 3. Fallback: 기존 방식으로 키워드 추출
         self.logger.info("Fallback으로 기존 키워드 추출 방식 사용")
-        return self._extract_keywords_fallback(articles)
+        return self._extract_keywords_fallback(bundle)
     
-    def _extract_keywords_fallback(self, articles: List[Dict]) -> List[Dict[str, Any]]:
+    def _extract_keywords_fallback(self, bundle: ArticleBundle) -> List[Dict[str, Any]]:
         """기존 키워드 추출 방식 (Fallback용)"""
-        from collections import Counter
-        import re
-        
-        # 한국어 키워드 패턴 (2글자 이상, 특수문자 제외)
-        keyword_pattern = re.compile(r'[가-힣]{2,}')
-        
-        # 개선된 불용어 리스트 (사용자 피드백 반영)
-        stopwords = {
-            # 기본 불용어
-            '기자', '기업', '회사', '사업', '시장', '정부', '국가', '지난', '올해', '내년',
-            '이번', '당시', '현재', '관련', '통해', '위해', '대한', '국내', '해외', '전년',
-            '이날', '오늘', '어제', '내일', '이후', '이전', '동안', '과정', '결과', '상황',
-            '문제', '방법', '계획', '예정', '필요', '가능', '중요', '주요', '최근', '향후',
-            # 추가 불용어 (사용자 피드백)
-            '발표', '진행', '참여', '제공', '운영', '실시', '마련', '확대', '강화', '개선',
-            '추진', '검토', '논의', '협력', '지원', '활용', '도입', '구축', '발전', '성장',
-            '증가', '감소', '변화', '영향', '효과', '이용', '사용', '적용', '경우', '때문',
-            '따라', '따르', '위해서', '대해서', '에서는', '에게는', '라고', '다고', '한다',
-            '있다', '없다', '된다', '안다', '모른다', '같다', '다르다', '크다', '작다'
-        }
-        
-        all_keywords = []
-        for article in articles:
-            title = article.get("title", "")
-            content = article.get("content", "")
-            text = "{} {}".format(title, content)
-            
-            # 키워드 추출
-            keywords = keyword_pattern.findall(text)
-            # 불용어 제거 및 길이 제한 (3글자 이상 8글자 이하로 제한)
-            keywords = [kw for kw in keywords if kw not in stopwords and 3 <= len(kw) <= 8]
-            all_keywords.extend(keywords)
+        # 매치 수집과 집계를 모두 C 레벨(findall, Counter의 _count_elements)에서 처리하고
+        # 불용어는 매치마다 검사하지 않고 집계 후 한 번에 제거
+        counter = Counter()
+        for title, content in zip(bundle.titles, bundle.contents):
+            counter.update(KEYWORD_RE.findall(title))
+            counter.update(KEYWORD_RE.findall(content))
+        for stopword in KEYWORD_STOPWORDS.intersection(counter):
+            del counter[stopword]
         
         # 빈도수 계산 (상위 25개)
-        keyword_counts = Counter(all_keywords).most_common(25)
+        keyword_counts = counter.most_common(25)
         
         return [
             {
@@ -425,7 +825,7 @@ class BriefingService:
             for keyword, count in keyword_counts
         ]
 
-    def _generate_network_data(self, articles: List[Dict], keywords: List[Dict]) -> Dict[str, Any]:
+    def _generate_network_data(self, bundle: ArticleBundle, keywords: List[Dict]) -> Dict[str, Any]:
         """키워드 간의 네트워크 데이터를 생성합니다."""
         nodes = []
         links = []
@@ -457,65 +857,69 @@ class BriefingService:
             })
         
         # 키워드 간 연관성 링크 생성 (동일 기사에 나타나는 키워드들을 연결)
-        keyword_cooccurrence = {}  # 키워드 동시 출현 빈도 저장
-        
-        for article_idx, article in enumerate(articles):
-            title = article.get("title", "")
-            content = article.get("content", "")
-            text = f"{title} {content}".lower()
-            
-            # 이 기사에 나타나는 키워드들 찾기
-            article_keywords = []
-            for keyword_idx, keyword_data in enumerate(keywords[:25]):
-                keyword = keyword_data["keyword"]
-                if keyword in text:
-                    # 제목에 있으면 가중치 3배, 본문에만 있으면 1배
-                    title_count = title.lower().count(keyword)
-                    content_count = text.count(keyword) - title_count
-                    occurrence_weight = (title_count * 3 + content_count) * keyword_data["weight"]
-                    
-                    if occurrence_weight > 0.2:  # 최소 임계값
-                        article_keywords.append((keyword_idx, occurrence_weight))
-            
-            # 같은 기사에 나타나는 키워드들 간의 연결 강도 계산
-            for i in range(len(article_keywords)):
-                for j in range(i+1, len(article_keywords)):
-                    kw1_idx, kw1_weight = article_keywords[i]
-                    kw2_idx, kw2_weight = article_keywords[j]
-                    
-                    # 키워드 쌍을 정렬하여 중복 방지
-                    pair = tuple(sorted([kw1_idx, kw2_idx]))
-                    
-                    if pair not in keyword_cooccurrence:
-                        keyword_cooccurrence[pair] = 0
-                    
-                    # 동시 출현 강도 누적
-                    keyword_cooccurrence[pair] += (kw1_weight + kw2_weight) / 2
+        top_keywords = keywords[:25]
+        keyword_texts = [keyword_data["keyword"] for keyword_data in top_keywords]
+        keyword_weights = np.array([keyword_data["weight"] for keyword_data in top_keywords], dtype=float)
+
+        # 키워드 × 기사 출현 가중치 행렬 (제목에 있으면 가중치 3배, 본문에만 있으면 1배)
+        occurrence = np.zeros((len(top_keywords), len(bundle.titles)))
+        if AHOCORASICK_AVAILABLE and keyword_texts and all(keyword_texts):
+            # 기사마다 키워드 수와 무관하게 본문/제목을 한 번씩만 스캔
+            automaton = _build_keyword_automaton(keyword_texts)
+            size = len(keyword_texts)
+            for article_idx, (title_lower, text) in enumerate(zip(bundle.titles_lower, bundle.full_lower)):
+                total_counts = np.array(_count_keywords(automaton, text, size))
+                title_counts = np.array(_count_keywords(automaton, title_lower, size))
+                # 제목 출현 3배 + 본문 출현 1배 = 전체 + 제목 × 2
+                occurrence[:, article_idx] = total_counts + 2 * title_counts
+        else:
+            for article_idx, (title_lower, text) in enumerate(zip(bundle.titles_lower, bundle.full_lower)):
+                # 본문 전체는 키워드당 한 번만 스캔하고, 출현한 키워드만 (짧은) 제목을 추가 스캔
+                for keyword_idx, keyword in enumerate(keyword_texts):
+                    total_count = text.count(keyword)
+                    if total_count:
+                        # 제목 출현 3배 + 본문 출현 1배 = 전체 + 제목 × 2
+                        occurrence[keyword_idx, article_idx] = total_count + 2 * title_lower.count(keyword)
+        
+        occurrence *= keyword_weights[:, None]
+        # 최소 임계값을 넘은 출현만 사용
+        occurrence[occurrence <= 0.2] = 0
+        present = (occurrence > 0).astype(float)
+
+        # 같은 기사에 함께 나타난 키워드 쌍의 (w1 + w2) / 2 를 기사 전체에 대해 누적
+        cooccurrence = (occurrence @ present.T + present @ occurrence.T) / 2
         
         # 키워드 간 링크 생성 (강한 연결만)
-        for (kw1_idx, kw2_idx), strength in keyword_cooccurrence.items():
-            if strength > 0.4:  # 강한 연결만 표시
-                links.append({
-                    "source": "keyword_{}".format(kw1_idx),
-                    "target": "keyword_{}".format(kw2_idx),
-                    "strength": min(strength, 2.0),  # 최대 강도 제한
-                    "width": max(1, min(4, strength * 1.5)),  # 선 두께
-                    "type": "keyword_relation"
-                })
+        for kw1_idx, kw2_idx in np.argwhere(np.triu(cooccurrence, k=1) > 0.4):
+            strength = float(cooccurrence[kw1_idx, kw2_idx])
+            links.append({
+                "source": "keyword_{}".format(kw1_idx),
+                "target": "keyword_{}".format(kw2_idx),
+                "strength": min(strength, 2.0),  # 최대 강도 제한
+                "width": max(1, min(4, strength * 1.5)),  # 선 두께
+                "type": "keyword_relation"
+            })
         
         # 추가: 유사한 키워드들 간 연결 (편집 거리 기반)
-        import difflib
-        for i in range(len(keywords[:25])):
-            for j in range(i+1, len(keywords[:25])):
-                kw1 = keywords[i]["keyword"]
-                kw2 = keywords[j]["keyword"]
+        for i in range(len(top_keywords)):
+            kw1 = keyword_texts[i]
+            if len(kw1) <= 2:
+                continue
+            matcher = difflib.SequenceMatcher(None, kw1)
+            for j in range(i+1, len(top_keywords)):
+                kw2 = keyword_texts[j]
+                if len(kw2) <= 2:
+                    continue
                 
-                # 문자열 유사도 계산
-                similarity = difflib.SequenceMatcher(None, kw1, kw2).ratio()
+                # 문자열 유사도 계산 (상한값으로 먼저 걸러내어 전체 비교 횟수 절감)
+                matcher.set_seq2(kw2)
+                if matcher.real_quick_ratio() <= 0.7 or matcher.quick_ratio() <= 0.7:
+                    continue
+                similarity = matcher.ratio()
                 
                 # 높은 유사도의 키워드들 연결 (예: "네이버"와 "네이버는")
-                if similarity > 0.7 and len(kw1) > 2 and len(kw2) > 2:
-                    combined_weight = (keywords[i]["weight"] + keywords[j]["weight"]) / 2
+                if similarity > 0.7:
+                    combined_weight = (top_keywords[i]["weight"] + top_keywords[j]["weight"]) / 2
                     
                     links.append({
                         "source": "keyword_{}".format(i),
@@ -530,52 +934,14 @@ class BriefingService:
             "links": links
         }
     
-    def _classify_entity(self, keyword: str) -> tuple[str, str]:
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _classify_entity(keyword: str) -> Tuple[str, str]:
         """키워드를 엔티티 타입별로 분류합니다."""
-        import re
-        
-        # 인물 패턴 (한국 이름, 외국 이름)
-        person_patterns = [
-            r'[가-힣]{2,3}(?:회장|대표|사장|부사장|상무|이사|부장|차장|과장|팀장|실장|본부장)',
-            r'[가-힣]{2,3}(?:대통령|총리|장관|차관|국장|과장|청장|원장)',
-            r'[가-힣]{2,3}(?:교수|박사|연구원|전문가|애널리스트)',
-            r'[가-힣]{2,3}(?:의원|국회의원|시장|도지사|구청장)',
-            r'[A-Z][a-z]+\s+[A-Z][a-z]+',  # 영문 이름
-            r'[가-힣]{2,4}(?:\s+[가-힣]{1,2})?(?:씨|님)?$'  # 일반 한국 이름
-        ]
-        
-        # 장소 패턴
-        location_patterns = [
-            r'[가-힣]+(?:시|도|군|구|읍|면|동|리)$',
-            r'[가-힣]+(?:역|공항|항만|항구|터미널|센터|빌딩|타워)$',
-            r'(?:서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)',
-            r'(?:미국|중국|일본|독일|프랑스|영국|이탈리아|스페인|러시아|인도|브라질)',
-            r'[가-힣]+(?:대학교|대학|학교|병원|연구소)$'
-        ]
-        
-        # 기관/조직 패턴
-        organization_patterns = [
-            r'[가-힣]+(?:부|청|처|원|공사|공단|공기업)$',
-            r'[가-힣]+(?:회사|기업|그룹|계열|법인|협회|조합|단체)$',
-            r'[가-힣]+(?:은행|증권|보험|카드|금융|투자|자산운용)$',
-            r'[가-힣]+(?:전자|화학|제약|건설|통신|IT|바이오|에너지)$',
-            r'(?:삼성|LG|현대|SK|롯데|한화|포스코|KT|네이버|카카오)',
-            r'[A-Z]{2,}(?:[a-z]*)?',  # 대문자 약어 (예: IBM, CEO, AI)
-            r'[가-힣]+(?:정부|국회|법원|검찰|경찰|군|해군|공군|육군)$'
-        ]
-        
-        # 패턴 매칭을 통한 분류
-        for pattern in person_patterns:
-            if re.search(pattern, keyword):
-                return "person", "person"
-        
-        for pattern in location_patterns:
-            if re.search(pattern, keyword):
-                return "location", "location"
-        
-        for pattern in organization_patterns:
-            if re.search(pattern, keyword):
-                return "organization", "organization"
+        # 패턴 매칭을 통한 분류 (인물 → 장소 → 기관 순)
+        for pattern, classification in _ENTITY_CLASSIFIERS:
+            if pattern.search(keyword):
+                return classification
         
         # 기본값: 일반 키워드
-        return "keyword", "keyword"
\ No newline at end of file
+        return "keyword", "keyword"
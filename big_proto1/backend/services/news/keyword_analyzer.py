@@ -4,7 +4,30 @@
 키워드 추출, 분석, 그룹화 및 정제 기능을 제공합니다.
 """
 
-from typing import List, Dict, Tuple, Any, Set
+import re
+from functools import lru_cache
+from typing import List, Dict, Tuple, Any, Set, Iterable
+
+
+class _TermMatcher:
+    """참조 용어 집합과 키워드 간 부분 문자열 포함 관계 검사기
+
+    키워드 k와 용어 t에 대해 `t in k or k in t` 인 용어가 하나라도 있는지를
+    용어 수만큼의 파이썬 반복 없이 검사합니다.
+    """
+    __slots__ = ("terms", "joined", "pattern")
+
+    def __init__(self, terms: Iterable[str]):
+        lowered = sorted({term.lower() for term in terms}, key=len, reverse=True)
+        self.terms = frozenset(lowered)
+        # k in t: 구분자로 이어 붙인 문자열에서 한 번에 검색
+        self.joined = "\x00".join(lowered)
+        # t in k: 모든 용어의 alternation 정규식으로 한 번에 검색
+        self.pattern = re.compile("|".join(re.escape(term) for term in lowered))
+
+    def matches(self, k: str) -> bool:
+        return k in self.terms or k in self.joined or self.pattern.search(k) is not None
+
 
 class KeywordAnalyzer:
     """키워드 분석 및 그룹화 기능 제공 클래스"""
@@ -37,6 +60,14 @@ class KeywordAnalyzer:
         "실리콘밸리", "선전", "상하이", "베이징", "도쿄", "런던", "파리", "베를린"
     }
     
+    # 그룹 분류 순서대로 (그룹명, 매처)
+    _GROUP_MATCHERS: Tuple[Tuple[str, _TermMatcher], ...] = (
+        ("기업_관련", _TermMatcher(COMPANIES)),
+        ("산업_관련", _TermMatcher(INDUSTRIES)),
+        ("전략_관련", _TermMatcher(STRATEGIES)),
+        ("지역_관련", _TermMatcher(REGIONS)),
+    )
+    
     @staticmethod
     def extract_keywords_from_questions(questions: List[str]) -> List[str]:
         """질문에서 핵심 키워드 추출 함수
@@ -94,26 +125,11 @@ class KeywordAnalyzer:
             "기타": []
         }
         
-        # 키워드 분류
+        # 키워드 분류 (기업 → 산업 → 전략 → 지역 순, 해당 없으면 기타)
         for keyword in keywords:
             # 소문자 변환 및 공백 제거
-            k = keyword.lower().strip()
-            
-            # 기업 관련 키워드 분류
-            if any(company.lower() in k or k in company.lower() for company in cls.COMPANIES):
-                keyword_groups["기업_관련"].append(keyword)
-            # 산업 관련 키워드 분류
-            elif any(industry.lower() in k or k in industry.lower() for industry in cls.INDUSTRIES):
-                keyword_groups["산업_관련"].append(keyword)
-            # 전략 관련 키워드 분류
-            elif any(strategy.lower() in k or k in strategy.lower() for strategy in cls.STRATEGIES):
-                keyword_groups["전략_관련"].append(keyword)
-            # 지역 관련 키워드 분류
-            elif any(region.lower() in k or k in region.lower() for region in cls.REGIONS):
-                keyword_groups["지역_관련"].append(keyword)
-            # 기타 키워드
-            else:
-                keyword_groups["기타"].append(keyword)
+            group = cls._classify_keyword(keyword.lower().strip())
+            keyword_groups[group].append(keyword)
         
         # 각 그룹 내에서 원문 언급 빈도 기준으로 정렬
         for group, group_keywords in keyword_groups.items():
@@ -122,6 +138,15 @@ class KeywordAnalyzer:
         
         return keyword_groups
     
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _classify_keyword(cls, k: str) -> str:
+        """정규화된 키워드의 그룹명 반환"""
+        for group, matcher in cls._GROUP_MATCHERS:
+            if matcher.matches(k):
+                return group
+        return "기타"
+    
     @staticmethod
     def remove_duplicates(keywords: List[str]) -> List[str]:
         """중복 키워드 제거 함수
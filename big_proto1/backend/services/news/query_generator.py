@@ -4,7 +4,38 @@
 키워드 그룹을 기반으로 최적화된 검색 쿼리를 생성하는 모듈입니다.
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
+
+# 검색 쿼리 명세: 각 쿼리는 (키워드 그룹, 상위 k개) 조각들을 AND로 결합
+# (k == 1이면 대표 키워드 하나, k > 1이면 상위 k개를 OR로 묶은 괄호 조건)
+_QUERY_SPECS: Tuple[Tuple[Tuple[str, int], ...], ...] = (
+    # 전략 1: 기업 키워드 중심 정밀 검색
+    (("기업_관련", 1), ("산업_관련", 2)),
+    (("기업_관련", 1), ("전략_관련", 2)),
+    (("기업_관련", 1), ("산업_관련", 1), ("전략_관련", 1)),
+    # 전략 2: 산업 키워드 중심 포괄 검색
+    (("산업_관련", 1), ("기업_관련", 3)),
+    (("산업_관련", 1), ("전략_관련", 1)),
+    # 전략 3: 지역과 전략/산업 키워드 조합
+    (("지역_관련", 1), ("산업_관련", 1)),
+    (("지역_관련", 1), ("전략_관련", 1)),
+    (("지역_관련", 1), ("기업_관련", 1)),
+    # 전략 4: 복합 OR 조건을 활용한 포괄적 검색
+    (("기업_관련", 2), ("산업_관련", 2)),
+)
+
+# 그룹별 비트 플래그 (기사마다 비어 있지 않은 그룹을 비트마스크 하나로 표현)
+_GROUP_BITS: Dict[str, int] = {
+    "기업_관련": 1 << 0,
+    "산업_관련": 1 << 1,
+    "전략_관련": 1 << 2,
+    "지역_관련": 1 << 3,
+}
+
+# 쿼리 명세별 필요 그룹 마스크
+_QUERY_MASKS: Tuple[Tuple[int, Tuple[Tuple[str, int], ...]], ...] = tuple(
+    (sum({_GROUP_BITS[group] for group, _ in spec}), spec) for spec in _QUERY_SPECS
+)
 
 class QueryGenerator:
     """검색 쿼리 생성 클래스"""
@@ -19,81 +50,30 @@ class QueryGenerator:
         Returns:
             최적화된 검색 쿼리 목록
         """
-        optimized_queries = []
-        
-        # 모든 그룹에서 최소 하나의 키워드가 있는지 확인
-        has_company = len(keyword_groups["기업_관련"]) > 0
-        has_industry = len(keyword_groups["산업_관련"]) > 0
-        has_strategy = len(keyword_groups["전략_관련"]) > 0
-        has_region = len(keyword_groups["지역_관련"]) > 0
+        # 검색어 조각 캐시: (그룹, 상위 k개) → 렌더링된 조각
+        terms: Dict[Tuple[str, int], str] = {}
         
-        # 전략 1: 기업 키워드 중심 정밀 검색
-        if has_company:
-            main_company = keyword_groups["기업_관련"][0]  # 가장 중요한 기업
-            
-            # 산업 키워드가 있는 경우
-            if has_industry:
-                industry_terms = " OR ".join(keyword_groups["산업_관련"][:2])
-                query = f"{main_company} AND ({industry_terms})"
-                optimized_queries.append(query)
-            
-            # 전략 키워드가 있는 경우
-            if has_strategy:
-                strategy_terms = " OR ".join(keyword_groups["전략_관련"][:2])
-                query = f"{main_company} AND ({strategy_terms})"
-                optimized_queries.append(query)
-            
-            # 산업 + 전략 키워드 조합
-            if has_industry and has_strategy:
-                industry_term = keyword_groups["산업_관련"][0]
-                strategy_term = keyword_groups["전략_관련"][0]
-                query = f"{main_company} AND {industry_term} AND {strategy_term}"
-                optimized_queries.append(query)
+        def render(group: str, top_k: int) -> str:
+            term = terms.get((group, top_k))
+            if term is None:
+                keywords = keyword_groups[group]
+                # 상위 1개는 그대로, 2개 이상은 OR 조건으로 묶음
+                term = keywords[0] if top_k == 1 else f"({' OR '.join(keywords[:top_k])})"
+                terms[(group, top_k)] = term
+            return term
         
-        # 전략 2: 산업 키워드 중심 포괄 검색
-        if has_industry:
-            main_industry = keyword_groups["산업_관련"][0]  # 가장 중요한 산업
-            
-            # 기업 키워드가 있는 경우
-            if has_company:
-                company_terms = " OR ".join(keyword_groups["기업_관련"][:3])
-                query = f"{main_industry} AND ({company_terms})"
-                optimized_queries.append(query)
-            
-            # 전략 키워드가 있는 경우
-            if has_strategy:
-                strategy_term = keyword_groups["전략_관련"][0]
-                query = f"{main_industry} AND {strategy_term}"
-                optimized_queries.append(query)
-        
-        # 전략 3: 지역과 전략/산업 키워드 조합
-        if has_region:
-            main_region = keyword_groups["지역_관련"][0]
-            
-            # 산업 키워드가 있는 경우
-            if has_industry:
-                main_industry = keyword_groups["산업_관련"][0]
-                query = f"{main_region} AND {main_industry}"
-                optimized_queries.append(query)
-            
-            # 전략 키워드가 있는 경우
-            if has_strategy:
-                main_strategy = keyword_groups["전략_관련"][0]
-                query = f"{main_region} AND {main_strategy}"
-                optimized_queries.append(query)
-            
-            # 기업 키워드가 있는 경우
-            if has_company:
-                main_company = keyword_groups["기업_관련"][0]
-                query = f"{main_region} AND {main_company}"
-                optimized_queries.append(query)
+        # 비어 있지 않은 그룹을 한 번만 확인해 비트마스크로 구성
+        flags = 0
+        for group, bit in _GROUP_BITS.items():
+            if keyword_groups[group]:
+                flags |= bit
         
-        # 전략 4: 복합 OR 조건을 활용한 포괄적 검색
-        if has_company and has_industry:
-            top_companies = " OR ".join(keyword_groups["기업_관련"][:2])
-            top_industries = " OR ".join(keyword_groups["산업_관련"][:2])
-            query = f"({top_companies}) AND ({top_industries})"
-            optimized_queries.append(query)
+        # 필요한 그룹이 모두 비어 있지 않은 쿼리 명세만 AND로 결합
+        optimized_queries = [
+            " AND ".join(render(group, top_k) for group, top_k in spec)
+            for mask, spec in _QUERY_MASKS
+            if flags & mask == mask
+        ]
         
         # 생성된 쿼리가 없는 경우
         if not optimized_queries:
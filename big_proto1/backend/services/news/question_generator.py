@@ -4,88 +4,135 @@
 뉴스 기사 및 키워드 기반으로 연관 질문을 생성하는 모듈입니다.
 """
 
-from typing import List, Dict, Tuple, Any, Set
+from typing import List, Dict, Tuple, Any, Callable, Set, FrozenSet, Mapping, Optional
+from types import MappingProxyType
 import logging
+import re
+import string
 from .keyword_analyzer import KeywordAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# 질문 생성에 쓰이는 본문 단서어 (기사당 한 번만 검사)
+_PROBES: FrozenSet[str] = frozenset({
+    "AI", "인공지능", "기술", "투자", "변화", "제품", "올해",
+    "정책", "소비자", "규제", "위기", "디지털", "점유율"
+})
+
+# 투자 금액 표현 ('조'/'억'이 포함된 공백 구분 단어)
+_AMOUNT_RE = re.compile(r"\S*[조억]\S*")
+
+
+def _compile_template(template: str) -> Tuple[FrozenSet[str], Callable[[Mapping[str, str]], str]]:
+    """템플릿을 전용 채우기 함수로 변환
+    
+    "{company}가 {market}에 ..." 형태의 템플릿을 f-string 한 번으로 값을 채우는
+    함수로 컴파일해, 질문 생성 때마다 템플릿을 다시 파싱하지 않도록 합니다.
+    
+    Args:
+        template: 질문 템플릿
+        
+    Returns:
+        (템플릿이 참조하는 변수명 집합, 변수 사전을 받아 채워진 문자열을 반환하는 함수)
+    """
+    parts = []
+    variables = set()
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field is not None:
+            if not field.isidentifier() or format_spec or conversion:
+                raise ValueError(f"지원하지 않는 템플릿 필드: {template!r}")
+            variables.add(field)
+            parts.append(f'f"{{v[{field!r}]}}"')
+    # 인접한 문자열/f-string 리터럴은 컴파일 시 하나의 f-string으로 합쳐짐
+    filler = eval(f"lambda v: {' '.join(parts) or repr('')}", {})
+    return frozenset(variables), filler
+
 class QuestionGenerator:
     """연관 질문 생성 클래스"""
     
-    @staticmethod
-    def create_question_templates() -> Dict[str, List[str]]:
+    # 질문 템플릿 (클래스 정의 시 한 번만 생성, 읽기 전용)
+    _TEMPLATES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+        # 비즈니스 전략 관련 질문
+        "business_strategy": (
+            "{company}가 {market}에 진출하는 전략적 의미는 무엇인가요?",
+            "{company}의 {action}은 어떤 사업적 효과를 가져올까요?",
+            "{company}가 {sector}에 {amount} 투자하는 이유는 무엇인가요?",
+            "{keyword1}와 {keyword2} 사이의 관계가 {industry}에 미치는 영향은?",
+            "{company}의 {strategy} 전략이 경쟁사와 비교해 가지는 강점은?"
+        ),
+        
+        # 시장 트렌드 관련 질문
+        "market_trend": (
+            "{industry} 시장의 성장 가능성은 어느 정도인가요?",
+            "{keyword}의 글로벌 트렌드는 어떻게 변화하고 있나요?",
+            "{market} 시장에서 한국 기업들의 경쟁력은 어떤가요?",
+            "{country}의 {industry} 시장이 한국 기업에 주는 기회는?",
+            "{keyword} 관련 기술의 미래 전망은 어떻게 될까요?"
+        ),
+        
+        # 기업 특화 질문
+        "company_specific": (
+            "{company}의 {action}이 회사 주가에 미칠 영향은?",
+            "{company}는 {challenge}에 어떻게 대응하고 있나요?",
+            "{company}와 {competitor} 간의 경쟁 구도는 어떻게 전개될까요?",
+            "{company}의 {technology} 기술 개발 현황은 어떻게 되나요?",
+            "{company}의 {region} 시장 점유율 확대 전략은 무엇인가요?"
+        ),
+        
+        # 비교 분석 질문
+        "comparison": (
+            "{company1}와 {company2}의 {industry} 시장 점유율 차이는 어떻게 되나요?",
+            "{keyword1}과 {keyword2} 기술의 차이점과 각각의 장단점은 무엇인가요?",
+            "{company}의 {product}와 경쟁사 제품을 비교했을 때 차별점은 무엇인가요?",
+            "{region1}과 {region2} 시장에서 {industry} 산업의 성장 패턴 차이는 무엇인가요?",
+            "{strategy1}과 {strategy2} 전략 중 {industry} 산업에 더 효과적인 것은 무엇인가요?"
+        ),
+        
+        # 시간적 흐름 질문
+        "timeline": (
+            "{company}의 {strategy} 전략은 지난 {time_period} 동안 어떻게 변화했나요?",
+            "{industry} 시장의 {time_period} 성장 추이는 어떤 패턴을 보이나요?",
+            "{company}가 {action}을 결정하기까지의 배경과 과정은 어떻게 되나요?",
+            "{event} 이후 {industry} 산업은 어떻게 변화했나요?",
+            "향후 {time_period} 동안 {keyword} 관련 시장은 어떻게 발전할 것으로 전망되나요?"
+        ),
+        
+        # 영향 분석 질문
+        "impact": (
+            "{event}가 {industry} 산업에 미치는 장단기적 영향은 무엇인가요?",
+            "{company}의 {action}이 {stakeholder}에게 어떤 영향을 미칠까요?",
+            "{policy}가 {market} 시장 구조에 어떤 변화를 가져올 것으로 예상되나요?",
+            "{technology}의 발전이 {industry} 산업의 일자리에 미치는 영향은 무엇인가요?",
+            "{crisis}가 {industry} 산업의 공급망에 미친 영향과 대응 전략은 무엇인가요?"
+        ),
+        
+        # 예측 질문
+        "prediction": (
+            "{industry} 시장은 향후 {time_period} 동안 어떻게 발전할 것으로 전망되나요?",
+            "{company}의 {technology} 기술 개발이 성공한다면 어떤 새로운 시장이 열릴까요?",
+            "{trend}의 확산으로 {industry} 산업은 어떤 방향으로 재편될 것으로 예상되나요?",
+            "{country}의 {policy} 정책이 글로벌 {industry} 시장에 어떤 영향을 미칠까요?",
+            "{company}가 {goal}을 달성하기 위해 어떤 전략을 수립해야 할까요?"
+        )
+    })
+    
+    # (카테고리, 템플릿이 참조하는 변수명 집합, 채우기 함수) - 템플릿 파싱/컴파일은 한 번만 수행
+    _TEMPLATE_FILLERS: Tuple[Tuple[str, FrozenSet[str], Callable[[Mapping[str, str]], str]], ...] = tuple(
+        (category, *_compile_template(template))
+        for category, template_list in _TEMPLATES.items()
+        for template in template_list
+    )
+    
+    @classmethod
+    def create_question_templates(cls) -> Mapping[str, Tuple[str, ...]]:
         """질문 템플릿 정의 함수
         
         Returns:
-            질문 템플릿 사전
+            질문 템플릿 사전 (읽기 전용)
         """
-        templates = {
-            # 비즈니스 전략 관련 질문
-            "business_strategy": [
-                "{company}가 {market}에 진출하는 전략적 의미는 무엇인가요?",
-                "{company}의 {action}은 어떤 사업적 효과를 가져올까요?",
-                "{company}가 {sector}에 {amount} 투자하는 이유는 무엇인가요?",
-                "{keyword1}와 {keyword2} 사이의 관계가 {industry}에 미치는 영향은?",
-                "{company}의 {strategy} 전략이 경쟁사와 비교해 가지는 강점은?"
-            ],
-            
-            # 시장 트렌드 관련 질문
-            "market_trend": [
-                "{industry} 시장의 성장 가능성은 어느 정도인가요?",
-                "{keyword}의 글로벌 트렌드는 어떻게 변화하고 있나요?",
-                "{market} 시장에서 한국 기업들의 경쟁력은 어떤가요?",
-                "{country}의 {industry} 시장이 한국 기업에 주는 기회는?",
-                "{keyword} 관련 기술의 미래 전망은 어떻게 될까요?"
-            ],
-            
-            # 기업 특화 질문
-            "company_specific": [
-                "{company}의 {action}이 회사 주가에 미칠 영향은?",
-                "{company}는 {challenge}에 어떻게 대응하고 있나요?",
-                "{company}와 {competitor} 간의 경쟁 구도는 어떻게 전개될까요?",
-                "{company}의 {technology} 기술 개발 현황은 어떻게 되나요?",
-                "{company}의 {region} 시장 점유율 확대 전략은 무엇인가요?"
-            ],
-            
-            # 비교 분석 질문
-            "comparison": [
-                "{company1}와 {company2}의 {industry} 시장 점유율 차이는 어떻게 되나요?",
-                "{keyword1}과 {keyword2} 기술의 차이점과 각각의 장단점은 무엇인가요?",
-                "{company}의 {product}와 경쟁사 제품을 비교했을 때 차별점은 무엇인가요?",
-                "{region1}과 {region2} 시장에서 {industry} 산업의 성장 패턴 차이는 무엇인가요?",
-                "{strategy1}과 {strategy2} 전략 중 {industry} 산업에 더 효과적인 것은 무엇인가요?"
-            ],
-            
-            # 시간적 흐름 질문
-            "timeline": [
-                "{company}의 {strategy} 전략은 지난 {time_period} 동안 어떻게 변화했나요?",
-                "{industry} 시장의 {time_period} 성장 추이는 어떤 패턴을 보이나요?",
-                "{company}가 {action}을 결정하기까지의 배경과 과정은 어떻게 되나요?",
-                "{event} 이후 {industry} 산업은 어떻게 변화했나요?",
-                "향후 {time_period} 동안 {keyword} 관련 시장은 어떻게 발전할 것으로 전망되나요?"
-            ],
-            
-            # 영향 분석 질문
-            "impact": [
-                "{event}가 {industry} 산업에 미치는 장단기적 영향은 무엇인가요?",
-                "{company}의 {action}이 {stakeholder}에게 어떤 영향을 미칠까요?",
-                "{policy}가 {market} 시장 구조에 어떤 변화를 가져올 것으로 예상되나요?",
-                "{technology}의 발전이 {industry} 산업의 일자리에 미치는 영향은 무엇인가요?",
-                "{crisis}가 {industry} 산업의 공급망에 미친 영향과 대응 전략은 무엇인가요?"
-            ],
-            
-            # 예측 질문
-            "prediction": [
-                "{industry} 시장은 향후 {time_period} 동안 어떻게 발전할 것으로 전망되나요?",
-                "{company}의 {technology} 기술 개발이 성공한다면 어떤 새로운 시장이 열릴까요?",
-                "{trend}의 확산으로 {industry} 산업은 어떤 방향으로 재편될 것으로 예상되나요?",
-                "{country}의 {policy} 정책이 글로벌 {industry} 시장에 어떤 영향을 미칠까요?",
-                "{company}가 {goal}을 달성하기 위해 어떤 전략을 수립해야 할까요?"
-            ]
-        }
-        
-        return templates
+        return cls._TEMPLATES
     
     @classmethod
     def generate_questions_from_article(
@@ -118,12 +165,21 @@ class QuestionGenerator:
         
         questions = []
         
+        # 본문에 등장하는 단서어 (전략 반복문과 템플릿 변수 준비에서 공유)
+        probe_hits = {probe for probe in _PROBES if probe in content}
+        
+        # 그룹별로 본문에 등장하는 키워드를 한 번만 계산 (반복문마다 본문을 다시 스캔하지 않음)
+        in_content = {
+            group: {keyword for keyword in group_keywords if keyword in content}
+            for group, group_keywords in keyword_groups.items()
+        }
+        
         # 1. 기업별 특화 질문 생성
         for company in keyword_groups["기업_관련"]:
-            if company in title or company in content:
+            if company in in_content["기업_관련"] or company in title:
                 # 기업-산업 관련 질문
                 for industry in keyword_groups["산업_관련"]:
-                    if industry in content:
+                    if industry in in_content["산업_관련"]:
                         questions.append(
                             f"{company}의 {industry} 사업 전략은 어떻게 발전하고 있나요?"
                         )
@@ -131,7 +187,7 @@ class QuestionGenerator:
                 
                 # 기업-전략 관련 질문
                 for strategy in keyword_groups["전략_관련"]:
-                    if strategy in content:
+                    if strategy in in_content["전략_관련"]:
                         questions.append(
                             f"{company}의 {strategy} 결정이 가져올 시장 변화는 무엇인가요?"
                         )
@@ -139,7 +195,7 @@ class QuestionGenerator:
                 
                 # 기업 지역 진출 관련 질문
                 for region in keyword_groups["지역_관련"]:
-                    if region in content:
+                    if region in in_content["지역_관련"]:
                         questions.append(
                             f"{company}의 {region} 시장 진출 전략과 경쟁 우위는 무엇인가요?"
                         )
@@ -147,14 +203,14 @@ class QuestionGenerator:
         
         # 2. 산업 트렌드 관련 질문
         for industry in keyword_groups["산업_관련"]:
-            if industry in title or industry in content:
+            if industry in in_content["산업_관련"] or industry in title:
                 questions.append(
                     f"{industry} 산업의 최근 트렌드와 미래 전망은 어떻게 되나요?"
                 )
                 
                 # 지역-산업 관련 질문
                 for region in keyword_groups["지역_관련"]:
-                    if region in content:
+                    if region in in_content["지역_관련"]:
                         questions.append(
                             f"{region}의 {industry} 시장 성장률과 주요 성공 요인은 무엇인가요?"
                         )
@@ -162,121 +218,110 @@ class QuestionGenerator:
         
         # 3. 기술 및 전략 관련 질문
         for strategy in keyword_groups["전략_관련"]:
-            if strategy in title or strategy in content:
+            if strategy in in_content["전략_관련"] or strategy in title:
                 # 기술 전략 질문
-                if "기술" in content or "기술" in strategy:
+                if "기술" in probe_hits or "기술" in strategy:
                     questions.append(
                         f"{strategy} 기술 개발이 산업 생태계에 미치는 영향은 무엇인가요?"
                     )
                 
                 # 투자 전략 질문
-                if "투자" in strategy or "투자" in content:
-                    amount = "대규모"
-                    for word in content.split():
-                        if "조" in word or "억" in word:
-                            amount = word
-                            break
+                if "투자" in strategy or "투자" in probe_hits:
+                    # 본문에서 '조'/'억'이 포함된 첫 단어를 투자 규모로 사용
+                    match = _AMOUNT_RE.search(content)
+                    amount = match.group(0) if match else "대규모"
                     
                     questions.append(
                         f"{amount} 규모의 투자가 시장에 미치는 파급 효과는 무엇인가요?"
                     )
         
         # 4. 템플릿 기반 질문 생성
-        templates = cls.create_question_templates()
-        
         # 변수 값 사전 준비
         template_variables = cls._prepare_template_variables(
-            keyword_groups, top_keywords, content
+            keyword_groups, top_keywords, content, probe_hits
         )
         
-        # 템플릿에 변수 값 채우기
-        for category, template_list in templates.items():
-            for template in template_list:
-                filled_template = template
-                
-                # 모든 변수 채우기
-                for var, value in template_variables.items():
-                    if var in filled_template:
-                        if value:
-                            filled_template = filled_template.replace(var, value)
-                        else:
-                            # 값이 없는 변수가 있으면 이 템플릿은 건너뜀
-                            filled_template = ""
-                            break
-                
-                # 모든 변수가 채워진 경우에만 질문 추가
-                if filled_template and "{" not in filled_template and "}" not in filled_template:
-                    questions.append(filled_template)
+        # 템플릿에 변수 값 채우기 (값이 없는 변수가 있으면 이 템플릿은 건너뜀)
+        empty_vars = {var for var, value in template_variables.items() if not value}
+        for category, required_vars, fill in cls._TEMPLATE_FILLERS:
+            if required_vars.isdisjoint(empty_vars):
+                questions.append(fill(template_variables))
         
         # 5. 특성 기반 직접 질문 생성
         title_features = [f[0] for f in features["title"][:3]] if "title" in features else []
         content_features = [f[0] for f in features["content"][:5]] if "content" in features else []
         
+        # 그룹 소속 여부를 리스트 탐색 대신 집합 조회로 확인
+        # (한 키워드가 여러 그룹에 속할 수 있어 그룹별 우선순위를 그대로 유지)
+        group_sets = {group: set(group_keywords) for group, group_keywords in keyword_groups.items()}
+        
         for feature in title_features:
-            if feature in keyword_groups["기업_관련"]:
+            if feature in group_sets["기업_관련"]:
                 questions.append(f"{feature}의 최근 경영 전략 변화는 무엇인가요?")
-            elif feature in keyword_groups["산업_관련"]:
+            elif feature in group_sets["산업_관련"]:
                 questions.append(f"{feature} 산업의 주요 성장 동력과 도전 과제는 무엇인가요?")
         
         for feature in content_features:
             if feature not in title_features and len(feature) > 1:
-                if feature in keyword_groups["전략_관련"]:
+                if feature in group_sets["전략_관련"]:
                     questions.append(f"{feature} 전략이 기업 경쟁력에 미치는 영향은 무엇인가요?")
-                elif feature in keyword_groups["지역_관련"]:
+                elif feature in group_sets["지역_관련"]:
                     questions.append(f"{feature} 지역의 시장 특성과 진출 전략은 어떻게 되나요?")
         
-        # 중복 제거 및 정리
-        unique_questions = list(set(questions))
-        
-        # 너무 짧은 질문 제외
-        final_questions = [q for q in unique_questions if len(q) > 15]
+        # 중복 제거 (생성 순서 유지) 및 너무 짧은 질문 제외
+        final_questions = list(dict.fromkeys(q for q in questions if len(q) > 15))
         
         # 최대 10개 질문만 반환
         return final_questions[:10]
     
     @classmethod
     def _prepare_template_variables(cls, keyword_groups: Dict[str, List[str]], 
-                                   top_keywords: List[str], content: str) -> Dict[str, str]:
+                                   top_keywords: List[str], content: str,
+                                   probe_hits: Optional[Set[str]] = None) -> Dict[str, str]:
         """템플릿 변수 값 준비 함수
         
         Args:
             keyword_groups: 그룹화된 키워드
             top_keywords: 인기 키워드
             content: 기사 본문
+            probe_hits: 본문에 등장하는 단서어 (없으면 본문에서 계산)
             
         Returns:
             변수명과 값 매핑 사전
         """
+        if probe_hits is None:
+            probe_hits = {probe for probe in _PROBES if probe in content}
+        
         return {
-            "{company}": keyword_groups["기업_관련"][0] if keyword_groups["기업_관련"] else "",
-            "{company1}": keyword_groups["기업_관련"][0] if keyword_groups["기업_관련"] else "",
-            "{company2}": keyword_groups["기업_관련"][1] if len(keyword_groups["기업_관련"]) > 1 else "",
-            "{industry}": keyword_groups["산업_관련"][0] if keyword_groups["산업_관련"] else "",
-            "{action}": keyword_groups["전략_관련"][0] if keyword_groups["전략_관련"] else "전략",
-            "{strategy}": keyword_groups["전략_관련"][0] if keyword_groups["전략_관련"] else "사업 전략",
-            "{strategy1}": keyword_groups["전략_관련"][0] if keyword_groups["전략_관련"] else "",
-            "{strategy2}": keyword_groups["전략_관련"][1] if len(keyword_groups["전략_관련"]) > 1 else "",
-            "{region}": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "",
-            "{region1}": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "",
-            "{region2}": keyword_groups["지역_관련"][1] if len(keyword_groups["지역_관련"]) > 1 else "",
-            "{market}": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "시장",
-            "{country}": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "글로벌",
-            "{keyword}": top_keywords[0] if top_keywords else "",
-            "{keyword1}": top_keywords[0] if top_keywords else "",
-            "{keyword2}": top_keywords[1] if len(top_keywords) > 1 else "",
-            "{technology}": "AI" if "AI" in content or "인공지능" in content else "신기술",
-            "{sector}": keyword_groups["산업_관련"][0] if keyword_groups["산업_관련"] else "산업",
-            "{amount}": "대규모" if "투자" in content else "",
-            "{competitor}": keyword_groups["기업_관련"][1] if len(keyword_groups["기업_관련"]) > 1 else "경쟁사",
-            "{challenge}": "시장 변화" if "변화" in content else "경쟁 심화",
-            "{product}": "제품" if "제품" in content else "서비스",
-            "{time_period}": "1년" if "올해" in content else "5년",
-            "{event}": "정책 변화" if "정책" in content else "시장 변화",
-            "{stakeholder}": "소비자" if "소비자" in content else "투자자",
-            "{policy}": "규제" if "규제" in content else "지원 정책",
-            "{crisis}": "공급망 위기" if "위기" in content else "경제 불황",
-            "{trend}": "디지털 전환" if "디지털" in content else "기술 혁신",
-            "{goal}": "시장 점유율 확대" if "점유율" in content else "기술 경쟁력 강화"
+            "company": keyword_groups["기업_관련"][0] if keyword_groups["기업_관련"] else "",
+            "company1": keyword_groups["기업_관련"][0] if keyword_groups["기업_관련"] else "",
+            "company2": keyword_groups["기업_관련"][1] if len(keyword_groups["기업_관련"]) > 1 else "",
+            "industry": keyword_groups["산업_관련"][0] if keyword_groups["산업_관련"] else "",
+            "action": keyword_groups["전략_관련"][0] if keyword_groups["전략_관련"] else "전략",
+            "strategy": keyword_groups["전략_관련"][0] if keyword_groups["전략_관련"] else "사업 전략",
+            "strategy1": keyword_groups["전략_관련"][0] if keyword_groups["전략_관련"] else "",
+            "strategy2": keyword_groups["전략_관련"][1] if len(keyword_groups["전략_관련"]) > 1 else "",
+            "region": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "",
+            "region1": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "",
+            "region2": keyword_groups["지역_관련"][1] if len(keyword_groups["지역_관련"]) > 1 else "",
+            "market": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "시장",
+            "country": keyword_groups["지역_관련"][0] if keyword_groups["지역_관련"] else "글로벌",
+            "keyword": top_keywords[0] if top_keywords else "",
+            "keyword1": top_keywords[0] if top_keywords else "",
+            "keyword2": top_keywords[1] if len(top_keywords) > 1 else "",
+            "technology": "AI" if "AI" in probe_hits or "인공지능" in probe_hits else "신기술",
+            "sector": keyword_groups["산업_관련"][0] if keyword_groups["산업_관련"] else "산업",
+            "amount": "대규모" if "투자" in probe_hits else "",
+            "competitor": keyword_groups["기업_관련"][1] if len(keyword_groups["기업_관련"]) > 1 else "경쟁사",
+            "challenge": "시장 변화" if "변화" in probe_hits else "경쟁 심화",
+            "product": "제품" if "제품" in probe_hits else "서비스",
+            "time_period": "1년" if "올해" in probe_hits else "5년",
+            "event": "정책 변화" if "정책" in probe_hits else "시장 변화",
+            "stakeholder": "소비자" if "소비자" in probe_hits else "투자자",
+            "policy": "규제" if "규제" in probe_hits else "지원 정책",
+            "crisis": "공급망 위기" if "위기" in probe_hits else "경제 불황",
+            "trend": "디지털 전환" if "디지털" in probe_hits else "기술 혁신",
+            "goal": "시장 점유율 확대" if "점유율" in probe_hits else "기술 경쟁력 강화"
         }
     
     @staticmethod
@@ -298,6 +343,8 @@ class QuestionGenerator:
             점수가 계산된 질문 목록
         """
         scored_questions = []
+        # 이미 점수를 매긴 질문들의 단어 집합 (비교할 때마다 다시 만들지 않음)
+        scored_word_sets: List[FrozenSet[str]] = []
         
         # 제목과 본문 특성에서 키워드 추출
         title_keywords = [k[0] for k in title_features]
@@ -324,13 +371,15 @@ class QuestionGenerator:
                 score *= 0.9
             
             # 질문 다양성 보정 (이미 추가된 질문과 유사한 경우 점수 감소)
-            for existing_question, _ in scored_questions:
-                similarity = QuestionGenerator._calculate_similarity(question, existing_question)
-                if similarity > 0.7:  # 높은 유사도
-                    score *= 0.8
-                    break
+            words = frozenset(question.lower().split())
+            if any(
+                QuestionGenerator._is_similar(words, existing_words, 0.7)  # 높은 유사도
+                for existing_words in scored_word_sets
+            ):
+                score *= 0.8
             
             scored_questions.append((question, score))
+            scored_word_sets.append(words)
         
         # 점수 기준으로 정렬
         scored_questions.sort(key=lambda x: x[1], reverse=True)
@@ -349,16 +398,30 @@ class QuestionGenerator:
             유사도 점수 (0~1)
         """
         # 간단한 자카드 유사도 계산
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
+        return QuestionGenerator._word_set_similarity(
+            frozenset(text1.lower().split()), frozenset(text2.lower().split())
+        )
+    
+    @staticmethod
+    def _is_similar(words1: FrozenSet[str], words2: FrozenSet[str], threshold: float) -> bool:
+        """두 단어 집합의 자카드 유사도가 threshold를 넘는지 여부
+        
+        자카드 유사도는 작은 집합 크기 / 큰 집합 크기를 넘을 수 없으므로
+        크기 비율만으로 탈락하는 쌍은 교집합을 계산하지 않습니다.
+        """
+        len1, len2 = len(words1), len(words2)
+        if min(len1, len2) <= threshold * max(len1, len2):
+            return False
+        return QuestionGenerator._word_set_similarity(words1, words2) > threshold
+    
+    @staticmethod
+    def _word_set_similarity(words1: FrozenSet[str], words2: FrozenSet[str]) -> float:
+        """두 단어 집합 간의 자카드 유사도 (0~1)"""
+        if not words1 and not words2:
+            return 0
         
         # 교집합 크기
-        intersection = len(words1.intersection(words2))
+        intersection = len(words1 & words2)
         
         # 합집합 크기
-        union = len(words1.union(words2))
-        
-        if union == 0:
-            return 0
-        
-        return intersection / union 
\ No newline at end of file
+        return intersection / (len(words1) + len(words2) - intersection) 
\ No newline at end of file
@@ -6,8 +6,11 @@ Perplexity AI API 클라이언트
 import os
 import sys
 import asyncio
+import hashlib
+import json
 import aiohttp
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 from pathlib import Path
 
 # 프로젝트 루트 디렉토리 찾기
@@ -15,9 +18,67 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from backend.utils.logger import setup_logger
+from backend.utils.redis_cache import async_cache_get, async_cache_mget, async_cache_set
+from backend.utils.memory_cache import MemoryCacheBackend
 
 logger = setup_logger("services.perplexity")
 
+
+class PerplexityRetryableError(Exception):
+    """재시도 가능한 Perplexity API 응답 (429, 5xx)"""
+
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"Perplexity API 일시 오류: {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 단위)를 대기 시간으로 변환 (없거나 잘못된 값이면 None → 지수 백오프)"""
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return None
+
+
+_default_retry_wait = wait_exponential_jitter(initial=1, max=8)
+
+
+def _wait_retry_after(retry_state) -> float:
+    """429 응답의 Retry-After가 있으면 그만큼, 없으면 지수 백오프(지터 포함)로 대기"""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return _default_retry_wait(retry_state)
+
+# 공유 세션 설정 (요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 커넥션 재사용)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# 스트리밍 응답은 전체 시간 대신 청크 간 대기 시간만 제한
+STREAM_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=10)
+CONNECTOR_LIMIT = 32
+# 동시에 진행할 수 있는 최대 API 요청 수
+MAX_CONCURRENT_REQUESTS = 8
+
+# 일시적 오류(429/5xx, 연결 오류, 타임아웃) 재시도 설정
+MAX_REQUEST_ATTEMPTS = 3
+MAX_RETRY_AFTER = 8  # Retry-After 헤더를 따르되 최대 대기 시간(초)
+
+# 프롬프트 해시 기반 응답 캐시 유효 시간(초)
+TERM_CACHE_TTL = 86400           # 용어 정의는 거의 변하지 않음
+EVENT_CACHE_TTL = 3600
+STOCK_ANALYSIS_CACHE_TTL = 600
+MARKET_SUMMARY_CACHE_TTL = 300   # 시장 요약은 시간에 민감
+# 프로세스 내 응답 캐시 크기 (Redis 앞단에서 같은 요청을 네트워크 없이 처리)
+LOCAL_CACHE_SIZE = 1024
+
+# 메서드별 최대 생성 토큰 수 (프롬프트가 요구하는 답변 길이에 맞춰 생성 시간을 줄임)
+DEFAULT_MAX_TOKENS = 300
+TERM_MAX_TOKENS = 250            # 3개 항목, 항목당 1-2문장
+EVENT_MAX_TOKENS = 300
+STOCK_ANALYSIS_MAX_TOKENS = 200  # 2-3문장
+MARKET_SUMMARY_MAX_TOKENS = 400  # 여러 항목 요약
+
 class PerplexityClient:
     """Perplexity AI API 클라이언트"""
     
@@ -36,38 +97,45 @@ class PerplexityClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._local_cache = MemoryCacheBackend(LOCAL_CACHE_SIZE)
+        # 진행 중인 동일 요청 (캐시 키 → 응답 Future), 동시 요청은 한 번만 전송
+        self._inflight: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+    
+    async def _init_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 초기화 (첫 요청 시 생성)"""
+        if not self.session or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=CONNECTOR_LIMIT, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=REQUEST_TIMEOUT,
+                connector=connector
+            )
+        return self.session
+    
+    async def close(self):
+        """HTTP 세션 종료"""
+        if self.session and not self.session.closed:
+            await self.session.close()
     
-    async def explain_financial_term(self, term: str, context: str = "") -> Dict[str, Any]:
+    async def explain_financial_term(
+        self, term: str, context: str = "", cache_ttl: int = TERM_CACHE_TTL
+    ) -> Dict[str, Any]:
         """금융 용어나 개념을 간단하게 설명
         
         Args:
             term: 설명할 용어
             context: 추가 맥락 정보
+            cache_ttl: 응답 캐시 유효 시간(초), 0이면 캐싱하지 않음
             
         Returns:
             설명 결과 딕셔너리
         """
         try:
-            prompt = f"""
-            한국 주식 투자자를 위해 '{term}' 용어를 쉽고 실용적으로 설명해주세요.
-            {f"상황: {context}" if context else ""}
+            prompt = self._build_term_prompt(term, context)
             
-            아래 형식으로 정확히 작성해주세요:
-            
-            📌 정의
-            - {term}이 무엇인지 초보자도 이해할 수 있게 1-2문장으로 설명
-            
-            💡 투자 포인트  
-            - 주식 투자할 때 이 용어가 왜 중요한지 실용적인 관점에서 1-2문장으로 설명
-            - 투자 결정에 어떤 영향을 주는지 구체적인 예시 포함
-            
-            ⚠️ 주의사항
-            - 투자자가 놓치기 쉬운 중요한 점이나 함정 1문장으로 설명
-            
-            한국어로만 답변하고, 전문용어는 괄호 안에 쉬운 설명을 추가해주세요.
-            """
-            
-            response = await self._make_request(prompt)
+            response = await self._make_request(prompt, cache_ttl, TERM_MAX_TOKENS)
             
             if response:
                 return {
@@ -90,12 +158,68 @@ class PerplexityClient:
                 "success": False
             }
     
-    async def explain_market_event(self, event_title: str, event_details: str = "") -> Dict[str, Any]:
+    async def explain_financial_term_stream(self, term: str, context: str = "") -> AsyncIterator[str]:
+        """금융 용어 설명을 생성되는 대로 텍스트 조각 단위로 반환
+        
+        Args:
+            term: 설명할 용어
+            context: 추가 맥락 정보
+            
+        Yields:
+            설명 텍스트 조각
+        """
+        async for delta in self._stream_request(self._build_term_prompt(term, context), TERM_MAX_TOKENS):
+            yield delta
+    
+    @staticmethod
+    def _build_term_prompt(term: str, context: str = "") -> str:
+        """금융 용어 설명 프롬프트 (일반/스트리밍 공용)"""
+        return f"""
+            한국 주식 투자자를 위해 '{term}' 용어를 쉽고 실용적으로 설명해주세요.
+            {f"상황: {context}" if context else ""}
+            
+            아래 형식으로 정확히 작성해주세요:
+            
+            📌 정의
+            - {term}이 무엇인지 초보자도 이해할 수 있게 1-2문장으로 설명
+            
+            💡 투자 포인트  
+            - 주식 투자할 때 이 용어가 왜 중요한지 실용적인 관점에서 1-2문장으로 설명
+            - 투자 결정에 어떤 영향을 주는지 구체적인 예시 포함
+            
+            ⚠️ 주의사항
+            - 투자자가 놓치기 쉬운 중요한 점이나 함정 1문장으로 설명
+            
+            한국어로만 답변하고, 전문용어는 괄호 안에 쉬운 설명을 추가해주세요.
+            """
+    
+    async def explain_terms(self, terms: List[str], context: str = "") -> List[Dict[str, Any]]:
+        """여러 금융 용어를 동시에 설명 (동시 요청 수는 MAX_CONCURRENT_REQUESTS로 제한)
+        
+        Args:
+            terms: 설명할 용어 목록
+            context: 추가 맥락 정보
+            
+        Returns:
+            용어 순서대로의 설명 결과 목록
+        """
+        # 용어별 공유 캐시 조회를 MGET 한 번으로 모아 프로세스 내 캐시에 미리 채움
+        if self.api_key:
+            await self._prime_local_cache(
+                [self._cache_key(self._build_term_prompt(term, context), TERM_MAX_TOKENS) for term in terms],
+                TERM_CACHE_TTL
+            )
+        return await asyncio.gather(*(self.explain_financial_term(term, context) for term in terms))
+    
+    async def explain_market_event(
+        self, event_title: str, event_details: str = "", cache_ttl: int = EVENT_CACHE_TTL
+    ) -> Dict[str, Any]:
         """시장 이벤트나 실적발표 등에 대한 설명
         
         Args:
             event_title: 이벤트 제목
             event_details: 이벤트 상세 정보
+            cache_ttl: 응답 캐시 유효 시간(초), 0이면 캐싱하지 않음
             
         Returns:
             이벤트 분석 결과 딕셔너리
@@ -124,7 +248,7 @@ class PerplexityClient:
             한국 시장 상황에 맞게 실용적으로 설명하고, 전문용어는 쉽게 풀어서 설명해주세요.
             """
             
-            response = await self._make_request(prompt)
+            response = await self._make_request(prompt, cache_ttl, EVENT_MAX_TOKENS)
             
             if response:
                 return {
@@ -147,9 +271,12 @@ class PerplexityClient:
                 "success": False
             }
     
-    async def get_daily_market_summary(self) -> Dict[str, Any]:
+    async def get_daily_market_summary(self, cache_ttl: int = MARKET_SUMMARY_CACHE_TTL) -> Dict[str, Any]:
         """오늘의 주식 및 가상화폐 시장 주요 이슈 요약
         
+        Args:
+            cache_ttl: 응답 캐시 유효 시간(초), 0이면 캐싱하지 않음
+            
         Returns:
             시장 요약 결과 딕셔너리
         """
@@ -169,7 +296,7 @@ class PerplexityClient:
             각 항목당 1-2문장으로 핵심만 정리해주세요.
             """
             
-            response = await self._make_request(prompt)
+            response = await self._make_request(prompt, cache_ttl, MARKET_SUMMARY_MAX_TOKENS)
             
             if response:
                 return {
@@ -192,13 +319,17 @@ class PerplexityClient:
                 "success": False
             }
     
-    async def get_stock_analysis(self, stock_name: str, stock_code: str, current_price: str = "") -> Dict[str, Any]:
+    async def get_stock_analysis(
+        self, stock_name: str, stock_code: str, current_price: str = "",
+        cache_ttl: int = STOCK_ANALYSIS_CACHE_TTL
+    ) -> Dict[str, Any]:
         """특정 종목에 대한 간단한 분석
         
         Args:
             stock_name: 종목명
             stock_code: 종목코드
             current_price: 현재가 (선택사항)
+            cache_ttl: 응답 캐시 유효 시간(초), 0이면 캐싱하지 않음
             
         Returns:
             종목 분석 결과 딕셔너리
@@ -214,7 +345,7 @@ class PerplexityClient:
             - 투자시 고려사항
             """
             
-            response = await self._make_request(prompt)
+            response = await self._make_request(prompt, cache_ttl, STOCK_ANALYSIS_MAX_TOKENS)
             
             if response:
                 return {
@@ -240,11 +371,15 @@ class PerplexityClient:
                 "success": False
             }
     
-    async def _make_request(self, prompt: str) -> Optional[Dict[str, Any]]:
-        """Perplexity API 요청 실행
+    async def _make_request(
+        self, prompt: str, cache_ttl: int = 0, max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> Optional[Dict[str, Any]]:
+        """Perplexity API 요청 실행 (cache_ttl > 0이면 프롬프트 해시 기준으로 응답 캐싱)
         
         Args:
             prompt: 요청할 프롬프트
+            cache_ttl: 응답 캐시 유효 시간(초)
+            max_tokens: 최대 생성 토큰 수
             
         Returns:
             API 응답 딕셔너리 또는 None
@@ -252,38 +387,56 @@ class PerplexityClient:
         if not self.api_key:
             logger.warning("Perplexity API 키가 없어 요청을 건너뜁니다.")
             return None
-            
+        
+        cache_key = self._cache_key(prompt, max_tokens)
+        if cache_ttl <= 0:
+            return await self._fetch_completion(prompt, max_tokens, cache_key, cache_ttl)
+        
+        # 프로세스 내 캐시 → 공유 캐시(비동기 Redis) 순으로 조회
+        cached = self._local_cache.get(cache_key)
+        if cached is None:
+            cached = await async_cache_get(cache_key)
+            if cached is not None:
+                self._local_cache.set(cache_key, cached, cache_ttl)
+        if cached is not None:
+            logger.debug(f"Perplexity 캐시 적중: {cache_key}")
+            return cached
+        
+        # 같은 요청이 이미 진행 중이면 그 결과를 함께 기다림
+        pending = self._inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._fetch_completion(prompt, max_tokens, cache_key, cache_ttl)
+            )
+            self._inflight[cache_key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # 한 호출자가 취소되어도 공유 요청은 계속 진행
+        return await asyncio.shield(pending)
+    
+    @staticmethod
+    def _cache_key(prompt: str, max_tokens: int) -> str:
+        """프롬프트 해시 기반 응답 캐시 키"""
+        return f"perplexity:{max_tokens}:{hashlib.sha256(prompt.encode('utf-8')).hexdigest()}"
+    
+    async def _prime_local_cache(self, cache_keys: List[str], cache_ttl: int) -> None:
+        """프로세스 내 캐시에 없는 키들을 공유 캐시에서 한 번의 MGET으로 조회해 채움"""
+        missing = [key for key in dict.fromkeys(cache_keys) if self._local_cache.get(key) is None]
+        if not missing:
+            return
+        for key, value in zip(missing, await async_cache_mget(missing)):
+            if value is not None:
+                self._local_cache.set(key, value, cache_ttl)
+    
+    async def _fetch_completion(
+        self, prompt: str, max_tokens: int, cache_key: str, cache_ttl: int
+    ) -> Optional[Dict[str, Any]]:
+        """API 호출 후 성공한 응답을 캐시에 저장 (오류는 로그만 남기고 None 반환)"""
         try:
-            payload = {
-                "model": "llama-3.1-sonar-small-128k-online",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "당신은 한국의 금융 투자 전문가입니다. 복잡한 금융 개념을 일반 투자자가 이해하기 쉽게 설명하는 것이 특기입니다. 항상 한국어로 답변하고, 간결하고 실용적인 정보를 제공합니다."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 300,
-                "temperature": 0.2,
-                "top_p": 0.9,
-                "stream": False
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.error(f"Perplexity API 오류: {response.status}")
-                        return None
+            result = await self._post_completion(self._build_payload(prompt, max_tokens=max_tokens))
+            if result is not None and cache_ttl > 0:
+                self._local_cache.set(cache_key, result, cache_ttl)
+                await async_cache_set(cache_key, result, cache_ttl)
+            return result
                         
         except asyncio.TimeoutError:
             logger.error("Perplexity API 타임아웃")
@@ -291,6 +444,98 @@ class PerplexityClient:
         except Exception as e:
             logger.error(f"Perplexity API 요청 실패: {e}")
             return None
+    
+    @retry(
+        stop=stop_after_attempt(MAX_REQUEST_ATTEMPTS),
+        wait=_wait_retry_after,
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError, PerplexityRetryableError)),
+        reraise=True
+    )
+    async def _post_completion(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """chat completions 요청 1회 실행
+        
+        429/5xx 응답과 연결 오류, 타임아웃은 예외로 올려 재시도하고
+        그 밖의 오류 응답은 None을 반환합니다.
+        """
+        session = await self._init_session()
+        async with self._semaphore:
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                json=payload
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                if response.status != 429 and response.status < 500:
+                    logger.error(f"Perplexity API 오류: {response.status}")
+                    return None
+                status = response.status
+                retry_after = _parse_retry_after(response.headers.get("Retry-After")) if status == 429 else None
+        
+        # 대기는 세마포어를 반납한 뒤 tenacity가 Retry-After에 맞춰 수행
+        logger.warning(f"Perplexity API 일시 오류: {status}, 재시도 예정")
+        raise PerplexityRetryableError(status, retry_after)
+
+    async def _stream_request(
+        self, prompt: str, max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> AsyncIterator[str]:
+        """Perplexity API 스트리밍 요청 실행 (SSE 응답의 텍스트 조각을 순서대로 반환)
+        
+        Args:
+            prompt: 요청할 프롬프트
+            max_tokens: 최대 생성 토큰 수
+            
+        Yields:
+            응답 텍스트 조각
+        """
+        if not self.api_key:
+            logger.warning("Perplexity API 키가 없어 요청을 건너뜁니다.")
+            return
+        
+        session = await self._init_session()
+        async with self._semaphore:
+            async with session.post(
+                f"{self.base_url}/chat/completions",
+                json=self._build_payload(prompt, stream=True, max_tokens=max_tokens),
+                timeout=STREAM_TIMEOUT
+            ) as response:
+                if response.status != 200:
+                    logger.error(f"Perplexity API 오류: {response.status}")
+                    return
+                
+                async for line in response.content:
+                    line = line.strip()
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        break
+                    choices = json.loads(data).get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        yield delta
+    
+    @staticmethod
+    def _build_payload(
+        prompt: str, stream: bool = False, max_tokens: int = DEFAULT_MAX_TOKENS
+    ) -> Dict[str, Any]:
+        """chat completions 요청 본문 생성"""
+        return {
+            "model": "llama-3.1-sonar-small-128k-online",
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "당신은 한국의 금융 투자 전문가입니다. 복잡한 금융 개념을 일반 투자자가 이해하기 쉽게 설명하는 것이 특기입니다. 항상 한국어로 답변하고, 간결하고 실용적인 정보를 제공합니다."
+                },
+                {
+                    "role": "user", 
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.2,
+            "top_p": 0.9,
+            "stream": stream
+        }
 
 # 전역 클라이언트 인스턴스
 perplexity_client = PerplexityClient()
\ No newline at end of file
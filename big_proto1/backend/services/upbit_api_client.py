@@ -7,17 +7,123 @@ Upbit API 클라이언트
 
 import aiohttp
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 import logging
 import json
+import copy
+import orjson
 from dataclasses import dataclass
+import operator
 import random
+import time
+
+import numpy as np
+
+from backend.utils.memory_cache import MemoryCacheBackend
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-@dataclass
+# 공유 세션 설정 (프로세스 전체에서 keep-alive 커넥션 풀을 재사용)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+CONNECTOR_LIMIT = 100
+CONNECTOR_LIMIT_PER_HOST = 30
+KEEPALIVE_TIMEOUT = 75
+# JSON 응답 압축 전송 요청 (br은 brotli 패키지가 없으면 해제할 수 없어 제외)
+REQUEST_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "User-Agent": "upbit-client/1.0"
+}
+# 동시에 진행할 수 있는 최대 API 요청 수 (업비트 시세 API 초당 요청 제한에 맞춤)
+MAX_CONCURRENT_REQUESTS = 10
+# 429(요청 수 초과) 응답 재시도 설정
+MAX_REQUEST_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.25
+# Remaining-Req 헤더의 초당 잔여 요청 수가 이 값 이하이면 다음 요청을 잠시 늦춤
+REMAINING_REQ_THRESHOLD = 1
+RATE_LIMIT_WINDOW = 1.0
+# 단일 종목 현재가 요청을 모아 한 번에 조회하는 대기 시간(초)과 요청당 최대 마켓 수
+TICKER_BATCH_WINDOW = 0.02
+TICKER_BATCH_MAX_MARKETS = 100
+
+# 응답 캐시 유효 시간(초)
+MARKET_ALL_CACHE_TTL = 3600  # 마켓 목록은 거의 변하지 않음
+TICKER_CACHE_TTL = 1.0       # 페이지 로드 중 같은 현재가 재조회 방지
+CANDLES_CACHE_TTL = 60
+RESPONSE_CACHE_SIZE = 512
+
+# Mock 호가 단계 수
+ORDERBOOK_DEPTH = 15
+MS_PER_DAY = 86_400_000
+MOCK_CANDLES_CACHE_TTL = 5
+MOCK_CANDLES_CACHE_SIZE = 256
+
+# 예정된 가상화폐 이벤트 (예시 데이터) - 날짜는 모듈 로드 시 한 번만 파싱
+_SCHEDULED_CRYPTO_EVENTS: Tuple[Tuple[date, Dict[str, Any]], ...] = tuple(
+    (date.fromisoformat(event["date"]), event)
+    for event in (
+        {
+            "id": "crypto_halving_2025",
+            "title": "비트코인 반감기",
+            "date": "2025-03-15",
+            "eventType": "crypto",
+            "cryptoSymbol": "BTC",
+            "cryptoName": "비트코인",
+            "description": "비트코인 블록 보상 반감기 예정",
+            "marketType": "crypto",
+            "importance": "high"
+        },
+        {
+            "id": "crypto_ethereum_upgrade_2025",
+            "title": "이더리움 업그레이드",
+            "date": "2025-02-20",
+            "eventType": "crypto",
+            "cryptoSymbol": "ETH",
+            "cryptoName": "이더리움",
+            "description": "이더리움 네트워크 주요 업그레이드",
+            "marketType": "crypto",
+            "importance": "high"
+        },
+        {
+            "id": "crypto_listing_new",
+            "title": "신규 코인 상장",
+            "date": "2025-01-25",
+            "eventType": "crypto",
+            "description": "업비트 신규 코인 상장 예정",
+            "marketType": "crypto",
+            "importance": "medium"
+        }
+    )
+)
+
+def _decode_json(body: bytes) -> Any:
+    """응답 본문 JSON 디코딩 (orjson 우선, 실패 시 표준 json)"""
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        # 표준 json만 허용하는 값(NaN 등)이 포함된 경우
+        return json.loads(body)
+
+def _copy_items(items: List[Any]) -> List[Any]:
+    """캐시된 응답 목록의 호출자용 복사본 (불변인 CryptoQuote는 그대로, 캔들/마켓 딕셔너리는 깊은 복사)"""
+    return [copy.deepcopy(item) if isinstance(item, dict) else item for item in items]
+
+def _parse_remaining_sec(value: Optional[str]) -> Optional[int]:
+    """Remaining-Req 헤더("group=market; min=573; sec=9")에서 초당 잔여 요청 수 추출"""
+    if not value:
+        return None
+    for part in value.split(";"):
+        key, _, number = part.strip().partition("=")
+        if key == "sec":
+            try:
+                return int(number)
+            except ValueError:
+                return None
+    return None
+
+@dataclass(slots=True, frozen=True)
 class CryptoQuote:
     """가상화폐 시세 정보"""
     symbol: str
@@ -33,12 +139,60 @@ class CryptoQuote:
     opening_price: float
     timestamp: datetime
 
+# /ticker 응답 항목에서 CryptoQuote의 trade_price ~ opening_price 필드를 순서대로 추출
+_TICKER_FIELDS = operator.itemgetter(
+    'trade_price', 'change', 'change_price', 'change_rate', 'trade_volume',
+    'acc_trade_volume_24h', 'high_price', 'low_price', 'opening_price'
+)
+
+
+@dataclass(frozen=True)
+class CryptoQuoteBatch:
+    """여러 종목 시세의 열 단위(SoA) 표현
+    
+    등락률 필터링 같은 일괄 연산을 NumPy 벡터 연산으로 처리하고,
+    조건을 통과한 종목만 CryptoQuote로 다시 꺼내 씁니다.
+    """
+    quotes: List[CryptoQuote]
+    symbols: np.ndarray
+    trade_price: np.ndarray
+    change_rate: np.ndarray
+    acc_trade_volume_24h: np.ndarray
+    
+    @classmethod
+    def from_quotes(cls, quotes: List[CryptoQuote]) -> "CryptoQuoteBatch":
+        count = len(quotes)
+        return cls(
+            quotes=quotes,
+            symbols=np.array([quote.symbol for quote in quotes], dtype=object),
+            trade_price=np.fromiter((quote.trade_price for quote in quotes), dtype=np.float64, count=count),
+            change_rate=np.fromiter((quote.change_rate for quote in quotes), dtype=np.float64, count=count),
+            acc_trade_volume_24h=np.fromiter(
+                (quote.acc_trade_volume_24h for quote in quotes), dtype=np.float64, count=count
+            ),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.quotes)
+    
+    def filter_change_rate(self, threshold: float) -> List[CryptoQuote]:
+        """등락률 절댓값이 threshold를 넘는 종목 (원래 순서 유지)"""
+        indices = np.flatnonzero(np.abs(self.change_rate) > threshold)
+        return [self.quotes[i] for i in indices]
+
+
 class UpbitAPIClient:
     """업비트 API 클라이언트"""
     
+    # 모든 인스턴스가 공유하는 HTTP 세션 (요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록)
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _session_lock = asyncio.Lock()
+    _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # 초당 요청 한도에 가까워졌을 때 다음 요청을 보낼 수 있는 시각 (time.monotonic 기준)
+    _throttle_until: float = 0.0
+    
     def __init__(self):
         self.base_url = "https://api.upbit.com/v1"
-        self.session = None
         self.mock_mode = False
         self._supported_symbols = {
             'BTC': '비트코인',
@@ -62,9 +216,19 @@ class UpbitAPIClient:
             'TRX': '트론',
             'ALGO': '알고랜드'
         }
+        # 심볼 ↔ KRW 마켓 코드 매핑 (요청마다 문자열을 다시 만들지 않도록 미리 생성)
+        self._market_codes = {symbol: f"KRW-{symbol}" for symbol in self._supported_symbols}
+        self._market_to_symbol = {market: symbol for symbol, market in self._market_codes.items()}
         
         # Mock 데이터 생성기
         self._mock_provider = CryptoMockProvider()
+        
+        # 대기 중인 단일 종목 현재가 요청 (심볼 → 결과를 기다리는 Future 목록)
+        self._pending_tickers: Dict[str, List[asyncio.Future]] = {}
+        self._ticker_flush_task: Optional[asyncio.Task] = None
+        
+        # API 응답 캐시 (Mock 대체 데이터는 캐싱하지 않음)
+        self._cache = MemoryCacheBackend(RESPONSE_CACHE_SIZE)
     
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
@@ -72,142 +236,261 @@ class UpbitAPIClient:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """컨텍스트 매니저 종료"""
-        await self._close_session()
+        """컨텍스트 매니저 종료 (공유 세션은 서버 종료 시 close()로 정리)"""
+        pass
     
-    async def _init_session(self):
-        """HTTP 세션 초기화"""
-        if not self.session or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        return UpbitAPIClient._shared_session
     
-    async def _close_session(self):
-        """HTTP 세션 종료"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+    async def _init_session(self) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 초기화 (첫 요청 시 한 번만 생성)"""
+        cls = UpbitAPIClient
+        if cls._shared_session is None or cls._shared_session.closed:
+            async with cls._session_lock:
+                if cls._shared_session is None or cls._shared_session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=CONNECTOR_LIMIT,
+                        limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                        keepalive_timeout=KEEPALIVE_TIMEOUT,
+                        ttl_dns_cache=300,
+                        enable_cleanup_closed=True
+                    )
+                    cls._shared_session = aiohttp.ClientSession(
+                        headers=REQUEST_HEADERS,
+                        timeout=REQUEST_TIMEOUT,
+                        connector=connector,
+                        auto_decompress=True
+                    )
+        return cls._shared_session
     
-    async def get_market_all(self) -> List[Dict[str, Any]]:
+    @classmethod
+    async def close(cls):
+        """공유 HTTP 세션 종료"""
+        if cls._shared_session and not cls._shared_session.closed:
+            await cls._shared_session.close()
+    
+    async def _request(self, url: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+        """GET 요청 실행 (429 응답은 지수 백오프로 재시도)
+        
+        Args:
+            url: 요청 URL
+            params: 쿼리 파라미터
+            
+        Returns:
+            (HTTP 상태 코드, 200이면 디코딩된 JSON 아니면 None)
+        """
+        cls = UpbitAPIClient
+        session = await self._init_session()
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            async with self._request_semaphore:
+                # 잔여 요청 수가 바닥나면 한도가 초기화될 때까지 대기
+                delay = cls._throttle_until - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                
+                async with session.get(url, params=params) as response:
+                    remaining = _parse_remaining_sec(response.headers.get("Remaining-Req"))
+                    if remaining is not None and remaining <= REMAINING_REQ_THRESHOLD:
+                        cls._throttle_until = time.monotonic() + RATE_LIMIT_WINDOW
+                    
+                    status = response.status
+                    if status == 200:
+                        return status, _decode_json(await response.read())
+            
+            if status != 429 or attempt == MAX_REQUEST_ATTEMPTS - 1:
+                return status, None
+            
+            # 세마포어를 반납한 뒤 대기
+            logger.warning(f"업비트 요청 수 초과(429), {attempt + 1}회차 재시도 예정")
+            await asyncio.sleep(RETRY_BASE_DELAY * 2 ** attempt + random.random() * 0.1)
+        
+        return status, None
+    
+    async def _cached(
+        self, key: str, ttl: float, fetch: Callable[[], Awaitable[Optional[List[Any]]]],
+        force_refresh: bool = False
+    ) -> Optional[List[Any]]:
+        """캐시된 응답이 있으면 반환하고, 없으면 조회 후 저장 (조회 실패 시 None)
+        
+        Args:
+            key: 캐시 키 (엔드포인트 + 파라미터)
+            ttl: 캐시 유효 시간(초)
+            fetch: 실제 API 조회 함수
+            force_refresh: True면 캐시를 무시하고 다시 조회
+        """
+        if not force_refresh:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return _copy_items(cached)
+        
+        result = await fetch()
+        if result is not None:
+            self._cache.set(key, result, ttl)
+            return _copy_items(result)
+        return None
+    
+    async def get_market_all(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """마켓 코드 조회"""
+        markets = await self._cached(
+            "market_all", MARKET_ALL_CACHE_TTL, self._fetch_market_all, force_refresh
+        )
+        return markets if markets is not None else self._mock_provider.get_market_all()
+    
+    async def _fetch_market_all(self) -> Optional[List[Dict[str, Any]]]:
+        """마켓 코드 API 조회 (실패 시 None)"""
         try:
-            await self._init_session()
-            
             url = f"{self.base_url}/market/all"
             params = {"isDetails": "true"}
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    # KRW 마켓만 필터링
-                    krw_markets = [market for market in data if market['market'].startswith('KRW-')]
-                    return krw_markets
-                else:
-                    logger.error(f"마켓 코드 조회 실패: {response.status}")
-                    return self._mock_provider.get_market_all()
+            status, data = await self._request(url, params)
+            if status == 200:
+                # KRW 마켓만 필터링
+                krw_markets = [market for market in data if market['market'].startswith('KRW-')]
+                return krw_markets
+            else:
+                logger.error(f"마켓 코드 조회 실패: {status}")
+                return None
                     
         except Exception as e:
             logger.error(f"마켓 코드 조회 중 오류: {str(e)}")
             self.mock_mode = True
-            return self._mock_provider.get_market_all()
+            return None
     
-    async def get_ticker(self, symbols: List[str]) -> List[CryptoQuote]:
+    async def get_ticker(self, symbols: List[str], force_refresh: bool = False) -> List[CryptoQuote]:
         """현재가 정보 조회"""
+        quotes = await self._cached(
+            "ticker:" + ",".join(sorted(symbols)), TICKER_CACHE_TTL,
+            lambda: self._fetch_ticker(symbols), force_refresh
+        )
+        return quotes if quotes is not None else self._mock_provider.get_ticker(symbols)
+    
+    async def _fetch_ticker(self, symbols: List[str]) -> Optional[List[CryptoQuote]]:
+        """현재가 API 조회 (실패 시 None)"""
         try:
-            await self._init_session()
-            
             # KRW- 마켓 코드로 변환
-            markets = [f"KRW-{symbol}" for symbol in symbols]
+            markets = [self._market_codes.get(symbol) or f"KRW-{symbol}" for symbol in symbols]
             markets_param = ",".join(markets)
             
             url = f"{self.base_url}/ticker"
             params = {"markets": markets_param}
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    quotes = []
-                    
-                    for item in data:
-                        symbol = item['market'].replace('KRW-', '')
-                        korean_name = self._supported_symbols.get(symbol, symbol)
-                        
-                        quote = CryptoQuote(
-                            symbol=symbol,
-                            korean_name=korean_name,
-                            trade_price=item['trade_price'],
-                            change=item['change'],
-                            change_price=item['change_price'],
-                            change_rate=item['change_rate'],
-                            trade_volume=item['trade_volume'],
-                            acc_trade_volume_24h=item['acc_trade_volume_24h'],
-                            high_price=item['high_price'],
-                            low_price=item['low_price'],
-                            opening_price=item['opening_price'],
-                            timestamp=datetime.now()
-                        )
-                        quotes.append(quote)
+            status, data = await self._request(url, params)
+            if status == 200:
+                quotes = []
+                now = datetime.now()
+                
+                for item in data:
+                    market = item['market']
+                    symbol = self._market_to_symbol.get(market) or market.replace('KRW-', '')
+                    korean_name = self._supported_symbols.get(symbol, symbol)
                     
-                    return quotes
-                else:
-                    logger.error(f"현재가 조회 실패: {response.status}")
-                    return self._mock_provider.get_ticker(symbols)
+                    # 시세 필드는 CryptoQuote 필드 순서대로 한 번에 추출
+                    quotes.append(CryptoQuote(symbol, korean_name, *_TICKER_FIELDS(item), now))
+                
+                return quotes
+            else:
+                logger.error(f"현재가 조회 실패: {status}")
+                return None
                     
         except Exception as e:
             logger.error(f"현재가 조회 중 오류: {str(e)}")
             self.mock_mode = True
-            return self._mock_provider.get_ticker(symbols)
+            return None
     
     async def get_single_ticker(self, symbol: str) -> Optional[CryptoQuote]:
-        """단일 종목 현재가 조회"""
-        quotes = await self.get_ticker([symbol])
-        return quotes[0] if quotes else None
+        """단일 종목 현재가 조회
+        
+        짧은 시간 안에 들어온 단일 종목 요청들을 모아 /ticker 한 번으로 조회합니다.
+        지원하지 않는 심볼은 다른 요청의 실패를 유발하지 않도록 따로 조회합니다.
+        """
+        if symbol not in self._supported_symbols:
+            quotes = await self.get_ticker([symbol])
+            return quotes[0] if quotes else None
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending_tickers.setdefault(symbol, []).append(future)
+        if self._ticker_flush_task is None:
+            self._ticker_flush_task = asyncio.ensure_future(self._flush_pending_tickers())
+        return await future
+    
+    async def _flush_pending_tickers(self):
+        """대기 시간이 지나면 모인 단일 종목 요청을 마켓 수 제한 단위로 나눠 조회"""
+        await asyncio.sleep(TICKER_BATCH_WINDOW)
+        pending, self._pending_tickers = self._pending_tickers, {}
+        self._ticker_flush_task = None
+        
+        symbols = list(pending)
+        chunks = [
+            symbols[i:i + TICKER_BATCH_MAX_MARKETS]
+            for i in range(0, len(symbols), TICKER_BATCH_MAX_MARKETS)
+        ]
+        results = await asyncio.gather(
+            *[self.get_ticker(chunk) for chunk in chunks], return_exceptions=True
+        )
+        
+        for chunk, result in zip(chunks, results):
+            quotes = {} if isinstance(result, Exception) else {quote.symbol: quote for quote in result}
+            for symbol in chunk:
+                for future in pending[symbol]:
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(quotes.get(symbol))
     
     async def get_major_cryptos(self) -> List[CryptoQuote]:
         """주요 가상화폐 시세 조회"""
         major_symbols = ['BTC', 'ETH', 'XRP', 'ADA', 'DOT', 'SOL', 'AVAX', 'MATIC']
         return await self.get_ticker(major_symbols)
     
-    async def get_candles_daily(self, symbol: str, count: int = 30) -> List[Dict[str, Any]]:
+    async def get_candles_daily(
+        self, symbol: str, count: int = 30, force_refresh: bool = False
+    ) -> List[Dict[str, Any]]:
         """일봉 데이터 조회"""
+        candles = await self._cached(
+            f"candles:{symbol}:{count}", CANDLES_CACHE_TTL,
+            lambda: self._fetch_candles_daily(symbol, count), force_refresh
+        )
+        return candles if candles is not None else self._mock_provider.get_candles_daily(symbol, count)
+    
+    async def _fetch_candles_daily(self, symbol: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """일봉 API 조회 (실패 시 None)"""
         try:
-            await self._init_session()
-            
-            market = f"KRW-{symbol}"
+            market = self._market_codes.get(symbol) or f"KRW-{symbol}"
             url = f"{self.base_url}/candles/days"
             params = {
                 "market": market,
                 "count": count
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data
-                else:
-                    logger.error(f"일봉 데이터 조회 실패: {response.status}")
-                    return self._mock_provider.get_candles_daily(symbol, count)
+            status, data = await self._request(url, params)
+            if status == 200:
+                return data
+            else:
+                logger.error(f"일봉 데이터 조회 실패: {status}")
+                return None
                     
         except Exception as e:
             logger.error(f"일봉 데이터 조회 중 오류: {str(e)}")
-            return self._mock_provider.get_candles_daily(symbol, count)
+            return None
     
     async def get_orderbook(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """호가 정보 조회"""
         try:
-            await self._init_session()
-            
-            markets = [f"KRW-{symbol}" for symbol in symbols]
+            markets = [self._market_codes.get(symbol) or f"KRW-{symbol}" for symbol in symbols]
             markets_param = ",".join(markets)
             
             url = f"{self.base_url}/orderbook"
             params = {"markets": markets_param}
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data
-                else:
-                    logger.error(f"호가 정보 조회 실패: {response.status}")
-                    return self._mock_provider.get_orderbook(symbols)
+            status, data = await self._request(url, params)
+            if status == 200:
+                return data
+            else:
+                logger.error(f"호가 정보 조회 실패: {status}")
+                return self._mock_provider.get_orderbook(symbols)
                     
         except Exception as e:
             logger.error(f"호가 정보 조회 중 오류: {str(e)}")
@@ -221,29 +504,31 @@ class UpbitAPIClient:
         """
         try:
             # 주요 가상화폐 시세 조회
-            major_cryptos = await self.get_major_cryptos()
+            major_cryptos = CryptoQuoteBatch.from_quotes(await self.get_major_cryptos())
             
             events = []
-            for crypto in major_cryptos:
-                # 가격 변동이 큰 경우 이벤트로 추가
-                if abs(crypto.change_rate) > 0.05:  # 5% 이상 변동
-                    event_type = "crypto_surge" if crypto.change == "RISE" else "crypto_drop"
-                    change_direction = "급등" if crypto.change_rate > 0 else "급락"
-                    
-                    event = {
-                        "id": f"crypto_{crypto.symbol}_{datetime.now().strftime('%Y%m%d')}",
-                        "title": f"{crypto.korean_name} {change_direction}",
-                        "date": datetime.now().strftime("%Y-%m-%d"),
-                        "eventType": "crypto",
-                        "cryptoSymbol": crypto.symbol,
-                        "cryptoName": crypto.korean_name,
-                        "description": f"{crypto.korean_name} {crypto.change_rate*100:.2f}% {change_direction} (현재가: {crypto.trade_price:,.0f}원)",
-                        "marketType": "crypto",
-                        "change_rate": crypto.change_rate,
-                        "current_price": crypto.trade_price,
-                        "volume_24h": crypto.acc_trade_volume_24h
-                    }
-                    events.append(event)
+            today = datetime.now()
+            today_str = today.strftime("%Y-%m-%d")
+            id_stamp = today.strftime("%Y%m%d")
+            # 가격 변동이 큰 경우 이벤트로 추가 (5% 이상 변동)
+            for crypto in major_cryptos.filter_change_rate(0.05):
+                event_type = "crypto_surge" if crypto.change == "RISE" else "crypto_drop"
+                change_direction = "급등" if crypto.change_rate > 0 else "급락"
+                
+                event = {
+                    "id": f"crypto_{crypto.symbol}_{id_stamp}",
+                    "title": f"{crypto.korean_name} {change_direction}",
+                    "date": today_str,
+                    "eventType": "crypto",
+                    "cryptoSymbol": crypto.symbol,
+                    "cryptoName": crypto.korean_name,
+                    "description": f"{crypto.korean_name} {crypto.change_rate*100:.2f}% {change_direction} (현재가: {crypto.trade_price:,.0f}원)",
+                    "marketType": "crypto",
+                    "change_rate": crypto.change_rate,
+                    "current_price": crypto.trade_price,
+                    "volume_24h": crypto.acc_trade_volume_24h
+                }
+                events.append(event)
             
             # 예정된 가상화폐 이벤트들 (하드코딩된 예시)
             scheduled_events = self._get_scheduled_crypto_events(start_date, end_date)
@@ -257,51 +542,11 @@ class UpbitAPIClient:
     
     def _get_scheduled_crypto_events(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """예정된 가상화폐 이벤트 (예시 데이터)"""
-        scheduled_events = [
-            {
-                "id": "crypto_halving_2025",
-                "title": "비트코인 반감기",
-                "date": "2025-03-15",
-                "eventType": "crypto",
-                "cryptoSymbol": "BTC",
-                "cryptoName": "비트코인",
-                "description": "비트코인 블록 보상 반감기 예정",
-                "marketType": "crypto",
-                "importance": "high"
-            },
-            {
-                "id": "crypto_ethereum_upgrade_2025",
-                "title": "이더리움 업그레이드",
-                "date": "2025-02-20",
-                "eventType": "crypto",
-                "cryptoSymbol": "ETH",
-                "cryptoName": "이더리움",
-                "description": "이더리움 네트워크 주요 업그레이드",
-                "marketType": "crypto",
-                "importance": "high"
-            },
-            {
-                "id": "crypto_listing_new",
-                "title": "신규 코인 상장",
-                "date": "2025-01-25",
-                "eventType": "crypto",
-                "description": "업비트 신규 코인 상장 예정",
-                "marketType": "crypto",
-                "importance": "medium"
-            }
-        ]
-        
         # 날짜 범위 필터링
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        
-        filtered_events = []
-        for event in scheduled_events:
-            event_date = datetime.strptime(event["date"], "%Y-%m-%d").date()
-            if start <= event_date <= end:
-                filtered_events.append(event)
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
         
-        return filtered_events
+        return [dict(event) for event_date, event in _SCHEDULED_CRYPTO_EVENTS if start <= event_date <= end]
     
     def get_supported_symbols(self) -> Dict[str, str]:
         """지원되는 가상화폐 심볼 목록 반환"""
@@ -357,6 +602,19 @@ class CryptoMockProvider:
             'TRX': '트론',
             'ALGO': '알고랜드'
         }
+        
+        # Mock 데이터를 만들 수 있는 심볼 집합
+        self._supported_set = frozenset(self.base_prices)
+        
+        # 난수는 NumPy로 종목/호가 단위를 한 번에 생성
+        self._rng = np.random.default_rng()
+        # 15호가 매도/매수 가격 배율 (기준가 대비 0.1%씩)
+        steps = np.arange(1, ORDERBOOK_DEPTH + 1) * 0.001
+        self._ask_multipliers = 1 + steps
+        self._bid_multipliers = 1 - steps
+        
+        # (심볼, 개수)별 생성된 일봉 캐시 (대시보드 반복 조회 시 재생성 방지)
+        self._candle_cache = MemoryCacheBackend(MOCK_CANDLES_CACHE_SIZE)
     
     def get_market_all(self) -> List[Dict[str, Any]]:
         """Mock 마켓 코드 데이터"""
@@ -371,102 +629,136 @@ class CryptoMockProvider:
     
     def get_ticker(self, symbols: List[str]) -> List[CryptoQuote]:
         """Mock 현재가 데이터"""
-        quotes = []
+        valid_symbols = [symbol for symbol in symbols if symbol in self._supported_set]
+        count = len(valid_symbols)
+        if not count:
+            return []
         
-        for symbol in symbols:
-            if symbol not in self.base_prices:
-                continue
-                
-            base_price = self.base_prices[symbol]
-            korean_name = self.korean_names.get(symbol, symbol)
-            
-            # 랜덤 변동률 생성 (-10% ~ +10%)
-            change_rate = random.uniform(-0.1, 0.1)
-            change_price = base_price * change_rate
-            trade_price = base_price + change_price
-            
+        base_prices = np.array([self.base_prices[symbol] for symbol in valid_symbols], dtype=np.float64)
+        rng = self._rng
+        
+        # 랜덤 변동률 생성 (-10% ~ +10%)
+        change_rates = rng.uniform(-0.1, 0.1, count)
+        change_prices = base_prices * change_rates
+        trade_prices = base_prices + change_prices
+        
+        columns = zip(
+            valid_symbols,
+            trade_prices.tolist(),
+            np.abs(change_prices).tolist(),
+            change_rates.tolist(),
+            rng.uniform(0.1, 100, count).tolist(),
+            rng.uniform(1000, 100000, count).tolist(),
+            (trade_prices * rng.uniform(1.01, 1.05, count)).tolist(),
+            (trade_prices * rng.uniform(0.95, 0.99, count)).tolist(),
+            (trade_prices * rng.uniform(0.98, 1.02, count)).tolist()
+        )
+        
+        now = datetime.now()
+        quotes = []
+        for symbol, trade_price, change_price, change_rate, trade_volume, acc_volume, high, low, opening in columns:
             # 변동 방향 결정
             change = "RISE" if change_rate > 0 else "FALL" if change_rate < 0 else "EVEN"
             
-            quote = CryptoQuote(
+            quotes.append(CryptoQuote(
                 symbol=symbol,
-                korean_name=korean_name,
+                korean_name=self.korean_names.get(symbol, symbol),
                 trade_price=trade_price,
                 change=change,
-                change_price=abs(change_price),
+                change_price=change_price,
                 change_rate=change_rate,
-                trade_volume=random.uniform(0.1, 100),
-                acc_trade_volume_24h=random.uniform(1000, 100000),
-                high_price=trade_price * random.uniform(1.01, 1.05),
-                low_price=trade_price * random.uniform(0.95, 0.99),
-                opening_price=trade_price * random.uniform(0.98, 1.02),
-                timestamp=datetime.now()
-            )
-            quotes.append(quote)
+                trade_volume=trade_volume,
+                acc_trade_volume_24h=acc_volume,
+                high_price=high,
+                low_price=low,
+                opening_price=opening,
+                timestamp=now
+            ))
         
         return quotes
     
     def get_candles_daily(self, symbol: str, count: int) -> List[Dict[str, Any]]:
         """Mock 일봉 데이터"""
-        if symbol not in self.base_prices:
+        if symbol not in self._supported_set:
             return []
+        
+        cache_key = f"{symbol}:{count}"
+        cached = self._candle_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
             
         base_price = self.base_prices[symbol]
+        rng = self._rng
+        
+        # 일별 랜덤 변동
+        open_prices = base_price * rng.uniform(0.95, 1.05, count)
+        close_prices = open_prices * rng.uniform(0.95, 1.05, count)
+        high_prices = np.maximum(open_prices, close_prices) * rng.uniform(1.0, 1.03, count)
+        low_prices = np.minimum(open_prices, close_prices) * rng.uniform(0.97, 1.0, count)
+        acc_prices = rng.uniform(1000000, 10000000, count)
+        acc_volumes = rng.uniform(100, 1000, count)
+        
+        market = f"KRW-{symbol}"
+        today = date.today()
+        now_ms = time.time_ns() // 1_000_000
         candles = []
         
-        for i in range(count):
-            date = datetime.now() - timedelta(days=i)
-            
-            # 일별 랜덤 변동
-            open_price = base_price * random.uniform(0.95, 1.05)
-            close_price = open_price * random.uniform(0.95, 1.05)
-            high_price = max(open_price, close_price) * random.uniform(1.0, 1.03)
-            low_price = min(open_price, close_price) * random.uniform(0.97, 1.0)
+        for i, (open_price, close_price, high_price, low_price, acc_price, acc_volume) in enumerate(zip(
+            open_prices.tolist(), close_prices.tolist(), high_prices.tolist(),
+            low_prices.tolist(), acc_prices.tolist(), acc_volumes.tolist()
+        )):
+            day = (today - timedelta(days=i)).isoformat()
             
             candle = {
-                "market": f"KRW-{symbol}",
-                "candle_date_time_utc": date.strftime("%Y-%m-%dT00:00:00"),
-                "candle_date_time_kst": date.strftime("%Y-%m-%dT09:00:00"),
+                "market": market,
+                "candle_date_time_utc": f"{day}T00:00:00",
+                "candle_date_time_kst": f"{day}T09:00:00",
                 "opening_price": open_price,
                 "high_price": high_price,
                 "low_price": low_price,
                 "trade_price": close_price,
-                "timestamp": int(date.timestamp() * 1000),
-                "candle_acc_trade_price": random.uniform(1000000, 10000000),
-                "candle_acc_trade_volume": random.uniform(100, 1000)
+                "timestamp": now_ms - i * MS_PER_DAY,
+                "candle_acc_trade_price": acc_price,
+                "candle_acc_trade_volume": acc_volume
             }
             candles.append(candle)
         
-        return candles
+        self._candle_cache.set(cache_key, candles, MOCK_CANDLES_CACHE_TTL)
+        return list(candles)
     
     def get_orderbook(self, symbols: List[str]) -> List[Dict[str, Any]]:
         """Mock 호가 데이터"""
         orderbooks = []
+        valid_symbols = [symbol for symbol in symbols if symbol in self._supported_set]
+        # (종목, 호가, 매도/매수) 잔량을 한 번에 생성
+        sizes = self._rng.uniform(0.1, 10, (len(valid_symbols), ORDERBOOK_DEPTH, 2))
+        # 종목별 매도/매수 총 잔량도 생성 시점에 한 번에 합산
+        totals = sizes.sum(axis=1).tolist()
+        now_ms = time.time_ns() // 1_000_000
         
-        for symbol in symbols:
-            if symbol not in self.base_prices:
-                continue
-                
+        for symbol, symbol_sizes, (total_ask_size, total_bid_size) in zip(valid_symbols, sizes, totals):
             base_price = self.base_prices[symbol]
             
             # 매도/매수 호가 생성
-            orderbook_units = []
-            for i in range(15):  # 15호가
-                ask_price = base_price * (1 + (i + 1) * 0.001)  # 매도가
-                bid_price = base_price * (1 - (i + 1) * 0.001)  # 매수가
-                
-                orderbook_units.append({
+            orderbook_units = [
+                {
                     "ask_price": ask_price,
                     "bid_price": bid_price,
-                    "ask_size": random.uniform(0.1, 10),
-                    "bid_size": random.uniform(0.1, 10)
-                })
+                    "ask_size": ask_size,
+                    "bid_size": bid_size
+                }
+                for ask_price, bid_price, (ask_size, bid_size) in zip(
+                    (base_price * self._ask_multipliers).tolist(),
+                    (base_price * self._bid_multipliers).tolist(),
+                    symbol_sizes.tolist()
+                )
+            ]
             
             orderbook = {
                 "market": f"KRW-{symbol}",
-                "timestamp": int(datetime.now().timestamp() * 1000),
-                "total_ask_size": sum(unit["ask_size"] for unit in orderbook_units),
-                "total_bid_size": sum(unit["bid_size"] for unit in orderbook_units),
+                "timestamp": now_ms,
+                "total_ask_size": total_ask_size,
+                "total_bid_size": total_bid_size,
                 "orderbook_units": orderbook_units
             }
             orderbooks.append(orderbook)
@@ -18,10 +18,19 @@ import os
 import sys
 import asyncio
 import aiohttp
+import copy
+import csv
 import json
+import math
+import numpy as np
+import orjson
 import random
+import time
+import uuid
+from collections import deque
+from functools import lru_cache
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Awaitable, Callable, Optional, Tuple, Union
 from pathlib import Path
 import logging
 
@@ -30,12 +39,174 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from backend.utils.logger import setup_logger
+from backend.utils.redis_cache import get_async_redis_client, async_cache_get, async_cache_set
+from backend.utils.memory_cache import MemoryCacheBackend
 
 logger = setup_logger("services.us_stock_api")
 
+# 공유 세션 설정 (Alpha Vantage/Yahoo 호출이 keep-alive 커넥션 풀을 재사용)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+CONNECTOR_LIMIT = 100
+CONNECTOR_LIMIT_PER_HOST = 20
+KEEPALIVE_TIMEOUT = 60
+# 동시에 진행할 수 있는 최대 API 요청 수 (get_multiple_quotes 등 대량 동시 조회 시 Yahoo 과부하 방지)
+MAX_CONCURRENT_REQUESTS = 5
+
+# 워커 간 공유되는 Redis 슬라이딩 윈도우 호출 제한 (키, 윈도우 내 최대 호출 수, 윈도우(초))
+ALPHA_VANTAGE_RATE_LIMIT = ("us_stock:ratelimit:alpha_vantage", 5, 60)  # 분당 5회
+YAHOO_FINANCE_RATE_LIMIT = ("us_stock:ratelimit:yahoo_finance", 30, 60)
+
+# 2단계 캐시 설정 (프로세스 내 캐시 → Redis), 데이터 종류별 유효 시간(초)
+QUOTE_CACHE_TTL = 60
+EARNINGS_CACHE_TTL = 4 * 3600
+LOCAL_CACHE_SIZE = 512
+CACHE_KEY_PREFIX = "us_stock"
+# 업스트림 실패 시 반환할 마지막 성공 응답 보관 기간
+STALE_CACHE_TTL = 24 * 3600
+
+# Alpha Vantage 실적 캘린더 CSV의 필수 컬럼 (fiscalDateEnding, estimate는 없으면 빈 값으로 처리)
+EARNINGS_CSV_REQUIRED_COLUMNS = ("symbol", "name", "reportDate")
+EARNINGS_TIME_UNKNOWN = "Not Specified"
+
+def _fiscal_period(fiscal_date_ending: str) -> str:
+    """회계 기간 종료일(YYYY-MM-DD)을 'Q1 2025' 형식으로 변환"""
+    try:
+        ending = date.fromisoformat(fiscal_date_ending)
+    except (TypeError, ValueError):
+        return fiscal_date_ending or ""
+    return f"Q{(ending.month - 1) // 3 + 1} {ending.year}"
+
+def _earnings_event(symbol: str, name: str, report_date: str, fiscal_date_ending: str, estimate: Optional[float]) -> Dict[str, Any]:
+    """실적 캘린더 CSV 한 행을 Mock 데이터와 같은 이벤트 형식으로 변환"""
+    return {
+        "symbol": symbol,
+        "company_name": name,
+        "report_date": report_date,
+        "fiscal_period": _fiscal_period(fiscal_date_ending),
+        "estimate_eps": estimate,
+        "time": EARNINGS_TIME_UNKNOWN
+    }
+
+def _parse_estimate(value: str) -> Optional[float]:
+    """EPS 예상치 문자열을 숫자로 변환 (빈 값, "None" 등 숫자가 아니면 None)"""
+    try:
+        estimate = float(value)
+    except (TypeError, ValueError):
+        return None
+    return round(estimate, 2) if math.isfinite(estimate) else None
+
+class _EarningsCsvParser:
+    """Alpha Vantage 실적 캘린더 CSV를 줄 단위로 받아 기간 내 이벤트만 모으는 증분 파서
+    
+    응답 전체를 메모리에 올리지 않고 수신한 줄을 바로 레코드로 변환합니다.
+    따옴표 안에 줄바꿈이 있는 필드는 따옴표가 닫힐 때까지 줄을 이어 붙입니다.
+    """
+
+    def __init__(self, start_date: date, end_date: date):
+        self.start = start_date.isoformat()
+        self.end = end_date.isoformat()
+        self.events: List[Dict[str, Any]] = []
+        self._columns: Optional[Dict[str, int]] = None
+        self._pending = ""
+
+    def feed(self, line: str) -> None:
+        """CSV 한 줄 입력 (헤더에 필수 컬럼이 없으면 KeyError)"""
+        self._pending += line
+        if self._pending.count('"') % 2:
+            return
+        record, self._pending = self._pending, ""
+        if not record.strip():
+            return
+        row = next(csv.reader([record]))
+        
+        if self._columns is None:
+            # 호출 제한 시에는 CSV 대신 JSON 안내 메시지가 오므로 헤더에서 걸러냄
+            self._columns = {name: index for index, name in enumerate(row)}
+            missing = [name for name in EARNINGS_CSV_REQUIRED_COLUMNS if name not in self._columns]
+            if missing:
+                raise KeyError(f"실적 캘린더 CSV 컬럼 누락: {missing}")
+            return
+        
+        report_date = self._field(row, "reportDate")
+        if not self.start <= report_date <= self.end:
+            return
+        self.events.append(_earnings_event(
+            self._field(row, "symbol"),
+            self._field(row, "name"),
+            report_date,
+            self._field(row, "fiscalDateEnding"),
+            _parse_estimate(self._field(row, "estimate"))
+        ))
+
+    def _field(self, row: List[str], name: str) -> str:
+        index = self._columns.get(name)
+        return row[index] if index is not None and index < len(row) else ""
+
+# 정적 경제 지표 일정 (날짜는 모듈 로드 시 한 번만 파싱)
+_ECONOMIC_EVENTS: Tuple[Tuple[date, Dict[str, Any]], ...] = tuple(
+    (date.fromisoformat(event["date"]), event)
+    for event in (
+        {
+            "event": "Non-Farm Payrolls",
+            "date": "2025-01-10",
+            "time": "08:30 ET",
+            "importance": "High",
+            "forecast": "200K",
+            "previous": "227K",
+            "actual": None,
+            "impact": "USD"
+        },
+        {
+            "event": "Consumer Price Index (CPI)",
+            "date": "2025-01-15",
+            "time": "08:30 ET",
+            "importance": "High",
+            "forecast": "2.7%",
+            "previous": "2.6%",
+            "actual": None,
+            "impact": "USD"
+        },
+        {
+            "event": "Federal Reserve Interest Rate Decision",
+            "date": "2025-01-20",
+            "time": "14:00 ET",
+            "importance": "High",
+            "forecast": "5.25%",
+            "previous": "5.25%",
+            "actual": None,
+            "impact": "USD"
+        },
+        {
+            "event": "GDP Preliminary",
+            "date": "2025-01-25",
+            "time": "08:30 ET",
+            "importance": "Medium",
+            "forecast": "2.8%",
+            "previous": "2.8%",
+            "actual": None,
+            "impact": "USD"
+        },
+        {
+            "event": "Unemployment Rate",
+            "date": "2025-01-10",
+            "time": "08:30 ET",
+            "importance": "High",
+            "forecast": "4.2%",
+            "previous": "4.2%",
+            "actual": None,
+            "impact": "USD"
+        }
+    )
+)
+
 class USStockAPIClient:
     """미국 주식 시장 데이터 API 클라이언트"""
     
+    # 모든 인스턴스가 공유하는 HTTP 세션 (요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록)
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _session_lock = asyncio.Lock()
+    _request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
     def __init__(self):
         """US Stock API 클라이언트 초기화"""
         # Alpha Vantage API 설정
@@ -45,65 +216,245 @@ class USStockAPIClient:
         # Yahoo Finance 대체 API 설정
         self.yahoo_finance_base_url = "https://query1.finance.yahoo.com/v8/finance/chart"
         
-        # API 호출 제한 (Alpha Vantage는 분당 5회 제한)
-        self.api_call_interval = 12  # 초
-        self.last_api_call = None
+        # API 호출 제한 (Alpha Vantage는 분당 5회 제한, 한도는 ALPHA_VANTAGE_RATE_LIMIT 등 모듈 상수)
+        # Redis를 쓸 수 없을 때 사용하는 키별 프로세스 내 슬라이딩 윈도우 (키 → 호출 시각 목록)
+        self._local_calls: Dict[str, deque] = {}
         
         # Mock 데이터 제공자
         self.mock_provider = USStockMockProvider()
         
-        # 세션 관리
-        self.session = None
+        # 자주 조회되는 종목용 프로세스 내 캐시와 업스트림 실패 시 사용할 마지막 성공 응답
+        self._local_cache = MemoryCacheBackend(LOCAL_CACHE_SIZE)
+        self._stale_cache = MemoryCacheBackend(LOCAL_CACHE_SIZE)
+        # 진행 중인 동일 조회 (캐시 키 → 결과 Future), 동시 요청은 업스트림을 한 번만 호출
+        self._inflight: Dict[str, "asyncio.Future[Optional[Any]]"] = {}
         
         if not self.alpha_vantage_key:
             logger.warning("Alpha Vantage API 키가 설정되지 않았습니다. Mock 데이터를 사용합니다.")
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30)
-        )
+        await self._get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """비동기 컨텍스트 매니저 종료"""
-        if self.session:
-            await self.session.close()
+        """비동기 컨텍스트 매니저 종료 (공유 세션은 서버 종료 시 close()로 정리)"""
+        pass
+    
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        return USStockAPIClient._shared_session
+    
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """공유 HTTP 세션 반환 (첫 요청 시 한 번만 생성)"""
+        if cls._shared_session is None or cls._shared_session.closed:
+            async with cls._session_lock:
+                if cls._shared_session is None or cls._shared_session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=CONNECTOR_LIMIT,
+                        limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                        keepalive_timeout=KEEPALIVE_TIMEOUT,
+                        ttl_dns_cache=300
+                    )
+                    cls._shared_session = aiohttp.ClientSession(
+                        timeout=REQUEST_TIMEOUT,
+                        connector=connector,
+                        json_serialize=lambda obj: orjson.dumps(obj).decode()
+                    )
+        return cls._shared_session
+    
+    @classmethod
+    async def close(cls):
+        """공유 HTTP 세션 종료"""
+        if cls._shared_session and not cls._shared_session.closed:
+            await cls._shared_session.close()
 
-    async def _wait_for_rate_limit(self):
-        """API 호출 제한 대기"""
-        if self.last_api_call:
-            elapsed = (datetime.now() - self.last_api_call).total_seconds()
-            if elapsed < self.api_call_interval:
-                wait_time = self.api_call_interval - elapsed
-                logger.debug(f"API 호출 제한으로 {wait_time:.1f}초 대기")
-                await asyncio.sleep(wait_time)
+    async def _acquire_slot(self, key: str, limit: int, window: int):
+        """Redis 정렬 집합 기반 슬라이딩 윈도우로 호출 슬롯 확보
+        
+        여러 워커 프로세스가 같은 키를 공유하므로 전체 호출 수가 제한을 넘지 않습니다.
+        Redis를 쓸 수 없으면 같은 제한을 프로세스 내 슬라이딩 윈도우로 적용합니다.
+        
+        Args:
+            key: 호출 기록을 저장할 Redis 키
+            limit: 윈도우 내 최대 호출 수
+            window: 윈도우 길이(초)
+        """
+        client = await get_async_redis_client()
+        if client is None:
+            await self._acquire_local_slot(key, limit, window)
+            return
         
-        self.last_api_call = datetime.now()
+        try:
+            while True:
+                now = time.time()
+                member = f"{now}:{uuid.uuid4().hex}"
+                pipe = client.pipeline()
+                pipe.zremrangebyscore(key, 0, now - window)
+                pipe.zadd(key, {member: now})
+                pipe.zcard(key)
+                pipe.expire(key, window)
+                _, _, count, _ = await pipe.execute()
+                if count <= limit:
+                    return
+                
+                # 한도 초과: 방금 추가한 기록을 지우고 가장 오래된 호출이 윈도우를 벗어날 때까지 대기
+                await client.zrem(key, member)
+                oldest = await client.zrange(key, 0, 0, withscores=True)
+                wait_time = (oldest[0][1] + window - now) if oldest else 1.0
+                logger.debug(f"API 호출 제한으로 {wait_time:.1f}초 대기 ({key})")
+                await asyncio.sleep(max(wait_time, 0.05))
+        except Exception as e:
+            logger.warning(f"Redis 호출 제한 확인 실패, 프로세스 단위 제한 사용: {e}")
+            await self._acquire_local_slot(key, limit, window)
 
-    async def _make_request(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """HTTP 요청 실행"""
-        await self._wait_for_rate_limit()
+    async def _acquire_local_slot(self, key: str, limit: int, window: int):
+        """프로세스 내 슬라이딩 윈도우로 호출 슬롯 확보 (_acquire_slot의 Redis 대체 경로)"""
+        calls = self._local_calls.setdefault(key, deque())
+        while True:
+            now = time.monotonic()
+            while calls and calls[0] <= now - window:
+                calls.popleft()
+            # 확인과 기록 사이에 await가 없으므로 동시 요청도 한도를 넘지 않음
+            if len(calls) < limit:
+                calls.append(now)
+                return
+            
+            wait_time = calls[0] + window - now
+            logger.debug(f"API 호출 제한으로 {wait_time:.1f}초 대기 ({key})")
+            await asyncio.sleep(wait_time)
+
+    async def _make_request(
+        self, url: str, params: Dict[str, Any], rate_limit: Tuple[str, int, int] = ALPHA_VANTAGE_RATE_LIMIT
+    ) -> Optional[Dict[str, Any]]:
+        """HTTP 요청 실행 (rate_limit: (Redis 키, 윈도우 내 최대 호출 수, 윈도우(초)))"""
+        raw = await self._make_request_raw(url, params, rate_limit)
+        if raw is None:
+            return None
         
         try:
-            if not self.session:
-                self.session = aiohttp.ClientSession()
-                
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    logger.error(f"API 호출 실패: {response.status}")
-                    return None
+            # Yahoo 차트 응답처럼 큰 JSON도 orjson으로 디코딩
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"API 응답 JSON 파싱 오류: {str(e)}")
+            return None
+
+    async def _make_request_raw(
+        self, url: str, params: Dict[str, Any], rate_limit: Tuple[str, int, int] = ALPHA_VANTAGE_RATE_LIMIT
+    ) -> Optional[bytes]:
+        """HTTP 요청 실행 후 응답 본문을 그대로 반환 (CSV 응답용)"""
+        await self._acquire_slot(*rate_limit)
+        
+        try:
+            session = await self._get_session()
+            async with self._request_semaphore:
+                async with session.get(url, params=params) as response:
+                    if response.status == 200:
+                        return await response.read()
+                    else:
+                        logger.error(f"API 호출 실패: {response.status}")
+                        return None
                     
         except Exception as e:
             logger.error(f"API 요청 중 오류: {str(e)}")
             return None
 
+    async def _make_request_lines(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        consume: Callable[[str], None],
+        rate_limit: Tuple[str, int, int] = ALPHA_VANTAGE_RATE_LIMIT
+    ) -> bool:
+        """HTTP 요청 후 응답 본문을 수신하는 대로 한 줄씩 consume에 전달 (CSV 스트리밍 파싱용)
+        
+        요청 실패 시 False를 반환하고, consume에서 발생한 파싱 오류는 호출자에게 전달합니다.
+        """
+        await self._acquire_slot(*rate_limit)
+        
+        try:
+            session = await self._get_session()
+            async with self._request_semaphore:
+                async with session.get(url, params=params) as response:
+                    if response.status != 200:
+                        logger.error(f"API 호출 실패: {response.status}")
+                        return False
+                    async for line in response.content:
+                        consume(line.decode("utf-8"))
+                    return True
+                    
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"API 요청 중 오류: {str(e)}")
+            return False
+
+    async def _cached(self, key: str, ttl: int, fetch: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        """프로세스 내 캐시 → Redis → 업스트림 순으로 조회 (실패 시 None)
+        
+        같은 키의 동시 요청은 진행 중인 조회 결과를 함께 기다리고,
+        업스트림 조회가 실패하면 마지막 성공 응답을 stale=True로 표시해 반환합니다.
+        캐시된 객체는 여러 호출자가 공유하므로 호출자에게는 깊은 복사본을 반환합니다.
+        
+        Args:
+            key: 캐시 키 (엔드포인트 + 파라미터)
+            ttl: 캐시 유효 시간(초)
+            fetch: 실제 API 조회 함수
+        """
+        cached = self._local_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        # 같은 조회가 이미 진행 중이면 그 결과를 함께 기다림
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch_cached(key, ttl, fetch))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 호출자가 취소되어도 공유 조회는 계속 진행
+        result = await asyncio.shield(pending)
+        if result is not None:
+            return copy.deepcopy(result)
+        
+        stale = self._stale_cache.get(key)
+        if stale is not None:
+            logger.warning(f"업스트림 조회 실패, 마지막 캐시 데이터 반환: {key}")
+            if isinstance(stale, list):
+                return [{**copy.deepcopy(item), "stale": True} for item in stale]
+            return {**copy.deepcopy(stale), "stale": True}
+        return None
+
+    async def _fetch_cached(self, key: str, ttl: int, fetch: Callable[[], Awaitable[Optional[Any]]]) -> Optional[Any]:
+        """Redis 캐시 확인 후 업스트림을 조회하고 성공한 응답을 두 캐시에 저장"""
+        redis_key = f"{CACHE_KEY_PREFIX}:{key}"
+        result = await async_cache_get(redis_key)
+        if result is None:
+            result = await fetch()
+            if result is None:
+                return None
+            await async_cache_set(redis_key, result, ttl)
+        
+        self._local_cache.set(key, result, ttl)
+        self._stale_cache.set(key, result, STALE_CACHE_TTL)
+        return result
+
     async def get_stock_quote(self, symbol: str) -> Dict[str, Any]:
         """실시간 주가 조회"""
         logger.info(f"US 주식 현재가 조회: {symbol}")
         
+        quote_data = await self._get_cached_quote(symbol)
+        if quote_data:
+            return quote_data
+        
+        # Mock 데이터 반환
+        logger.warning(f"실제 API 호출 실패, Mock 데이터 반환: {symbol}")
+        return self.mock_provider.get_stock_quote(symbol)
+
+    async def _get_cached_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """캐시를 거쳐 실제 API로 주가 조회 (실패 시 None)"""
+        return await self._cached(f"quote:{symbol}", QUOTE_CACHE_TTL, lambda: self._fetch_stock_quote(symbol))
+
+    async def _fetch_stock_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Alpha Vantage → Yahoo Finance 순으로 주가 조회 (모두 실패 시 None)"""
         # Alpha Vantage API 호출 시도
         if self.alpha_vantage_key:
             quote_data = await self._get_alpha_vantage_quote(symbol)
@@ -111,13 +462,7 @@ class USStockAPIClient:
                 return quote_data
         
         # Yahoo Finance API 대체 시도
-        yahoo_data = await self._get_yahoo_finance_quote(symbol)
-        if yahoo_data:
-            return yahoo_data
-        
-        # Mock 데이터 반환
-        logger.warning(f"실제 API 호출 실패, Mock 데이터 반환: {symbol}")
-        return self.mock_provider.get_stock_quote(symbol)
+        return await self._get_yahoo_finance_quote(symbol)
 
     async def _get_alpha_vantage_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Alpha Vantage API로 주가 조회"""
@@ -162,7 +507,7 @@ class USStockAPIClient:
             "range": "1d"
         }
         
-        response = await self._make_request(url, params)
+        response = await self._make_request(url, params, YAHOO_FINANCE_RATE_LIMIT)
         if not response:
             return None
             
@@ -210,7 +555,10 @@ class USStockAPIClient:
         
         # Alpha Vantage Earnings Calendar API 호출 시도
         if self.alpha_vantage_key:
-            earnings_data = await self._get_alpha_vantage_earnings(start_date, end_date)
+            earnings_data = await self._cached(
+                f"earnings:{start_date.isoformat()}:{end_date.isoformat()}", EARNINGS_CACHE_TTL,
+                lambda: self._get_alpha_vantage_earnings(start_date, end_date)
+            )
             if earnings_data:
                 return earnings_data
         
@@ -226,14 +574,15 @@ class USStockAPIClient:
             "apikey": self.alpha_vantage_key
         }
         
-        response = await self._make_request(self.alpha_vantage_base_url, params)
-        if not response:
+        # CSV 형식 응답을 수신하면서 파싱 (Alpha Vantage 실적 캘린더는 CSV 반환, 호출 제한 시에는 JSON 안내 메시지)
+        parser = _EarningsCsvParser(start_date, end_date)
+        try:
+            if not await self._make_request_lines(self.alpha_vantage_base_url, params, parser.feed):
+                return None
+        except (KeyError, ValueError, UnicodeDecodeError, csv.Error) as e:
+            logger.error(f"Alpha Vantage 실적 캘린더 파싱 오류: {e}")
             return None
-            
-        # CSV 형식 응답 파싱 (Alpha Vantage 실적 캘린더는 CSV 반환)
-        # 실제 구현에서는 CSV 파싱 로직 필요
-        # 여기서는 Mock 데이터 반환
-        return None
+        return parser.events or None
 
     async def get_dividend_calendar(self, start_date: date = None, end_date: date = None) -> List[Dict[str, Any]]:
         """배당 일정 캘린더 조회"""
@@ -264,18 +613,27 @@ class USStockAPIClient:
         logger.info(f"다중 종목 조회: {symbols}")
         
         results = {}
+        failed_symbols = []
         # 동시 실행으로 성능 개선
-        tasks = [self.get_stock_quote(symbol) for symbol in symbols]
+        tasks = [self._get_cached_quote(symbol) for symbol in symbols]
         quotes = await asyncio.gather(*tasks, return_exceptions=True)
         
         for symbol, quote in zip(symbols, quotes):
             if isinstance(quote, Exception):
                 logger.error(f"{symbol} 조회 실패: {quote}")
-                results[symbol] = self.mock_provider.get_stock_quote(symbol)
+                failed_symbols.append(symbol)
+            elif not quote:
+                failed_symbols.append(symbol)
             else:
                 results[symbol] = quote
+        
+        # 실패한 종목은 Mock 데이터를 한 번에 생성
+        if failed_symbols:
+            logger.warning(f"실제 API 호출 실패, Mock 데이터 반환: {failed_symbols}")
+            for quote in self.mock_provider.get_stock_quotes_batch(failed_symbols):
+                results[quote["symbol"]] = quote
                 
-        return results
+        return {symbol: results[symbol] for symbol in symbols}
 
     async def get_market_status(self) -> Dict[str, Any]:
         """미국 시장 상태 조회"""
@@ -319,6 +677,7 @@ class USStockMockProvider:
             "JNJ": {"name": "Johnson & Johnson", "sector": "Healthcare", "price": 155.00},
             "V": {"name": "Visa Inc.", "sector": "Financial Services", "price": 285.00}
         }
+        self._rng = np.random.default_rng()
 
     def get_stock_quote(self, symbol: str) -> Dict[str, Any]:
         """Mock 주식 데이터 반환"""
@@ -357,125 +716,136 @@ class USStockMockProvider:
             "source": "mock"
         }
 
+    def get_stock_quotes_batch(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """여러 종목의 Mock 주식 데이터를 한 번에 생성 (난수는 종목 수만큼 벡터로 생성)"""
+        count = len(symbols)
+        if not count:
+            return []
+        
+        unknown = {"name": None, "sector": "Unknown", "price": 100.00}
+        stock_infos = [self.major_stocks.get(symbol, unknown) for symbol in symbols]
+        base_prices = np.array([info["price"] for info in stock_infos], dtype=np.float64)
+        rng = self._rng
+        
+        # 무작위 변동률 생성 (-5% ~ +5%)
+        change_percents = rng.uniform(-5.0, 5.0, count)
+        changes = base_prices * change_percents / 100
+        current_prices = base_prices + changes
+        
+        # 일중 고가/저가 생성 (3% 범위)
+        daily_ranges = base_prices * 0.03
+        highs = current_prices + rng.uniform(0, 1, count) * daily_ranges
+        lows = current_prices - rng.uniform(0, 1, count) * daily_ranges
+        open_prices = base_prices + rng.uniform(-0.5, 0.5, count) * daily_ranges
+        volumes = rng.integers(1000000, 50000000, count, endpoint=True)
+        
+        latest_trading_day = datetime.now().strftime("%Y-%m-%d")
+        return [
+            {
+                "symbol": symbol,
+                "name": info["name"] or f"Unknown Stock {symbol}",
+                "sector": info["sector"],
+                "price": price,
+                "change": change,
+                "change_percent": f"{change_percent:.2f}",
+                "volume": volume,
+                "latest_trading_day": latest_trading_day,
+                "previous_close": previous_close,
+                "open": open_price,
+                "high": high,
+                "low": low,
+                "source": "mock"
+            }
+            for symbol, info, price, change, change_percent, volume, previous_close, open_price, high, low in zip(
+                symbols,
+                stock_infos,
+                np.round(current_prices, 2).tolist(),
+                np.round(changes, 2).tolist(),
+                change_percents.tolist(),
+                volumes.tolist(),
+                base_prices.tolist(),
+                np.round(open_prices, 2).tolist(),
+                np.round(highs, 2).tolist(),
+                np.round(lows, 2).tolist()
+            )
+        ]
+
+    def _sample_weekdays(self, start_date: date, end_date: date, probability: float) -> np.ndarray:
+        """기간 내 평일 중 주어진 확률로 이벤트가 발생하는 날의 오프셋(일) 배열"""
+        n_days = (end_date - start_date).days + 1
+        if n_days <= 0:
+            return np.empty(0, dtype=np.int64)
+        days = np.arange(n_days)
+        weekday_mask = (start_date.weekday() + days) % 7 < 5
+        return days[weekday_mask & (self._rng.random(n_days) < probability)]
+
     def get_earnings_calendar(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         """Mock 실적 캘린더 데이터"""
-        earnings_events = []
         symbols = list(self.major_stocks.keys())
         
-        # 기간 내 날짜들에 대해 실적 이벤트 생성
-        current_date = start_date
-        while current_date <= end_date:
-            # 평일에만 실적 발표
-            if current_date.weekday() < 5:
-                # 20% 확률로 실적 발표
-                if random.random() < 0.2:
-                    symbol = random.choice(symbols)
-                    stock_info = self.major_stocks[symbol]
-                    
-                    earnings_events.append({
-                        "symbol": symbol,
-                        "company_name": stock_info["name"],
-                        "report_date": current_date.strftime("%Y-%m-%d"),
-                        "fiscal_period": f"Q{random.randint(1, 4)} 2024",
-                        "estimate_eps": round(random.uniform(1.0, 5.0), 2),
-                        "time": random.choice(["Before Market Open", "After Market Close"]),
-                        "sector": stock_info["sector"]
-                    })
-            
-            current_date += timedelta(days=1)
+        # 평일 중 20% 확률로 실적 발표, 종목/분기/EPS/시간은 이벤트 수만큼 한 번에 생성
+        event_days = self._sample_weekdays(start_date, end_date, 0.2)
+        count = event_days.size
+        rng = self._rng
+        symbol_indices = rng.integers(0, len(symbols), count)
+        quarters = rng.integers(1, 4, count, endpoint=True)
+        estimates = np.round(rng.uniform(1.0, 5.0, count), 2)
+        before_open = rng.random(count) < 0.5
+        
+        earnings_events = []
+        for offset, symbol_index, quarter, estimate, is_before_open in zip(
+            event_days.tolist(), symbol_indices.tolist(), quarters.tolist(), estimates.tolist(), before_open.tolist()
+        ):
+            symbol = symbols[symbol_index]
+            stock_info = self.major_stocks[symbol]
+            earnings_events.append({
+                "symbol": symbol,
+                "company_name": stock_info["name"],
+                "report_date": (start_date + timedelta(days=offset)).strftime("%Y-%m-%d"),
+                "fiscal_period": f"Q{quarter} 2024",
+                "estimate_eps": estimate,
+                "time": "Before Market Open" if is_before_open else "After Market Close",
+                "sector": stock_info["sector"]
+            })
         
         return earnings_events
 
     def get_dividend_calendar(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         """Mock 배당 캘린더 데이터"""
-        dividend_events = []
         dividend_stocks = ["AAPL", "MSFT", "JPM", "JNJ", "WMT", "V"]
         
-        current_date = start_date
-        while current_date <= end_date:
-            if current_date.weekday() < 5:  # 평일만
-                if random.random() < 0.1:  # 10% 확률
-                    symbol = random.choice(dividend_stocks)
-                    stock_info = self.major_stocks[symbol]
-                    
-                    dividend_events.append({
-                        "symbol": symbol,
-                        "company_name": stock_info["name"],
-                        "ex_dividend_date": current_date.strftime("%Y-%m-%d"),
-                        "record_date": (current_date + timedelta(days=2)).strftime("%Y-%m-%d"),
-                        "payment_date": (current_date + timedelta(days=30)).strftime("%Y-%m-%d"),
-                        "dividend_amount": round(random.uniform(0.50, 3.00), 2),
-                        "yield": round(random.uniform(1.5, 4.0), 2),
-                        "frequency": "Quarterly"
-                    })
-            
-            current_date += timedelta(days=1)
+        # 평일 중 10% 확률로 배당락, 종목/배당금/수익률은 이벤트 수만큼 한 번에 생성
+        event_days = self._sample_weekdays(start_date, end_date, 0.1)
+        count = event_days.size
+        rng = self._rng
+        symbol_indices = rng.integers(0, len(dividend_stocks), count)
+        amounts = np.round(rng.uniform(0.50, 3.00, count), 2)
+        yields = np.round(rng.uniform(1.5, 4.0, count), 2)
+        
+        dividend_events = []
+        for offset, symbol_index, amount, dividend_yield in zip(
+            event_days.tolist(), symbol_indices.tolist(), amounts.tolist(), yields.tolist()
+        ):
+            symbol = dividend_stocks[symbol_index]
+            ex_dividend_date = start_date + timedelta(days=offset)
+            dividend_events.append({
+                "symbol": symbol,
+                "company_name": self.major_stocks[symbol]["name"],
+                "ex_dividend_date": ex_dividend_date.strftime("%Y-%m-%d"),
+                "record_date": (ex_dividend_date + timedelta(days=2)).strftime("%Y-%m-%d"),
+                "payment_date": (ex_dividend_date + timedelta(days=30)).strftime("%Y-%m-%d"),
+                "dividend_amount": amount,
+                "yield": dividend_yield,
+                "frequency": "Quarterly"
+            })
         
         return dividend_events
 
     def get_economic_calendar(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         """Mock 경제 지표 캘린더 데이터"""
-        economic_events = [
-            {
-                "event": "Non-Farm Payrolls",
-                "date": "2025-01-10",
-                "time": "08:30 ET",
-                "importance": "High",
-                "forecast": "200K",
-                "previous": "227K",
-                "actual": None,
-                "impact": "USD"
-            },
-            {
-                "event": "Consumer Price Index (CPI)",
-                "date": "2025-01-15",
-                "time": "08:30 ET",
-                "importance": "High",
-                "forecast": "2.7%",
-                "previous": "2.6%",
-                "actual": None,
-                "impact": "USD"
-            },
-            {
-                "event": "Federal Reserve Interest Rate Decision",
-                "date": "2025-01-20",
-                "time": "14:00 ET",
-                "importance": "High",
-                "forecast": "5.25%",
-                "previous": "5.25%",
-                "actual": None,
-                "impact": "USD"
-            },
-            {
-                "event": "GDP Preliminary",
-                "date": "2025-01-25",
-                "time": "08:30 ET",
-                "importance": "Medium",
-                "forecast": "2.8%",
-                "previous": "2.8%",
-                "actual": None,
-                "impact": "USD"
-            },
-            {
-                "event": "Unemployment Rate",
-                "date": "2025-01-10",
-                "time": "08:30 ET",
-                "importance": "High",
-                "forecast": "4.2%",
-                "previous": "4.2%",
-                "actual": None,
-                "impact": "USD"
-            }
-        ]
-        
-        # 날짜 필터링
-        filtered_events = []
-        for event in economic_events:
-            event_date = datetime.strptime(event["date"], "%Y-%m-%d").date()
-            if start_date <= event_date <= end_date:
-                filtered_events.append(event)
-        
-        return filtered_events
+        return [dict(event) for event_date, event in _ECONOMIC_EVENTS if start_date <= event_date <= end_date]
 
-# 전역 클라이언트 인스턴스
-us_stock_api_client = USStockAPIClient()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_us_stock_client() -> USStockAPIClient:
+    """전역 클라이언트 인스턴스 반환 (환경 변수 확인 등 초기화는 첫 사용 시점으로 미룸)"""
+    return USStockAPIClient()
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""
+프로세스 내 메모리 캐시
+
+TTL 만료와 LRU 축출을 지원하는 단순 키-값 캐시를 제공합니다.
+외부 API 클라이언트 응답, 라우트 응답 등 네트워크 없이 재사용할 값에 사용합니다.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+
+class MemoryCacheBackend:
+    """TTL과 LRU 축출을 지원하는 프로세스 내 캐시"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._store: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        self._store[key] = (time.monotonic() + ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_entries:
+            self._store.popitem(last=False)
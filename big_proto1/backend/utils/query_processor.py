@@ -8,10 +8,17 @@
 - tf-idf 기반 _score 정렬 제공
 """
 import re
-from typing import List, Tuple
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+# Aho-Corasick 선택적 임포트 (의도 분석 키워드를 한 번의 스캔으로 매칭)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # 한국어 불용어 확장 리스트
-STOPWORDS = {
+STOPWORDS = frozenset({
     # 조사
     '과', '와', '의', '은', '는', '이', '가', '을', '를', '에', '에서', '에게', '께', '으로', '로', '와', '과',
     '도', '만', '까지', '부터', '처럼', '같이', '보다', '마다', '조차', '마저', '뿐', '밖에',
@@ -42,7 +49,11 @@ STOPWORDS = {
     
     # 기타
     '것', '거', '게', '점', '번', '개', '명', '건', '회', '차례', '때', '경우', '상황'
-}
+})
+
+# 전처리 정규식 (모듈 로드 시 한 번만 컴파일)
+_STRIP_RE = re.compile(r'[^\w\s가-힣]')
+_WS_RE = re.compile(r'\s+')
 
 # 회사명 정규화 맵핑
 COMPANY_NORMALIZATION = {
@@ -65,40 +76,31 @@ def preprocess_query(text: str) -> List[str]:
         추출된 핵심 키워드 리스트 (예: ['네이버', '주가', '실황'])
     """
     # 1. 특수문자 제거 (한글, 영문, 숫자만 유지)
-    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    text = _STRIP_RE.sub(' ', text)
     
     # 2. 연속된 공백을 하나로 통합
-    text = re.sub(r'\s+', ' ', text.strip())
-    
-    # 3. 단어 분리
-    words = text.split()
-    
-    # 4. 회사명 정규화 및 필터링
-    keywords = []
-    for word in words:
-        word = word.strip()
-        
-        # 회사명 정규화 적용
-        if word in COMPANY_NORMALIZATION:
-            word = COMPANY_NORMALIZATION[word]
-        
-        # 필터링 조건
-        if (len(word) >= 2 and  # 2글자 이상
-            word not in STOPWORDS and  # 불용어 아님
-            not word.isdigit() and  # 순수 숫자 아님
-            not re.match(r'.*[?!]$', word)):  # 물음표/느낌표로 끝나지 않음
-            keywords.append(word)
-    
-    # 5. 중복 제거하되 순서 유지
-    return list(dict.fromkeys(keywords))
+    text = _WS_RE.sub(' ', text.strip())
+    
+    # 3. 단어 분리 후 회사명 정규화 적용
+    words = (COMPANY_NORMALIZATION.get(word, word) for word in text.split())
+    
+    # 4. 필터링하면서 중복 제거 (순서 유지)
+    return list(dict.fromkeys(
+        word for word in words
+        if len(word) >= 2  # 2글자 이상
+        and not word.isdigit()  # 순수 숫자 아님
+        and word not in STOPWORDS  # 불용어 아님
+        and not word.endswith(('?', '!'))  # 물음표/느낌표로 끝나지 않음
+    ))
 
-def build_bigkinds_query(keywords: List[str], strategy: str = "and") -> str:
+def build_bigkinds_query(keywords: List[str], strategy: str = "and", already_quoted: bool = False) -> str:
     """
     빅카인즈 API용 쿼리 문자열 생성
     
     Args:
         keywords: 키워드 리스트
         strategy: "and" (정확도 우선) 또는 "or" (범위 우선)
+        already_quoted: True면 키워드가 이미 따옴표로 감싸져 있다고 보고 그대로 결합
         
     Returns:
         빅카인즈 API 쿼리 문자열
@@ -106,15 +108,17 @@ def build_bigkinds_query(keywords: List[str], strategy: str = "and") -> str:
     if not keywords:
         return ""
     
-    if len(keywords) == 1:
-        return f'"{keywords[0]}"'
+    quoted = keywords if already_quoted else [f'"{keyword}"' for keyword in keywords]
+    
+    if len(quoted) == 1:
+        return quoted[0]
     
     if strategy == "and":
         # 정확도 우선: "키워드1" AND "키워드2" AND "키워드3"
-        return " AND ".join([f'"{keyword}"' for keyword in keywords])
+        return " AND ".join(quoted)
     else:
         # 범위 우선: "키워드1" OR "키워드2" OR "키워드3" 
-        return " OR ".join([f'"{keyword}"' for keyword in keywords])
+        return " OR ".join(quoted)
 
 def create_fallback_queries(keywords: List[str]) -> List[Tuple[str, str]]:
     """
@@ -130,43 +134,87 @@ def create_fallback_queries(keywords: List[str]) -> List[Tuple[str, str]]:
         return []
     
     queries = []
+    # 모든 폴백 쿼리가 같은 키워드 앞부분을 쓰므로 따옴표 처리는 한 번만
+    quoted = [f'"{keyword}"' for keyword in keywords]
     
     # 1순위: 모든 키워드 AND 검색
     if len(keywords) > 1:
         queries.append((
-            build_bigkinds_query(keywords, "and"),
+            build_bigkinds_query(quoted, "and", already_quoted=True),
             f"정확도 우선 (모든 키워드 포함): {' + '.join(keywords)}"
         ))
     
     # 2순위: 중요 키워드만 AND 검색 (처음 3개)
     if len(keywords) > 3:
         queries.append((
-            build_bigkinds_query(keywords[:3], "and"),
+            build_bigkinds_query(quoted[:3], "and", already_quoted=True),
             f"핵심 키워드 우선: {' + '.join(keywords[:3])}"
         ))
     
     # 3순위: 가장 중요한 2개 키워드만
     if len(keywords) > 2:
         queries.append((
-            build_bigkinds_query(keywords[:2], "and"),
+            build_bigkinds_query(quoted[:2], "and", already_quoted=True),
             f"주요 키워드: {' + '.join(keywords[:2])}"
         ))
     
     # 4순위: OR 검색 (범위 확대)
     if len(keywords) > 1:
         queries.append((
-            build_bigkinds_query(keywords, "or"),
+            build_bigkinds_query(quoted, "or", already_quoted=True),
             f"범위 확대: {' 또는 '.join(keywords)}"
         ))
     
     # 5순위: 첫 번째 키워드만
     queries.append((
-        build_bigkinds_query([keywords[0]], "and"),
+        quoted[0],
         f"기본 검색: {keywords[0]}"
     ))
     
     return queries
 
+# 의도 분석 키워드 그룹
+INTENT_KEYWORDS: Dict[str, FrozenSet[str]] = {
+    # 기업 관련 키워드
+    "company": frozenset({'삼성', '엘지', 'LG', '현대', '네이버', '카카오', '포스코', 'SK', '한화'}),
+    # 시장/경제 관련 키워드
+    "finance": frozenset({'주가', '주식', '증권', '시장', '경제', '금리', '환율', '거래'}),
+    # 실시간성 키워드
+    "realtime": frozenset({'실황', '실시간', '현재', '지금', '오늘', '최신'}),
+    # 비교 분석 키워드
+    "comparison": frozenset({'비교', '차이', '대비', '경쟁', 'vs', '대', '와의'}),
+    # 분석 깊이 키워드
+    "depth": frozenset({'분석', '전망', '예측', '평가'}),
+}
+
+def _build_intent_automaton():
+    """키워드 → 소속 그룹 집합 오토마톤 생성 (모듈 로드 시 한 번)"""
+    keyword_groups: Dict[str, Set[str]] = {}
+    for group, keywords in INTENT_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_groups.setdefault(keyword, set()).add(group)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, groups in keyword_groups.items():
+        automaton.add_word(keyword, frozenset(groups))
+    automaton.make_automaton()
+    return automaton
+
+_INTENT_AUTOMATON = _build_intent_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _match_intent_groups(text: str) -> Set[str]:
+    """텍스트에 키워드가 하나라도 등장하는 의도 그룹 집합"""
+    if _INTENT_AUTOMATON is not None:
+        matched: Set[str] = set()
+        for _, groups in _INTENT_AUTOMATON.iter(text):
+            matched |= groups
+        return matched
+    # 조사/복합어에 붙은 키워드('삼성전자'의 '삼성')도 잡도록 부분 문자열 검사
+    return {
+        group for group, keywords in INTENT_KEYWORDS.items()
+        if any(keyword in text for keyword in keywords)
+    }
+
 def analyze_query_intent(text: str) -> dict:
     """
     사용자 질문의 의도를 분석
@@ -184,28 +232,21 @@ def analyze_query_intent(text: str) -> dict:
         "analysis_depth": "basic"  # basic, detailed, comprehensive
     }
     
-    # 기업 관련 키워드
-    company_keywords = ['삼성', '엘지', 'LG', '현대', '네이버', '카카오', '포스코', 'SK', '한화']
-    if any(keyword in text for keyword in company_keywords):
-        intent["type"] = "company"
+    matched = _match_intent_groups(text)
     
-    # 시장/경제 관련 키워드  
-    market_keywords = ['주가', '주식', '증권', '시장', '경제', '금리', '환율', '거래']
-    if any(keyword in text for keyword in market_keywords):
+    # 시장/경제 키워드가 기업 키워드보다 우선
+    if "finance" in matched:
         intent["type"] = "finance"
+    elif "company" in matched:
+        intent["type"] = "company"
     
-    # 실시간성 키워드
-    realtime_keywords = ['실황', '실시간', '현재', '지금', '오늘', '최신']
-    if any(keyword in text for keyword in realtime_keywords):
+    if "realtime" in matched:
         intent["time_sensitive"] = True
     
-    # 비교 분석 키워드
-    comparison_keywords = ['비교', '차이', '대비', '경쟁', 'vs', '대', '와의']
-    if any(keyword in text for keyword in comparison_keywords):
+    if "comparison" in matched:
         intent["comparison"] = True
     
-    # 분석 깊이
-    if any(keyword in text for keyword in ['분석', '전망', '예측', '평가']):
+    if "depth" in matched:
         intent["analysis_depth"] = "detailed"
     
-    return intent 
\ No newline at end of file
+    return intent
@@ -4,9 +4,11 @@ Redis 캐싱 유틸리티
 이 모듈은 Redis를 사용한 캐싱 기능을 제공합니다.
 """
 
+import asyncio
 import json
 import os
-from typing import Any, Optional, Union, Callable
+import time
+from typing import Any, List, Optional, Union, Callable
 from functools import wraps
 import hashlib
 import logging
@@ -17,13 +19,62 @@ logger = logging.getLogger(__name__)
 # Redis 라이브러리 선택적 임포트
 try:
     import redis
+    import redis.asyncio as aioredis
     REDIS_AVAILABLE = True
 except ImportError:
     logger.warning("Redis 라이브러리가 설치되지 않았습니다. 캐싱이 비활성화됩니다.")
     REDIS_AVAILABLE = False
 
-# Redis 클라이언트 인스턴스
+# orjson 선택적 임포트 (캐시 직렬화/역직렬화 고속화)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# xxhash 선택적 임포트 (캐시 키 다이제스트 고속화, 없으면 md5 사용)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# 커넥션 풀 설정 (풀 크기 상한으로 파일 디스크립터 고갈 방지, 주기적 헬스체크로 끊긴 연결 재사용 방지)
+REDIS_MAX_CONNECTIONS = 64
+REDIS_HEALTH_CHECK_INTERVAL = 30
+# 비동기 연결 실패 후 재연결을 시도하기까지 대기 시간(초)
+REDIS_RECONNECT_INTERVAL = 30
+
+# Redis 클라이언트 인스턴스 (동기 / 비동기)
 _redis_client = None
+_async_redis_client = None
+# 첫 요청들이 동시에 연결을 만들지 않도록 비동기 클라이언트 초기화를 직렬화
+_async_redis_lock = asyncio.Lock()
+_async_redis_retry_at = 0.0
+
+def _serialize(value: Any) -> Union[bytes, str]:
+    """캐시 값 JSON 직렬화 (orjson 우선, 표준 json과 같은 결과)
+    
+    정수 키는 문자열 키로, 튜플은 리스트로 저장되며
+    JSON으로 표현할 수 없는 값은 표준 json처럼 TypeError로 저장에 실패합니다.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            # datetime/dataclass도 표준 json처럼 변환하지 않고 TypeError로 처리
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+        except TypeError:
+            # 64비트를 넘는 정수 등 orjson이 처리하지 못하는 값은 표준 json으로 재시도
+            pass
+    return json.dumps(value, ensure_ascii=False)
+
+def _deserialize(value: Union[bytes, str]) -> Any:
+    """캐시 값 역직렬화"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
 
 def get_redis_client() -> Optional['redis.Redis']:
     """Redis 클라이언트 인스턴스를 반환합니다."""
@@ -38,9 +89,12 @@ def get_redis_client() -> Optional['redis.Redis']:
         try:
             _redis_client = redis.Redis.from_url(
                 redis_url, 
-                decode_responses=True,
+                decode_responses=False,  # orjson이 bytes를 바로 읽으므로 디코딩 생략
                 socket_timeout=5,
-                socket_connect_timeout=5
+                socket_connect_timeout=5,
+                socket_keepalive=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL
             )
             _redis_client.ping()
             logger.info("Redis 연결 성공")
@@ -49,6 +103,43 @@ def get_redis_client() -> Optional['redis.Redis']:
             _redis_client = None
     return _redis_client
 
+async def get_async_redis_client() -> Optional['aioredis.Redis']:
+    """이벤트 루프를 막지 않는 비동기 Redis 클라이언트 인스턴스를 반환합니다."""
+    global _async_redis_client, _async_redis_retry_at
+    
+    if not REDIS_AVAILABLE:
+        return None
+    
+    if _async_redis_client is not None:
+        return _async_redis_client
+    
+    # 최근 연결에 실패했다면 재연결 간격이 지날 때까지 시도하지 않음
+    if time.monotonic() < _async_redis_retry_at:
+        return None
+    
+    async with _async_redis_lock:
+        if _async_redis_client is None and time.monotonic() >= _async_redis_retry_at:
+            redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+            pool = aioredis.ConnectionPool.from_url(
+                redis_url,
+                decode_responses=False,  # orjson이 bytes를 바로 읽으므로 디코딩 생략
+                socket_timeout=5,
+                socket_connect_timeout=5,
+                socket_keepalive=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL
+            )
+            client = aioredis.Redis(connection_pool=pool)
+            try:
+                await client.ping()
+                _async_redis_client = client
+                logger.info("비동기 Redis 연결 성공")
+            except Exception as e:
+                logger.warning(f"비동기 Redis 연결 실패: {str(e)}, 캐싱이 비활성화됩니다")
+                _async_redis_retry_at = time.monotonic() + REDIS_RECONNECT_INTERVAL
+                await pool.disconnect()
+    return _async_redis_client
+
 def cache_set(key: str, value: Any, expire_seconds: int = 21600) -> bool:
     """
     Redis에 키-값 쌍을 저장합니다.
@@ -66,8 +157,7 @@ def cache_set(key: str, value: Any, expire_seconds: int = 21600) -> bool:
         return False
     
     try:
-        serialized = json.dumps(value, ensure_ascii=False)
-        return client.set(key, serialized, ex=expire_seconds)
+        return client.set(key, _serialize(value), ex=expire_seconds)
     except Exception as e:
         logger.error(f"Redis 캐시 저장 오류: {e}")
         return False
@@ -89,12 +179,87 @@ def cache_get(key: str) -> Optional[Any]:
     try:
         value = client.get(key)
         if value:
-            return json.loads(value)
+            return _deserialize(value)
         return None
     except Exception as e:
         logger.error(f"Redis 캐시 조회 오류: {e}")
         return None
 
+async def async_cache_set(key: str, value: Any, expire_seconds: int = 21600) -> bool:
+    """
+    cache_set의 비동기 버전 (async 함수 안에서 사용)
+    
+    Args:
+        key: 캐시 키
+        value: 저장할 값 (JSON 직렬화 가능)
+        expire_seconds: 만료 시간(초), 기본값 6시간(21600초)
+    
+    Returns:
+        bool: 성공 여부
+    """
+    client = await get_async_redis_client()
+    if not client:
+        return False
+    
+    try:
+        return await client.set(key, _serialize(value), ex=expire_seconds)
+    except Exception as e:
+        logger.error(f"Redis 캐시 저장 오류: {e}")
+        return False
+
+async def async_cache_get(key: str) -> Optional[Any]:
+    """
+    cache_get의 비동기 버전 (async 함수 안에서 사용)
+    
+    Args:
+        key: 캐시 키
+    
+    Returns:
+        캐시된 값 또는 None (캐시 미스)
+    """
+    client = await get_async_redis_client()
+    if not client:
+        return None
+    
+    try:
+        value = await client.get(key)
+        if value:
+            return _deserialize(value)
+        return None
+    except Exception as e:
+        logger.error(f"Redis 캐시 조회 오류: {e}")
+        return None
+
+async def async_cache_mget(keys: List[str]) -> List[Optional[Any]]:
+    """
+    여러 키를 MGET 한 번의 왕복으로 조회합니다.
+    
+    Args:
+        keys: 캐시 키 목록
+    
+    Returns:
+        키 순서대로 캐시된 값 또는 None (캐시 미스) 목록
+    """
+    if not keys:
+        return []
+    
+    client = await get_async_redis_client()
+    if not client:
+        return [None] * len(keys)
+    
+    try:
+        values = await client.mget(keys)
+        return [_deserialize(value) if value else None for value in values]
+    except Exception as e:
+        logger.error(f"Redis 캐시 일괄 조회 오류: {e}")
+        return [None] * len(keys)
+
+def _hash_key(key_str: str) -> str:
+    """캐시 키용 비암호화 다이제스트 (xxh3 64비트, 없으면 md5)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_hexdigest(key_str)
+    return hashlib.md5(key_str.encode()).hexdigest()
+
 def generate_cache_key(prefix: str, *args, **kwargs) -> str:
     """
     인자들을 기반으로 일관된 캐시 키를 생성합니다.
@@ -106,22 +271,10 @@ def generate_cache_key(prefix: str, *args, **kwargs) -> str:
     Returns:
         str: 생성된 캐시 키
     """
-    key_parts = [prefix]
-    
-    # 위치 인자 추가
-    for arg in args:
-        key_parts.append(str(arg))
-    
-    # 키워드 인자 추가 (정렬하여 일관성 유지)
-    for k in sorted(kwargs.keys()):
-        key_parts.append(f"{k}:{kwargs[k]}")
-    
-    # 전체 문자열 해시화
-    key_str = "_".join(key_parts)
-    hash_obj = hashlib.md5(key_str.encode())
-    hash_str = hash_obj.hexdigest()
+    # 키워드 인자는 정렬하여 일관성 유지, 전체를 repr 한 번으로 문자열화
+    key_str = repr((prefix, args, tuple(sorted(kwargs.items()))))
     
-    return f"{prefix}:{hash_str}"
+    return f"{prefix}:{_hash_key(key_str)}"
 
 def cached(prefix: str, ttl: int = 21600):
     """
@@ -145,7 +298,7 @@ def cached(prefix: str, ttl: int = 21600):
             cache_key = generate_cache_key(prefix, *args, **kwargs)
             
             # 캐시 확인
-            cached_result = cache_get(cache_key)
+            cached_result = await async_cache_get(cache_key)
             if cached_result is not None:
                 logger.debug(f"캐시 적중: {cache_key}")
                 return cached_result
@@ -154,7 +307,7 @@ def cached(prefix: str, ttl: int = 21600):
             result = await func(*args, **kwargs)
             
             # 결과 캐싱
-            cache_set(cache_key, result, ttl)
+            await async_cache_set(cache_key, result, ttl)
             logger.debug(f"캐시 저장: {cache_key}")
             
             return result
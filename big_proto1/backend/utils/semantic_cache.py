@@ -0,0 +1,207 @@
+"""
+시맨틱 응답 캐시
+
+질문 단위 LLM 응답을 캐싱합니다.
+1. 정확 일치: 정규화한 질문의 SHA-256 해시를 키로 사용
+2. 유사 일치: 질문 임베딩의 코사인 유사도가 임계값 이상인 기존 응답 재사용
+"""
+
+import asyncio
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Protocol, Set, Tuple
+
+import numpy as np
+
+from backend.utils.memory_cache import MemoryCacheBackend
+from backend.utils.redis_cache import async_cache_get, async_cache_set, get_async_redis_client
+from backend.utils.logger import setup_logger
+
+logger = setup_logger("utils.semantic_cache")
+
+# 질문 → 임베딩 벡터 (실패 시 None)
+EmbedFunc = Callable[[str], Awaitable[Optional[List[float]]]]
+
+
+class CacheBackend(Protocol):
+    """캐시 저장소 인터페이스 (이벤트 루프를 막지 않도록 비동기)"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        ...
+
+
+class LocalCacheBackend:
+    """프로세스 내 메모리 캐시를 비동기 인터페이스로 감싼 캐시"""
+
+    def __init__(self, max_entries: int = 512):
+        self._cache = MemoryCacheBackend(max_entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._cache.set(key, value, ttl)
+
+
+class RedisCacheBackend:
+    """비동기 redis_cache 유틸리티를 사용하는 Redis 캐시"""
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await async_cache_get(key)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await async_cache_set(key, value, ttl)
+
+
+async def default_backend() -> CacheBackend:
+    """Redis 연결이 가능하면 Redis, 아니면 메모리 캐시 반환"""
+    if await get_async_redis_client() is not None:
+        return RedisCacheBackend()
+    return LocalCacheBackend()
+
+
+class SemanticCache:
+    """정확 일치 + 임베딩 유사도 2단계 응답 캐시"""
+
+    def __init__(
+        self,
+        prefix: str,
+        ttl: int = 3600,
+        similarity_threshold: float = 0.95,
+        max_vectors: int = 1024,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.prefix = prefix
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.max_vectors = max_vectors
+        self._backend = backend
+        # 유사 일치용 (정규화 벡터, 정확 일치 키, 만료 시각)
+        self._vectors: List[Tuple[np.ndarray, str, float]] = []
+        # 응답 경로 밖에서 진행 중인 저장 태스크 (참조를 유지해야 실행 중 가비지 컬렉션되지 않음)
+        self._pending_writes: Set[asyncio.Task] = set()
+
+    async def _get_backend(self) -> CacheBackend:
+        # Redis 연결 시도는 첫 사용 시점으로 미룸
+        if self._backend is None:
+            self._backend = await default_backend()
+        return self._backend
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        return " ".join(question.strip().lower().split())
+
+    def exact_key(self, question: str) -> str:
+        digest = hashlib.sha256(self.normalize(question).encode("utf-8")).hexdigest()
+        return f"{self.prefix}:{digest}"
+
+    async def get(
+        self, question: str, embed: Optional[EmbedFunc] = None
+    ) -> Tuple[Optional[Any], Optional[np.ndarray]]:
+        """캐시된 응답 조회 (정확 일치 → 유사 일치 순)
+
+        Returns:
+            (캐시된 응답 또는 None, 조회 중 계산한 정규화 임베딩 또는 None)
+            캐시 미스 후 set에 임베딩을 넘기면 같은 질문을 다시 임베딩하지 않습니다.
+        """
+        key = self.exact_key(question)
+        backend = await self._get_backend()
+        value = await backend.get(key)
+        if value is not None:
+            logger.debug(f"정확 일치 캐시 적중: {key}")
+            return value, None
+
+        if embed is None or not self._vectors:
+            return None, None
+
+        vector = await self._embed(embed, question)
+        if vector is None:
+            return None, None
+
+        similar_key = self._nearest_key(vector)
+        if similar_key is None:
+            return None, vector
+
+        value = await backend.get(similar_key)
+        if value is not None:
+            logger.debug(f"유사 질문 캐시 적중: {similar_key}")
+        return value, vector
+
+    async def set(
+        self,
+        question: str,
+        value: Any,
+        embed: Optional[EmbedFunc] = None,
+        vector: Optional[np.ndarray] = None,
+    ) -> None:
+        """응답 저장 (임베딩이 있으면 유사 일치 색인에도 등록)
+
+        vector가 주어지면 그대로 사용하고, 없을 때만 embed로 새로 계산합니다.
+        """
+        key = self.exact_key(question)
+        backend = await self._get_backend()
+        await backend.set(key, value, self.ttl)
+
+        if vector is None:
+            if embed is None:
+                return
+            vector = await self._embed(embed, question)
+            if vector is None:
+                return
+
+        now = time.monotonic()
+        self._vectors = [entry for entry in self._vectors if entry[1] != key and entry[2] > now]
+        self._vectors.append((vector, key, now + self.ttl))
+        if len(self._vectors) > self.max_vectors:
+            self._vectors = self._vectors[-self.max_vectors:]
+
+    def set_in_background(
+        self,
+        question: str,
+        value: Any,
+        embed: Optional[EmbedFunc] = None,
+        vector: Optional[np.ndarray] = None,
+    ) -> None:
+        """응답 저장을 백그라운드 태스크로 실행 (호출자는 임베딩/저장을 기다리지 않음)"""
+        task = asyncio.create_task(self._set_logged(question, value, embed, vector))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    async def _set_logged(self, question, value, embed, vector) -> None:
+        try:
+            await self.set(question, value, embed=embed, vector=vector)
+        except Exception as e:
+            logger.warning(f"캐시 저장 실패: {e}")
+
+    @staticmethod
+    def to_vector(raw: Optional[List[float]]) -> Optional[np.ndarray]:
+        """임베딩 결과를 유사도 비교용 단위 벡터로 변환"""
+        if not raw:
+            return None
+        vector = np.asarray(raw, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    async def _embed(self, embed: EmbedFunc, question: str) -> Optional[np.ndarray]:
+        try:
+            raw = await embed(self.normalize(question))
+        except Exception as e:
+            logger.warning(f"질문 임베딩 실패, 유사 일치 캐시 건너뜀: {e}")
+            return None
+        return self.to_vector(raw)
+
+    def _nearest_key(self, vector: np.ndarray) -> Optional[str]:
+        now = time.monotonic()
+        self._vectors = [entry for entry in self._vectors if entry[2] > now]
+        if not self._vectors:
+            return None
+
+        matrix = np.stack([entry[0] for entry in self._vectors])
+        scores = matrix @ vector
+        best = int(np.argmax(scores))
+        if scores[best] >= self.similarity_threshold:
+            return self._vectors[best][1]
+        return None
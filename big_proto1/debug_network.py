@@ -31,26 +31,30 @@ articles = [
 from collections import Counter
 import re
 
+# pyahocorasick 선택적 임포트 (기사당 한 번의 스캔으로 모든 키워드 등장 횟수 계산)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 키워드 패턴과 불용어는 모듈 로드 시 한 번만 생성
+_KW_RE = re.compile(r'[가-힣]{2,}')
+
+_STOPWORDS = frozenset({
+    '기자', '기업', '회사', '사업', '시장', '정부', '국가', '지난', '올해', '내년',
+    '이번', '당시', '현재', '관련', '통해', '위해', '대한', '국내', '해외', '전년',
+    '이날', '오늘', '어제', '내일', '이후', '이전', '동안', '과정', '결과', '상황'
+})
+
 def extract_keywords_from_articles(articles):
-    keyword_pattern = re.compile(r'[가-힣]{2,}')
-    
-    stopwords = {
-        '기자', '기업', '회사', '사업', '시장', '정부', '국가', '지난', '올해', '내년',
-        '이번', '당시', '현재', '관련', '통해', '위해', '대한', '국내', '해외', '전년',
-        '이날', '오늘', '어제', '내일', '이후', '이전', '동안', '과정', '결과', '상황'
-    }
-    
-    all_keywords = []
+    # 중간 리스트 없이 제너레이터를 Counter에 바로 누적
+    counts = Counter()
     for article in articles:
-        title = article.get("title", "")
-        content = article.get("content", "")
-        text = f"{title} {content}"
-        
-        keywords = keyword_pattern.findall(text)
-        keywords = [kw for kw in keywords if kw not in stopwords and len(kw) <= 10]
-        all_keywords.extend(keywords)
+        text = f"{article.get('title', '')} {article.get('content', '')}"
+        counts.update(kw for kw in _KW_RE.findall(text) if len(kw) <= 10 and kw not in _STOPWORDS)
     
-    keyword_counts = Counter(all_keywords).most_common(10)
+    keyword_counts = counts.most_common(10)
     
     return [
         {
@@ -61,6 +65,29 @@ def extract_keywords_from_articles(articles):
         for keyword, count in keyword_counts
     ]
 
+def count_keywords(keywords, texts):
+    """텍스트마다 각 키워드의 (겹치지 않는) 등장 횟수 목록을 반환 (str.count와 동일)"""
+    if not AHOCORASICK_AVAILABLE or not keywords:
+        return [[text.count(keyword) for keyword in keywords] for text in texts]
+    
+    automaton = ahocorasick.Automaton()
+    for idx, keyword in enumerate(keywords):
+        automaton.add_word(keyword, (idx, len(keyword)))
+    automaton.make_automaton()
+    
+    all_counts = []
+    for text in texts:
+        counts = [0] * len(keywords)
+        # 키워드별 마지막으로 센 위치 이후에 시작하는 매치만 셈 (str.count처럼 겹침 제외)
+        next_start = [0] * len(keywords)
+        for end, (idx, length) in automaton.iter(text):
+            start = end - length + 1
+            if start >= next_start[idx]:
+                counts[idx] += 1
+                next_start[idx] = end + 1
+        all_counts.append(counts)
+    return all_counts
+
 def generate_network_data(articles, keywords):
     nodes = []
     links = []
@@ -90,16 +117,15 @@ def generate_network_data(articles, keywords):
             "color": "#EF4444"
         })
     
-    # 기사-키워드 간 링크 생성
-    for article_idx, article in enumerate(articles):
-        title = article.get("title", "")
-        content = article.get("content", "")
-        text = f"{title} {content}".lower()
-        
-        for keyword_idx, keyword_data in enumerate(keywords[:5]):
-            keyword = keyword_data["keyword"]
-            if keyword in text:
-                strength = text.count(keyword) * keyword_data["weight"]
+    # 기사-키워드 간 링크 생성 (상위 5개 키워드 등장 횟수를 기사당 한 번의 스캔으로 계산)
+    top_keywords = keywords[:5]
+    texts = [f"{article.get('title', '')} {article.get('content', '')}".lower() for article in articles]
+    keyword_counts = count_keywords([keyword_data["keyword"] for keyword_data in top_keywords], texts)
+    
+    for article_idx, counts in enumerate(keyword_counts):
+        for keyword_idx, (keyword_data, count) in enumerate(zip(top_keywords, counts)):
+            if count:
+                strength = count * keyword_data["weight"]
                 links.append({
                     "source": f"keyword_{keyword_idx}",
                     "target": f"article_{article_idx}",
@@ -0,0 +1,55 @@
+"""
+Redis 캐시 직렬화 테스트
+"""
+
+import json
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트 디렉토리 찾기
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.utils import redis_cache
+from backend.utils.redis_cache import _deserialize, _serialize
+
+
+class TestCacheSerialization(unittest.TestCase):
+    """캐시 값이 표준 json과 같은 형태로 저장/복원되는지 확인하는 테스트 클래스"""
+
+    SAMPLE = {
+        "questions": ["삼성전자 전망은?", "SK하이닉스 실적은?"],
+        "scores": {1: 0.9, 2: 0.5},
+        "pair": ("AAPL", 187.5),
+        "nested": [{"id": 1, "tags": ("a", "b")}, None, True],
+        "big": 2 ** 70,
+    }
+
+    def test_round_trip_matches_json(self):
+        """직렬화 후 복원한 값은 json.dumps → json.loads 결과와 같아야 함"""
+        expected = json.loads(json.dumps(self.SAMPLE, ensure_ascii=False))
+        self.assertEqual(_deserialize(_serialize(self.SAMPLE)), expected)
+
+    def test_round_trip_without_orjson(self):
+        """orjson이 없을 때도 같은 결과"""
+        expected = json.loads(json.dumps(self.SAMPLE, ensure_ascii=False))
+        with patch.object(redis_cache, "ORJSON_AVAILABLE", False):
+            self.assertEqual(_deserialize(_serialize(self.SAMPLE)), expected)
+
+    def test_non_str_keys_become_strings(self):
+        """정수 키는 문자열 키로 복원"""
+        self.assertEqual(_deserialize(_serialize({1: "a", 2: "b"})), {"1": "a", "2": "b"})
+
+    def test_unserializable_values_fail(self):
+        """JSON으로 표현할 수 없는 값은 문자열로 바꾸지 않고 저장에 실패"""
+        for value in ({"at": datetime(2025, 1, 1)}, {("a", "b"): 1}, {"obj": object()}):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    _serialize(value)
+
+
+if __name__ == "__main__":
+    unittest.main()